@@ -8,7 +8,9 @@ Usage:
     python scripts/run_overnight.py --book maltese_falcon
     python scripts/run_overnight.py --book all --queue  # Queue all pending
     python scripts/run_overnight.py --status           # Check progress
+    python scripts/run_overnight.py --plan             # Tonight's plan (JSON)
     python scripts/run_overnight.py --resume           # Resume interrupted jobs
+    python scripts/run_overnight.py --run --metrics-port 9108  # Expose metrics
 
 Designed for RTX 5080 with 16GB VRAM.
 """
@@ -20,6 +22,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -27,6 +30,7 @@ sys.path.insert(0, str(project_root))
 
 from src.automation.gpu_orchestrator import GPUOrchestrator, TaskPriority
 from src.automation.batch_processor import BatchProcessor, BatchJob, BatchStatus
+from src.automation.metrics import MetricsServer
 
 # Configure logging
 logging.basicConfig(
@@ -106,6 +110,16 @@ def show_queue_status() -> None:
     print(f"\nEstimated completion: {estimate['estimated_completion']}")
     print(f"Time remaining: ~{estimate['total_estimated_minutes']:.0f} minutes")
 
+    # Show tonight's plan
+    plan, planned_finish = processor.plan_overnight()
+    if plan.windows:
+        start, end = plan.windows[0]
+        print("\nOVERNIGHT PLAN")
+        print("-" * 30)
+        print(f"Window:   {start:%a %H:%M} - {end:%a %H:%M} ({plan.capacity_minutes:.0f} GPU minutes)")
+        print(f"Tonight:  {len(plan.tonight)} tasks, {plan.planned_minutes:.0f} minutes ({plan.utilization:.0%} full)")
+        print(f"Deferred: {len(plan.deferred)} tasks")
+
     # Show batch jobs
     jobs = processor.list_jobs()
     if jobs:
@@ -113,6 +127,30 @@ def show_queue_status() -> None:
         print("-" * 30)
         for job in jobs:
             print(f"  {job['title']}: {job['status']} ({job['chapters']} chapters)")
+            if job["job_id"] not in planned_finish:
+                continue
+            finish = planned_finish[job["job_id"]]
+            print(f"    Planned finish: {format_finish(finish)}")
+
+
+def format_finish(finish: Optional[datetime]) -> str:
+    """Planned finish time, or why there is none."""
+    if finish is None:
+        return "not planned (beyond planning horizon)"
+    return finish.strftime("%a %Y-%m-%d %H:%M")
+
+
+def show_plan() -> None:
+    """Print the overnight plan as JSON."""
+    processor = BatchProcessor(data_dir=project_root / "batch_jobs")
+    plan, planned_finish = processor.plan_overnight()
+    print(json.dumps({
+        **plan.to_dict(),
+        "jobs": {
+            job_id: finish.isoformat() if finish else None
+            for job_id, finish in planned_finish.items()
+        },
+    }, indent=2))
 
 
 def queue_book(book_id: str) -> None:
@@ -189,7 +227,17 @@ def queue_all() -> None:
         queue_book(book_id)
 
 
-async def run_overnight() -> None:
+def start_metrics_server(processor: BatchProcessor, port: Optional[int]) -> Optional[MetricsServer]:
+    """Serve the processor's metrics on localhost if a port was given."""
+    if port is None:
+        return None
+    server = MetricsServer(processor.orchestrator.metrics, port=port)
+    server.start()
+    print(f"Metrics: http://127.0.0.1:{server.port}/metrics")
+    return server
+
+
+async def run_overnight(metrics_port: Optional[int] = None) -> None:
     """Run overnight production on all queued jobs."""
     processor = BatchProcessor(data_dir=project_root / "batch_jobs")
 
@@ -200,29 +248,38 @@ async def run_overnight() -> None:
         print("No pending jobs to run.")
         return
 
-    print(f"\nStarting overnight production of {len(pending_jobs)} jobs...")
-    print("=" * 50)
+    metrics_server = start_metrics_server(processor, metrics_port)
+    try:
+        print(f"\nStarting overnight production of {len(pending_jobs)} jobs...")
+        print("=" * 50)
 
-    for job in pending_jobs:
-        print(f"\nProcessing: {job.title}")
-        print("-" * 30)
+        _, planned_finish = processor.plan_overnight()
+        for job in pending_jobs:
+            print(f"  {job.title}: planned finish {format_finish(planned_finish.get(job.job_id))}")
 
-        success = await processor.run_job(job)
+        for job in pending_jobs:
+            print(f"\nProcessing: {job.title}")
+            print("-" * 30)
 
-        if success:
-            print(f"COMPLETED: {job.title}")
-            print(f"  Duration: {job.total_duration_seconds/3600:.1f} hours")
-            print(f"  Output: {job.output_dir}")
-        else:
-            print(f"FAILED: {job.title}")
-            print(f"  Error: {job.error_message}")
+            success = await processor.run_job(job)
 
-    print("\n" + "=" * 50)
-    print("OVERNIGHT PRODUCTION COMPLETE")
-    print("=" * 50)
+            if success:
+                print(f"COMPLETED: {job.title}")
+                print(f"  Duration: {job.total_duration_seconds/3600:.1f} hours")
+                print(f"  Output: {job.output_dir}")
+            else:
+                print(f"FAILED: {job.title}")
+                print(f"  Error: {job.error_message}")
+
+        print("\n" + "=" * 50)
+        print("OVERNIGHT PRODUCTION COMPLETE")
+        print("=" * 50)
+    finally:
+        if metrics_server:
+            metrics_server.stop()
 
 
-async def resume_jobs() -> None:
+async def resume_jobs(metrics_port: Optional[int] = None) -> None:
     """Resume any interrupted jobs."""
     processor = BatchProcessor(data_dir=project_root / "batch_jobs")
 
@@ -236,12 +293,17 @@ async def resume_jobs() -> None:
         print("No incomplete jobs to resume.")
         return
 
-    print(f"\nResuming {len(incomplete_jobs)} incomplete jobs...")
+    metrics_server = start_metrics_server(processor, metrics_port)
+    try:
+        print(f"\nResuming {len(incomplete_jobs)} incomplete jobs...")
 
-    for job in incomplete_jobs:
-        print(f"\nResuming: {job.title} (was {job.status.value})")
-        success = await processor.run_job(job)
-        print(f"Result: {'SUCCESS' if success else 'FAILED'}")
+        for job in incomplete_jobs:
+            print(f"\nResuming: {job.title} (was {job.status.value})")
+            success = await processor.run_job(job)
+            print(f"Result: {'SUCCESS' if success else 'FAILED'}")
+    finally:
+        if metrics_server:
+            metrics_server.stop()
 
 
 def main() -> None:
@@ -255,6 +317,7 @@ Examples:
   python scripts/run_overnight.py --book all             # Queue all books
   python scripts/run_overnight.py --run                  # Run queued jobs
   python scripts/run_overnight.py --status               # Check status
+  python scripts/run_overnight.py --plan                 # Tonight's plan
   python scripts/run_overnight.py --resume               # Resume interrupted
         """,
     )
@@ -273,6 +336,11 @@ Examples:
         action="store_true",
         help="Show current GPU and queue status",
     )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the overnight plan (tonight's tasks, deferred work, per-job finish) as JSON",
+    )
     parser.add_argument(
         "--resume",
         action="store_true",
@@ -283,6 +351,11 @@ Examples:
         action="store_true",
         help="Show GPU status only",
     )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus-style metrics on this localhost port during --run/--resume",
+    )
 
     args = parser.parse_args()
 
@@ -293,15 +366,17 @@ Examples:
         show_gpu_status()
     elif args.status:
         show_queue_status()
+    elif args.plan:
+        show_plan()
     elif args.book:
         if args.book == "all":
             queue_all()
         else:
             queue_book(args.book)
     elif args.run:
-        asyncio.run(run_overnight())
+        asyncio.run(run_overnight(args.metrics_port))
     elif args.resume:
-        asyncio.run(resume_jobs())
+        asyncio.run(resume_jobs(args.metrics_port))
     else:
         parser.print_help()
         print("\nQuick start:")
@@ -10,10 +10,32 @@ from .revenue_tracker import (
     RevenueReport,
     Platform,
     TimeFrame,
+    ConcentrationSummary,
+)
+from .anomaly_detector import (
+    AnomalyDetector,
+    AnomalyFlag,
+)
+from .profitability import (
+    ProfitabilityEngine,
+    TitleProfitability,
+)
+from .reconciliation import (
+    StatementReconciler,
+    StatementLine,
+    ReconciliationReport,
+    load_payout_statement,
 )
 from .analytics_dashboard import (
     AnalyticsDashboard,
     DashboardConfig,
+    PortfolioContext,
+    ReportRenderer,
+)
+from .export_pipeline import (
+    ExportPipeline,
+    atomic_write_text,
+    safe_filename,
 )
 
 __all__ = [
@@ -22,6 +44,20 @@ __all__ = [
     "RevenueReport",
     "Platform",
     "TimeFrame",
+    "ConcentrationSummary",
+    "AnomalyDetector",
+    "AnomalyFlag",
+    "ProfitabilityEngine",
+    "TitleProfitability",
+    "StatementReconciler",
+    "StatementLine",
+    "ReconciliationReport",
+    "load_payout_statement",
     "AnalyticsDashboard",
     "DashboardConfig",
+    "PortfolioContext",
+    "ReportRenderer",
+    "ExportPipeline",
+    "atomic_write_text",
+    "safe_filename",
 ]
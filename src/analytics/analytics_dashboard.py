@@ -19,7 +19,10 @@ from .revenue_tracker import (
     RevenueReport,
     Platform,
     TimeFrame,
+    report_concentration,
 )
+from .anomaly_detector import AnomalyFlag
+from .profitability import ProfitabilityEngine
 
 logger = logging.getLogger(__name__)
 
@@ -33,167 +36,57 @@ class DashboardConfig:
     growth_rate: Decimal = Decimal("0.10")
     currency_symbol: str = "$"
     show_goals: bool = True
+    top_k: int = 10
+    anomaly_window_days: int = 14
 
 
-class AnalyticsDashboard:
+@dataclass
+class PortfolioContext:
     """
-    Generate analytics dashboards and reports.
+    Portfolio-wide report sections, computed once per export.
 
-    Features:
-    - CLI summary display
-    - Markdown report generation
-    - HTML dashboard export
-    - Goal tracking visualization
+    Plain data, so it can be shipped to export worker processes along
+    with the per-variant reports instead of each worker reloading the
+    tracker.
     """
+    portfolio: Dict[str, Any]
+    anomalies: List[AnomalyFlag]
+    goals: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    projection: Optional[Dict[str, Any]] = None
 
-    def __init__(
-        self,
-        tracker: RevenueTracker,
-        config: Optional[DashboardConfig] = None,
-    ) -> None:
-        """
-        Initialize dashboard generator.
-
-        Args:
-            tracker: RevenueTracker instance
-            config: Dashboard configuration
-        """
-        self.tracker = tracker
-        self.config = config or DashboardConfig()
-        self.config.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def print_summary(self) -> None:
-        """Print quick summary to CLI."""
-        stats = self.tracker.get_summary_stats()
-        cs = self.config.currency_symbol
-
-        print("\n" + "=" * 60)
-        print("  PUBLIC DOMAIN MONETIZATION - REVENUE DASHBOARD")
-        print("=" * 60)
-
-        if stats["total_records"] == 0:
-            print("\n  No sales data yet. Start by adding sales records.")
-            print("=" * 60 + "\n")
-            return
-
-        print(f"\n  LIFETIME STATS")
-        print(f"  ├─ Total Sales: {stats['lifetime_units']} units")
-        print(f"  ├─ Gross Revenue: {cs}{stats['lifetime_gross']}")
-        print(f"  └─ Net Revenue: {cs}{stats['lifetime_net']}")
-
-        print(f"\n  THIS MONTH")
-        print(f"  ├─ Units Sold: {stats['this_month_units']}")
-        print(f"  └─ Net Revenue: {cs}{stats['this_month_net']}")
-
-        print(f"\n  TOP PERFORMERS")
-        print(f"  ├─ Platform: {stats['top_platform']}")
-        print(f"  └─ Book: {stats['top_book']}")
-
-        # Show goals if configured
-        if self.config.show_goals and self.tracker.revenue_goals:
-            print(f"\n  GOALS")
-            for goal_id in self.tracker.revenue_goals:
-                progress = self.tracker.check_goal_progress(goal_id)
-                status = "ON TRACK" if progress.get("on_track") else "BEHIND"
-                print(f"  ├─ {goal_id}: {progress['progress_percent']}% ({status})")
-                print(f"  │  └─ {cs}{progress['current']} / {cs}{progress['target']}")
 
-        print("\n" + "=" * 60 + "\n")
+class ReportRenderer:
+    """Renders markdown and HTML documents from precomputed report data."""
 
-    def print_monthly_report(
-        self,
-        year: Optional[int] = None,
-        month: Optional[int] = None,
-    ) -> None:
+    def __init__(self, config: DashboardConfig) -> None:
         """
-        Print detailed monthly report to CLI.
+        Initialize renderer.
 
         Args:
-            year: Report year (default: current)
-            month: Report month (default: current)
+            config: Dashboard configuration
         """
-        today = date.today()
-        year = year or today.year
-        month = month or today.month
-
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = date(year, month + 1, 1) - timedelta(days=1)
+        self.config = config
 
-        report = self.tracker.generate_report(start_date, min(end_date, today))
-        cs = self.config.currency_symbol
-
-        print("\n" + "=" * 60)
-        print(f"  MONTHLY REPORT - {start_date.strftime('%B %Y')}")
-        print("=" * 60)
-
-        print(f"\n  SUMMARY")
-        print(f"  ├─ Period: {report.start_date} to {report.end_date}")
-        print(f"  ├─ Total Units: {report.total_units}")
-        print(f"  ├─ Gross Revenue: {cs}{report.total_gross_revenue}")
-        print(f"  └─ Net Revenue: {cs}{report.total_net_revenue}")
-
-        if report.revenue_by_platform:
-            print(f"\n  BY PLATFORM")
-            for platform, revenue in sorted(
-                report.revenue_by_platform.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            ):
-                units = report.units_by_platform.get(platform, 0)
-                print(f"  ├─ {platform}: {units} units = {cs}{revenue}")
-
-        if report.revenue_by_book:
-            print(f"\n  BY BOOK")
-            for book_id, revenue in sorted(
-                report.revenue_by_book.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            ):
-                units = report.units_by_book.get(book_id, 0)
-                print(f"  ├─ {book_id}: {units} units = {cs}{revenue}")
-
-        if report.units_by_territory:
-            print(f"\n  BY TERRITORY")
-            for territory, units in sorted(
-                report.units_by_territory.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:5]:  # Top 5 territories
-                print(f"  ├─ {territory}: {units} units")
-
-        print("\n" + "=" * 60 + "\n")
-
-    def generate_markdown_report(
+    def render_markdown(
         self,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-        output_name: Optional[str] = None,
-    ) -> Path:
+        report: RevenueReport,
+        stats: Dict[str, Any],
+        context: PortfolioContext,
+    ) -> str:
         """
-        Generate markdown report file.
+        Render markdown report content.
 
         Args:
-            start_date: Report start date
-            end_date: Report end date
-            output_name: Output filename (without extension)
+            report: Report to render
+            stats: Summary stats from RevenueTracker.get_summary_stats()
+            context: Portfolio-wide sections (AnalyticsDashboard.portfolio_context())
 
         Returns:
-            Path to generated report
+            Markdown document
         """
-        today = date.today()
-        end_date = end_date or today
-        start_date = start_date or today.replace(day=1)
-
-        report = self.tracker.generate_report(start_date, end_date)
-        stats = self.tracker.get_summary_stats()
+        concentration = report_concentration(report, k=self.config.top_k)
         cs = self.config.currency_symbol
 
-        output_name = output_name or f"revenue_report_{today.isoformat()}"
-        output_path = self.config.output_dir / f"{output_name}.md"
-
         lines = [
             f"# Revenue Report",
             f"",
@@ -239,17 +132,82 @@ class AnalyticsDashboard:
             f"|------|-------|---------|-----------|",
         ])
 
-        for book_id, revenue in sorted(
-            report.revenue_by_book.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        ):
+        books = concentration["book"]
+        for book_id, revenue in books.top:
             units = report.units_by_book.get(book_id, 0)
             avg_price = (revenue / units).quantize(Decimal("0.01")) if units > 0 else Decimal("0")
             lines.append(f"| {book_id} | {units} | {cs}{revenue} | {cs}{avg_price} |")
+        if books.tail_count:
+            lines.append(f"| *{books.tail_count} other titles* | - | {cs}{books.tail_total} | - |")
+
+        if report.revenue_by_book:
+            lines.extend([
+                f"",
+                f"---",
+                f"",
+                f"## Revenue Concentration",
+                f"",
+                f"| Dimension | Top {self.config.top_k} Share | Top 20% Share | HHI | Long Tail |",
+                f"|-----------|-------------|---------------|-----|-----------|",
+            ])
+
+            for dimension, summary in concentration.items():
+                top_share = (
+                    (summary.top_total / summary.total * 100).quantize(Decimal("0.1"))
+                    if summary.total > 0 else Decimal("0")
+                )
+                lines.append(
+                    f"| {dimension} | {top_share}% | {summary.pareto_share}% | "
+                    f"{summary.hhi} | {summary.tail_count} entries |"
+                )
+
+        # Add title profitability (ROI / payback)
+        portfolio = context.portfolio
+        if portfolio["titles"]:
+            portfolio_roi = portfolio["portfolio_roi_percent"]
+            lines.extend([
+                f"",
+                f"---",
+                f"",
+                f"## Title Profitability",
+                f"",
+                f"**Titles Paid Back:** {portfolio['paid_back']} / {portfolio['titles']}",
+                f"**Production Cost:** {cs}{portfolio['total_cost']} | "
+                f"**Lifetime Net:** {cs}{portfolio['total_net']} | "
+                f"**Portfolio ROI:** {f'{portfolio_roi}%' if portfolio_roi else 'n/a'}",
+                f"",
+                f"| Book | Cost | Net | ROI | Payback Date | Days to Breakeven |",
+                f"|------|------|-----|-----|--------------|-------------------|",
+            ])
+
+            for title in portfolio["best"]:
+                lines.append(
+                    f"| {title.book_id} | {cs}{title.production_cost} | "
+                    f"{cs}{title.cumulative_net} | {title.roi_percent}% | "
+                    f"{title.payback_date or '-'} | {title.days_to_breakeven if title.days_to_breakeven is not None else '-'} |"
+                )
+
+        # Add anomaly flags
+        anomalies = context.anomalies
+        if anomalies:
+            lines.extend([
+                f"",
+                f"---",
+                f"",
+                f"## Revenue Anomalies (last {self.config.anomaly_window_days} days)",
+                f"",
+                f"| Day | Type | Series | Actual | Expected | Robust z |",
+                f"|-----|------|--------|--------|----------|----------|",
+            ])
+
+            for flag in anomalies:
+                lines.append(
+                    f"| {flag.day} | {flag.kind} | {flag.series_type}: {flag.series_key} | "
+                    f"{cs}{flag.value} | {cs}{flag.expected} | {flag.robust_z:.1f} |"
+                )
 
         # Add goals section if applicable
-        if self.config.show_goals and self.tracker.revenue_goals:
+        if context.goals:
             lines.extend([
                 f"",
                 f"---",
@@ -260,8 +218,7 @@ class AnalyticsDashboard:
                 f"|------|------|--------|---------|----------|",
             ])
 
-            for goal_id in self.tracker.revenue_goals:
-                progress = self.tracker.check_goal_progress(goal_id)
+            for goal_id, progress in context.goals.items():
                 status = "ON TRACK" if progress.get("on_track") else "BEHIND"
                 lines.append(
                     f"| {goal_id} | {progress['goal_type']} | "
@@ -270,11 +227,8 @@ class AnalyticsDashboard:
                 )
 
         # Add projections if configured
-        if self.config.include_projections:
-            projection = self.tracker.get_projection(
-                months_ahead=self.config.projection_months,
-                growth_rate=self.config.growth_rate,
-            )
+        if context.projection is not None:
+            projection = context.projection
 
             lines.extend([
                 f"",
@@ -307,12 +261,8 @@ class AnalyticsDashboard:
                 f"|-----------|-------|",
             ])
 
-            for territory, units in sorted(
-                report.units_by_territory.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:10]:
-                lines.append(f"| {territory} | {units} |")
+            for territory, territory_units in concentration["territory"].top:
+                lines.append(f"| {territory} | {territory_units} |")
 
         lines.extend([
             f"",
@@ -321,34 +271,54 @@ class AnalyticsDashboard:
             f"*Report generated by Public Domain Monetization Analytics System*",
         ])
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        return "\n".join(lines)
 
-        logger.info(f"Generated markdown report: {output_path}")
-        return output_path
-
-    def generate_html_dashboard(
+    def render_html(
         self,
-        output_name: Optional[str] = None,
-    ) -> Path:
+        report: RevenueReport,
+        stats: Dict[str, Any],
+        context: PortfolioContext,
+    ) -> str:
         """
-        Generate HTML dashboard.
+        Render HTML dashboard content.
 
         Args:
-            output_name: Output filename (without extension)
+            report: Report to render
+            stats: Summary stats from RevenueTracker.get_summary_stats()
+            context: Portfolio-wide sections (AnalyticsDashboard.portfolio_context())
 
         Returns:
-            Path to generated dashboard
+            HTML document
         """
-        today = date.today()
-        start_of_month = today.replace(day=1)
-
-        report = self.tracker.generate_report(start_of_month, today)
-        stats = self.tracker.get_summary_stats()
+        books = report_concentration(report, k=self.config.top_k)["book"]
+        portfolio = context.portfolio
+        anomalies = context.anomalies
         cs = self.config.currency_symbol
 
-        output_name = output_name or f"dashboard_{today.isoformat()}"
-        output_path = self.config.output_dir / f"{output_name}.html"
+        anomaly_rows = "".join(f'''
+                    <tr>
+                        <td>{a.day}</td>
+                        <td class="{'positive' if a.kind == 'spike' else 'negative'}">{a.kind}</td>
+                        <td>{a.series_type}: {a.series_key}</td>
+                        <td>{cs}{a.value}</td>
+                        <td>{cs}{a.expected}</td>
+                    </tr>''' for a in anomalies)
+        anomaly_section = f'''<section class="table-card">
+            <h3>Revenue Anomalies (last {self.config.anomaly_window_days} days)</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Day</th>
+                        <th>Type</th>
+                        <th>Series</th>
+                        <th>Actual</th>
+                        <th>Expected</th>
+                    </tr>
+                </thead>
+                <tbody>{anomaly_rows}
+                </tbody>
+            </table>
+        </section>''' if anomalies else ""
 
         # Generate platform chart data
         platform_data = json.dumps([
@@ -356,10 +326,10 @@ class AnalyticsDashboard:
             for p, r in report.revenue_by_platform.items()
         ])
 
-        # Generate book chart data
+        # Generate book chart data (top-K by revenue)
         book_data = json.dumps([
             {"book": b[:20], "revenue": float(r)}
-            for b, r in list(report.revenue_by_book.items())[:10]
+            for b, r in books.top
         ])
 
         # Generate daily trend data
@@ -500,7 +470,7 @@ class AnalyticsDashboard:
     <div class="container">
         <header>
             <h1>Revenue Dashboard</h1>
-            <p>Public Domain Monetization - {today.strftime('%B %Y')}</p>
+            <p>Public Domain Monetization - {report.end_date.strftime('%B %Y')}</p>
         </header>
 
         <section class="metrics">
@@ -560,11 +530,49 @@ class AnalyticsDashboard:
                         <td>{cs}{revenue}</td>
                         <td>{(revenue / (report.total_net_revenue or Decimal("1")) * 100).quantize(Decimal("0.1"))}%</td>
                     </tr>
-                    ''' for book_id, revenue in sorted(report.revenue_by_book.items(), key=lambda x: x[1], reverse=True))}
+                    ''' for book_id, revenue in books.top)}
+                    {f'''
+                    <tr>
+                        <td>{books.tail_count} other titles</td>
+                        <td>-</td>
+                        <td>{cs}{books.tail_total}</td>
+                        <td>{(books.tail_total / (report.total_net_revenue or Decimal("1")) * 100).quantize(Decimal("0.1"))}%</td>
+                    </tr>
+                    ''' if books.tail_count else ''}
                 </tbody>
             </table>
         </section>
 
+        <section class="table-card">
+            <h3>Title Profitability ({portfolio['paid_back']} / {portfolio['titles']} paid back)</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Book</th>
+                        <th>Cost</th>
+                        <th>Net</th>
+                        <th>ROI</th>
+                        <th>Payback Date</th>
+                        <th>Days to Breakeven</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {''.join(f'''
+                    <tr>
+                        <td>{t.book_id}</td>
+                        <td>{cs}{t.production_cost}</td>
+                        <td>{cs}{t.cumulative_net}</td>
+                        <td class="{'positive' if t.profit >= 0 else 'negative'}">{t.roi_percent}%</td>
+                        <td>{t.payback_date or '-'}</td>
+                        <td>{t.days_to_breakeven if t.days_to_breakeven is not None else '-'}</td>
+                    </tr>
+                    ''' for t in portfolio["best"])}
+                </tbody>
+            </table>
+        </section>
+
+        {anomaly_section}
+
         <footer>
             <p>Generated {datetime.now().strftime('%Y-%m-%d %H:%M')} | Public Domain Monetization Analytics</p>
         </footer>
@@ -631,26 +639,270 @@ class AnalyticsDashboard:
 </body>
 </html>"""
 
+        return html
+
+
+class AnalyticsDashboard:
+    """
+    Generate analytics dashboards and reports.
+
+    Features:
+    - CLI summary display
+    - Markdown report generation
+    - HTML dashboard export
+    - Goal tracking visualization
+    """
+
+    def __init__(
+        self,
+        tracker: RevenueTracker,
+        config: Optional[DashboardConfig] = None,
+    ) -> None:
+        """
+        Initialize dashboard generator.
+
+        Args:
+            tracker: RevenueTracker instance
+            config: Dashboard configuration
+        """
+        self.tracker = tracker
+        self.profitability = ProfitabilityEngine(tracker)
+        self.config = config or DashboardConfig()
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        self.renderer = ReportRenderer(self.config)
+
+    def print_summary(self) -> None:
+        """Print quick summary to CLI."""
+        stats = self.tracker.get_summary_stats()
+        cs = self.config.currency_symbol
+
+        print("\n" + "=" * 60)
+        print("  PUBLIC DOMAIN MONETIZATION - REVENUE DASHBOARD")
+        print("=" * 60)
+
+        if stats["total_records"] == 0:
+            print("\n  No sales data yet. Start by adding sales records.")
+            print("=" * 60 + "\n")
+            return
+
+        print(f"\n  LIFETIME STATS")
+        print(f"  ├─ Total Sales: {stats['lifetime_units']} units")
+        print(f"  ├─ Gross Revenue: {cs}{stats['lifetime_gross']}")
+        print(f"  └─ Net Revenue: {cs}{stats['lifetime_net']}")
+
+        print(f"\n  THIS MONTH")
+        print(f"  ├─ Units Sold: {stats['this_month_units']}")
+        print(f"  └─ Net Revenue: {cs}{stats['this_month_net']}")
+
+        print(f"\n  TOP PERFORMERS")
+        print(f"  ├─ Platform: {stats['top_platform']}")
+        print(f"  └─ Book: {stats['top_book']}")
+
+        anomalies = self._recent_anomalies()
+        if anomalies:
+            print(f"\n  ANOMALIES (last {self.config.anomaly_window_days} days)")
+            for flag in anomalies[:5]:
+                print(
+                    f"  ├─ {flag.day} {flag.kind.upper()} {flag.series_type} {flag.series_key}: "
+                    f"{cs}{flag.value} vs {cs}{flag.expected} expected"
+                )
+
+        # Show goals if configured
+        if self.config.show_goals and self.tracker.revenue_goals:
+            print(f"\n  GOALS")
+            for goal_id in self.tracker.revenue_goals:
+                progress = self.tracker.check_goal_progress(goal_id)
+                status = "ON TRACK" if progress.get("on_track") else "BEHIND"
+                print(f"  ├─ {goal_id}: {progress['progress_percent']}% ({status})")
+                print(f"  │  └─ {cs}{progress['current']} / {cs}{progress['target']}")
+
+        print("\n" + "=" * 60 + "\n")
+
+    def _recent_anomalies(self) -> List[Any]:
+        """Anomaly flags within the configured window, newest first."""
+        since = date.today() - timedelta(days=self.config.anomaly_window_days)
+        return self.tracker.anomaly_detector.recent_flags(since=since)
+
+    def portfolio_context(self) -> PortfolioContext:
+        """Compute the sections that do not depend on the report period."""
+        goals = {}
+        if self.config.show_goals:
+            goals = {
+                goal_id: self.tracker.check_goal_progress(goal_id)
+                for goal_id in self.tracker.revenue_goals
+            }
+        projection = None
+        if self.config.include_projections:
+            projection = self.tracker.get_projection(
+                months_ahead=self.config.projection_months,
+                growth_rate=self.config.growth_rate,
+            )
+        return PortfolioContext(
+            portfolio=self.profitability.portfolio_summary(k=self.config.top_k),
+            anomalies=self._recent_anomalies(),
+            goals=goals,
+            projection=projection,
+        )
+
+    def print_monthly_report(
+        self,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+    ) -> None:
+        """
+        Print detailed monthly report to CLI.
+
+        Args:
+            year: Report year (default: current)
+            month: Report month (default: current)
+        """
+        today = date.today()
+        year = year or today.year
+        month = month or today.month
+
+        start_date = date(year, month, 1)
+        if month == 12:
+            end_date = date(year + 1, 1, 1) - timedelta(days=1)
+        else:
+            end_date = date(year, month + 1, 1) - timedelta(days=1)
+
+        report = self.tracker.generate_report(start_date, min(end_date, today))
+        cs = self.config.currency_symbol
+
+        print("\n" + "=" * 60)
+        print(f"  MONTHLY REPORT - {start_date.strftime('%B %Y')}")
+        print("=" * 60)
+
+        print(f"\n  SUMMARY")
+        print(f"  ├─ Period: {report.start_date} to {report.end_date}")
+        print(f"  ├─ Total Units: {report.total_units}")
+        print(f"  ├─ Gross Revenue: {cs}{report.total_gross_revenue}")
+        print(f"  └─ Net Revenue: {cs}{report.total_net_revenue}")
+
+        if report.revenue_by_platform:
+            print(f"\n  BY PLATFORM")
+            for platform, revenue in sorted(
+                report.revenue_by_platform.items(),
+                key=lambda x: x[1],
+                reverse=True,
+            ):
+                units = report.units_by_platform.get(platform, 0)
+                print(f"  ├─ {platform}: {units} units = {cs}{revenue}")
+
+        concentration = self.tracker.get_concentration(report, k=self.config.top_k)
+
+        if report.revenue_by_book:
+            books = concentration["book"]
+            print(f"\n  BY BOOK (top {len(books.top)})")
+            for book_id, revenue in books.top:
+                units = report.units_by_book.get(book_id, 0)
+                print(f"  ├─ {book_id}: {units} units = {cs}{revenue}")
+            if books.tail_count:
+                print(f"  ├─ {books.tail_count} others: {cs}{books.tail_total}")
+            print(f"  └─ Top 20% share: {books.pareto_share}% | HHI: {books.hhi}")
+
+        if report.units_by_territory:
+            print(f"\n  BY TERRITORY")
+            for territory, territory_units in concentration["territory"].top[:5]:  # Top 5 territories
+                print(f"  ├─ {territory}: {territory_units} units")
+
+        print("\n" + "=" * 60 + "\n")
+
+    def generate_markdown_report(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        output_name: Optional[str] = None,
+    ) -> Path:
+        """
+        Generate markdown report file.
+
+        Args:
+            start_date: Report start date
+            end_date: Report end date
+            output_name: Output filename (without extension)
+
+        Returns:
+            Path to generated report
+        """
+        today = date.today()
+        end_date = end_date or today
+        start_date = start_date or today.replace(day=1)
+
+        report = self.tracker.generate_report(start_date, end_date)
+        stats = self.tracker.get_summary_stats()
+
+        output_name = output_name or f"revenue_report_{today.isoformat()}"
+        output_path = self.config.output_dir / f"{output_name}.md"
+
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.write(self.render_markdown(report, stats))
+
+        logger.info(f"Generated markdown report: {output_path}")
+        return output_path
+
+    def render_markdown(
+        self,
+        report: RevenueReport,
+        stats: Dict[str, Any],
+        context: Optional[PortfolioContext] = None,
+    ) -> str:
+        """Render markdown report content (see ReportRenderer.render_markdown)."""
+        return self.renderer.render_markdown(report, stats, context or self.portfolio_context())
+
+    def generate_html_dashboard(
+        self,
+        output_name: Optional[str] = None,
+    ) -> Path:
+        """
+        Generate HTML dashboard.
+
+        Args:
+            output_name: Output filename (without extension)
+
+        Returns:
+            Path to generated dashboard
+        """
+        today = date.today()
+        start_of_month = today.replace(day=1)
+
+        report = self.tracker.generate_report(start_of_month, today)
+        stats = self.tracker.get_summary_stats()
+
+        output_name = output_name or f"dashboard_{today.isoformat()}"
+        output_path = self.config.output_dir / f"{output_name}.html"
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(self.render_html(report, stats))
 
         logger.info(f"Generated HTML dashboard: {output_path}")
         return output_path
 
+    def render_html(
+        self,
+        report: RevenueReport,
+        stats: Dict[str, Any],
+        context: Optional[PortfolioContext] = None,
+    ) -> str:
+        """Render HTML dashboard content (see ReportRenderer.render_html)."""
+        return self.renderer.render_html(report, stats, context or self.portfolio_context())
+
     def export_all(self) -> Dict[str, Path]:
         """
         Export all dashboard formats.
 
+        The report is computed once and markdown, HTML, CSV and JSON are
+        rendered concurrently (see ExportPipeline).
+
         Returns:
             Dictionary of format -> path
         """
+        from .export_pipeline import ExportPipeline
+
         today = date.today()
         name = f"analytics_{today.isoformat()}"
 
-        return {
-            "markdown": self.generate_markdown_report(output_name=name),
-            "html": self.generate_html_dashboard(output_name=name),
-        }
+        return ExportPipeline(self).export(output_name=name)
 
 
 def main() -> None:
@@ -0,0 +1,373 @@
+"""
+Streaming Revenue Anomaly Detection
+
+Keeps exponentially weighted statistics of the daily net revenue series
+per book and per platform, updated in O(1) as sales arrive, and flags
+spikes and drops (refund waves, platform reporting glitches) without
+rescanning history. Sales that arrive for an already-closed day (a
+backfilled import) are applied as an O(1) correction of that day's
+contribution to the statistics, and only that day is re-scored.
+"""
+
+import math
+import logging
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Optional, List, Dict, Any, Deque, Set, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Series key: (series_type, key), e.g. ("book", "maltese_falcon_2026")
+SeriesKey = tuple[str, str]
+
+# Mean absolute deviation -> standard deviation for normal data
+MAD_TO_SIGMA = 1.2533
+
+
+@dataclass
+class RollingStats:
+    """EWMA mean, variance and mean absolute deviation of a series."""
+    alpha: float
+    mean: float = 0.0
+    var: float = 0.0
+    abs_dev: float = 0.0
+    count: int = 0
+
+    def update(self, x: float) -> None:
+        """Fold one observation into the statistics."""
+        if self.count == 0:
+            self.mean = x
+        else:
+            diff = x - self.mean
+            incr = self.alpha * diff
+            self.mean += incr
+            self.var = (1 - self.alpha) * (self.var + diff * incr)
+            self.abs_dev = (1 - self.alpha) * self.abs_dev + self.alpha * abs(diff)
+        self.count += 1
+
+    def scores(self, x: float, min_scale: float) -> tuple[float, float]:
+        """
+        Score an observation against the current statistics.
+
+        Returns:
+            Tuple of (z_score, robust_z_score)
+        """
+        diff = x - self.mean
+        z = diff / max(math.sqrt(self.var), min_scale)
+        robust_z = diff / max(MAD_TO_SIGMA * self.abs_dev, min_scale)
+        return z, robust_z
+
+
+@dataclass
+class AnomalyFlag:
+    """A detected spike or drop in a daily revenue series."""
+    series_type: str
+    series_key: str
+    day: date
+    kind: str  # spike, drop
+    value: Decimal
+    expected: Decimal
+    z_score: float
+    robust_z: float
+    detected_at: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "series_type": self.series_type,
+            "series_key": self.series_key,
+            "day": self.day.isoformat(),
+            "kind": self.kind,
+            "value": str(self.value),
+            "expected": str(self.expected),
+            "z_score": round(self.z_score, 2),
+            "robust_z": round(self.robust_z, 2),
+            "detected_at": self.detected_at.isoformat(),
+        }
+
+
+@dataclass
+class _ClosedDay:
+    """A closed day's total and the baseline it was scored and folded against."""
+    total: Decimal
+    index: int  # Position of the day among the updates of its series
+    baseline: RollingStats
+
+
+@dataclass
+class _SeriesState:
+    """Open-day accumulator plus rolling statistics for one series."""
+    stats: RollingStats
+    open_day: Optional[date] = None
+    open_total: Decimal = Decimal("0")
+    flagged: Set[str] = field(default_factory=set)
+    days: Dict[date, _ClosedDay] = field(default_factory=dict)  # Retained closed days
+
+
+class AnomalyDetector:
+    """
+    Streaming anomaly detector for daily revenue series.
+
+    Features:
+    - O(1) update per sale (no history rescans)
+    - EWMA mean/variance plus robust (MAD-based) z-scores
+    - Intraday spike and refund-wave detection on the open day
+    - Drop detection when a day closes, including days with no sales
+    - Late data for a closed day corrects it in O(1) (no alert logged)
+    - Silent rebuild from history (flags kept, no alerts logged)
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        threshold: float = 3.5,
+        min_observations: int = 7,
+        min_scale: float = 1.0,
+        max_gap_days: int = 90,
+        max_flags: int = 500,
+        max_history_days: int = 365,
+    ) -> None:
+        """
+        Initialize anomaly detector.
+
+        Args:
+            alpha: EWMA smoothing factor (higher reacts faster)
+            threshold: Robust z-score that triggers a flag
+            min_observations: Closed days required before flagging
+            min_scale: Floor for the deviation estimate (currency units)
+            max_gap_days: Max empty days folded in when a series resumes
+            max_flags: Number of recent flags retained
+            max_history_days: Closed days kept per series for late-data
+                correction (older late data is dropped)
+        """
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_observations = min_observations
+        self.min_scale = min_scale
+        self.max_gap_days = max_gap_days
+        self.max_history_days = max_history_days
+
+        self._series: Dict[SeriesKey, _SeriesState] = {}
+        self.flags: Deque[AnomalyFlag] = deque(maxlen=max_flags)
+        self.late_updates = 0
+        self.dropped_updates = 0
+        self._quiet = False
+
+    def reset(self) -> None:
+        """Drop all series state and flags."""
+        self._series.clear()
+        self.flags.clear()
+        self.late_updates = 0
+        self.dropped_updates = 0
+
+    def rebuild(self, observations: Iterable[Tuple[SeriesKey, date, Decimal]]) -> None:
+        """
+        Reset and replay historical observations without logging alerts.
+
+        Observations are sorted by day first (stable, so same-day order is
+        kept), so out-of-order history is not treated as late data. Flags
+        found in the history are retained for reporting.
+
+        Args:
+            observations: (series, day, value) tuples, in any order
+        """
+        self.reset()
+        self._quiet = True
+        try:
+            for series, day, value in sorted(observations, key=lambda o: o[1]):
+                self.observe(series, day, value)
+        finally:
+            self._quiet = False
+
+    def observe(
+        self,
+        series: SeriesKey,
+        day: date,
+        value: Decimal,
+    ) -> Optional[AnomalyFlag]:
+        """
+        Feed one revenue amount into a series.
+
+        Args:
+            series: (series_type, key) tuple
+            day: Day the revenue belongs to
+            value: Net revenue amount (negative for refunds)
+
+        Returns:
+            AnomalyFlag if this update triggered one (for late data: the
+            corrected day's flag, not logged)
+        """
+        state = self._series.get(series)
+        if state is None:
+            state = _SeriesState(stats=RollingStats(alpha=self.alpha))
+            self._series[series] = state
+
+        if state.open_day is not None and day < state.open_day:
+            return self._late(series, state, state.open_day, day, value)
+
+        if state.open_day is None or day == state.open_day:
+            state.open_day = day
+            state.open_total += value
+        else:
+            flag = self._close_day(series, state, state.open_day)
+
+            # Days without sales are real zero observations
+            gap = min((day - state.open_day).days - 1, self.max_gap_days)
+            if gap > 0:
+                first_empty = state.open_day + timedelta(days=1)
+                flag = self._check(series, state, first_empty, Decimal("0"), closing=True) or flag
+                for offset in range(gap):
+                    self._fold(state, first_empty + timedelta(days=offset), Decimal("0"))
+
+            state.open_day = day
+            state.open_total = value
+            state.flagged = set()
+            cutoff = day - timedelta(days=self.max_history_days)
+            while state.days and next(iter(state.days)) < cutoff:  # Kept in date order
+                del state.days[next(iter(state.days))]
+            if flag:
+                return flag
+
+        return self._check(series, state, state.open_day, state.open_total, closing=False)
+
+    def _late(
+        self,
+        series: SeriesKey,
+        state: _SeriesState,
+        open_day: date,
+        day: date,
+        value: Decimal,
+    ) -> Optional[AnomalyFlag]:
+        """
+        Fold data for an already-closed day into its series.
+
+        The EWMA is linear in each observation, so the day's weight after
+        the k updates that followed it is alpha * (1 - alpha)^k and the
+        mean is corrected exactly. Variance and deviation terms are
+        corrected for the day's own deviation from its baseline; later
+        days keep the deviations they were measured with. Only the
+        corrected day is re-scored, against the baseline it closed on.
+        Days the series never folded in (before its first sale, or past
+        max_gap_days of silence) cannot be corrected and are dropped.
+        """
+        closed = state.days.get(day)
+        if closed is None or (open_day - day).days > self.max_history_days:
+            self.dropped_updates += 1
+            return None
+        self.late_updates += 1
+
+        stats = state.stats
+        decay = (1 - self.alpha) ** (stats.count - 1 - closed.index)
+        old = float(closed.total)
+        closed.total += value
+        new = float(closed.total)
+
+        baseline = closed.baseline
+        if baseline.count == 0:
+            stats.mean += decay * (new - old)  # First observation seeds the mean
+        else:
+            old_diff, new_diff = old - baseline.mean, new - baseline.mean
+            stats.mean += decay * self.alpha * (new_diff - old_diff)
+            stats.var = max(
+                0.0,
+                stats.var + decay * (1 - self.alpha) * self.alpha * (new_diff ** 2 - old_diff ** 2),
+            )
+            stats.abs_dev = max(
+                0.0,
+                stats.abs_dev + decay * self.alpha * (abs(new_diff) - abs(old_diff)),
+            )
+
+        # Replace only this day's flag; flags are bounded by max_flags
+        stale = [f for f in self.flags if (f.series_type, f.series_key) == series and f.day == day]
+        for flag in stale:
+            self.flags.remove(flag)
+        quiet, self._quiet = self._quiet, True
+        try:
+            return self._check(series, state, day, closed.total, closing=True, baseline=baseline)
+        finally:
+            self._quiet = quiet
+
+    def _close_day(
+        self,
+        series: SeriesKey,
+        state: _SeriesState,
+        open_day: date,
+    ) -> Optional[AnomalyFlag]:
+        """Score the open day as complete, then fold it into the statistics."""
+        flag = self._check(series, state, open_day, state.open_total, closing=True)
+        self._fold(state, open_day, state.open_total)
+        return flag
+
+    @staticmethod
+    def _fold(state: _SeriesState, day: date, total: Decimal) -> None:
+        """Fold a closed day into the statistics, keeping its contribution."""
+        state.days[day] = _ClosedDay(
+            total=total, index=state.stats.count, baseline=replace(state.stats),
+        )
+        state.stats.update(float(total))
+
+    def _check(
+        self,
+        series: SeriesKey,
+        state: _SeriesState,
+        day: date,
+        total: Decimal,
+        closing: bool,
+        baseline: Optional[RollingStats] = None,
+    ) -> Optional[AnomalyFlag]:
+        """Flag a day's total if it deviates from the baseline (default: the current one)."""
+        stats = baseline or state.stats
+        if stats.count < self.min_observations:
+            return None
+
+        z, robust_z = stats.scores(float(total), self.min_scale)
+
+        kind = None
+        if robust_z >= self.threshold:
+            kind = "spike"
+        elif robust_z <= -self.threshold and (closing or total < 0):
+            # A partial day is naturally low; only refund waves flag early
+            kind = "drop"
+
+        if kind is None or (day == state.open_day and kind in state.flagged):
+            return None
+        if day == state.open_day:
+            state.flagged.add(kind)
+
+        flag = AnomalyFlag(
+            series_type=series[0],
+            series_key=series[1],
+            day=day,
+            kind=kind,
+            value=total,
+            expected=Decimal(str(round(stats.mean, 2))),
+            z_score=z,
+            robust_z=robust_z,
+        )
+        self.flags.append(flag)
+        if not self._quiet:
+            logger.warning(
+                f"Revenue {kind} on {day} for {series[0]} {series[1]}: "
+                f"{total} vs expected {flag.expected} (robust z={robust_z:.1f})"
+            )
+        return flag
+
+    def recent_flags(
+        self,
+        since: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[AnomalyFlag]:
+        """
+        Get retained flags, newest first.
+
+        Args:
+            since: Only flags for days on or after this date
+            limit: Max number of flags
+
+        Returns:
+            List of AnomalyFlag
+        """
+        flags = [f for f in reversed(self.flags) if since is None or f.day >= since]
+        return flags[:limit] if limit is not None else flags
@@ -0,0 +1,314 @@
+"""
+Report Export Pipeline
+
+Computes a revenue report once and renders every output format
+(markdown, HTML, CSV, JSON) concurrently, writing each file atomically.
+Per-book and per-platform report variants can be fanned out across
+worker processes for month-end runs; the parent computes every variant
+report plus the portfolio-wide sections and workers only render.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Iterable
+
+from .revenue_tracker import (
+    RevenueTracker,
+    RevenueReport,
+    Platform,
+    report_concentration,
+)
+from .analytics_dashboard import (
+    AnalyticsDashboard,
+    DashboardConfig,
+    PortfolioContext,
+    ReportRenderer,
+)
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("markdown", "html", "csv", "json")
+
+FORMAT_EXTENSIONS = {
+    "markdown": "md",
+    "html": "html",
+    "csv": "csv",
+    "json": "json",
+}
+
+
+def atomic_write_text(path: Path, content: str) -> Path:
+    """
+    Write text to path via a temp file in the same directory and rename.
+
+    Readers never observe a partially written report.
+
+    Args:
+        path: Destination path
+        content: Text content
+
+    Returns:
+        Destination path
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def safe_filename(name: str) -> str:
+    """
+    Filesystem-safe form of a book ID or platform for output names.
+
+    Lowercased, with anything but letters, digits, '.', '_' and '-'
+    replaced by '_' and leading/trailing separators stripped, so a title
+    or ISBN fallback containing '/' or '..' cannot leave the output
+    directory. Names that had to change get a short hash suffix so two
+    keys never map to the same file.
+
+    Args:
+        name: Variant key
+
+    Returns:
+        Filename component
+    """
+    slug = re.sub(r"[^a-z0-9._-]+", "_", name.lower()).strip("._-")
+    if slug != name:
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+        slug = f"{slug}_{digest}" if slug else digest
+    return slug
+
+
+def _render_formats(
+    renderer: ReportRenderer,
+    report: RevenueReport,
+    stats: Dict[str, Any],
+    context: PortfolioContext,
+    output_name: str,
+    formats: Iterable[str],
+    max_workers: int,
+) -> Dict[str, Path]:
+    """Render formats concurrently and write them atomically (no tracker needed)."""
+    config = renderer.config
+    renderers: Dict[str, Callable[[], str]] = {
+        "markdown": lambda: renderer.render_markdown(report, stats, context),
+        "html": lambda: renderer.render_html(report, stats, context),
+        "csv": lambda: RevenueTracker.format_report_csv(report),
+        "json": lambda: json.dumps(
+            {
+                "report": report.to_dict(),
+                "stats": stats,
+                "concentration": {
+                    k: v.to_dict()
+                    for k, v in report_concentration(report, k=config.top_k).items()
+                },
+            },
+            indent=2,
+        ),
+    }
+
+    def render_and_write(fmt: str) -> Path:
+        path = config.output_dir / f"{output_name}.{FORMAT_EXTENSIONS[fmt]}"
+        return atomic_write_text(path, renderers[fmt]())
+
+    selected = [f for f in formats if f in renderers]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {fmt: pool.submit(render_and_write, fmt) for fmt in selected}
+        outputs = {fmt: future.result() for fmt, future in futures.items()}
+
+    logger.info(f"Exported {output_name} ({', '.join(outputs)})")
+    return outputs
+
+
+class ExportPipeline:
+    """
+    Shared export pipeline for analytics reports.
+
+    Features:
+    - Single report/stats computation per export
+    - Concurrent rendering of all formats in a thread pool
+    - Atomic temp-file + rename writes
+    - Per-book / per-platform variants rendered across worker processes
+      from reports precomputed in the parent
+    """
+
+    def __init__(
+        self,
+        dashboard: AnalyticsDashboard,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Initialize export pipeline.
+
+        Args:
+            dashboard: Dashboard used for rendering
+            max_workers: Threads used to render formats concurrently
+        """
+        self.dashboard = dashboard
+        self.tracker = dashboard.tracker
+        self.max_workers = max_workers
+
+    def export_report(
+        self,
+        report: RevenueReport,
+        stats: Dict[str, Any],
+        output_name: str,
+        formats: Iterable[str] = EXPORT_FORMATS,
+    ) -> Dict[str, Path]:
+        """
+        Render and write a precomputed report in several formats concurrently.
+
+        Args:
+            report: Report to export
+            stats: Summary stats to embed
+            output_name: Output filename (without extension)
+            formats: Formats to produce
+
+        Returns:
+            Dictionary of format -> path
+        """
+        return _render_formats(
+            self.dashboard.renderer,
+            report,
+            stats,
+            self.dashboard.portfolio_context(),
+            output_name,
+            formats,
+            self.max_workers,
+        )
+
+    def export(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        output_name: Optional[str] = None,
+        formats: Iterable[str] = EXPORT_FORMATS,
+        platform: Optional[Platform] = None,
+        book_id: Optional[str] = None,
+    ) -> Dict[str, Path]:
+        """
+        Compute a report once and export it in every requested format.
+
+        Args:
+            start_date: Report start date (default: start of month)
+            end_date: Report end date (default: today)
+            output_name: Output filename (without extension)
+            formats: Formats to produce
+            platform: Restrict report to one platform
+            book_id: Restrict report to one book
+
+        Returns:
+            Dictionary of format -> path
+        """
+        today = date.today()
+        end_date = end_date or today
+        start_date = start_date or end_date.replace(day=1)
+
+        report = self.tracker.generate_report(
+            start_date, end_date, platform=platform, book_id=book_id
+        )
+        stats = self.tracker.get_summary_stats()
+
+        output_name = output_name or f"analytics_{today.isoformat()}"
+        return self.export_report(report, stats, output_name, formats)
+
+    def export_variants(
+        self,
+        dimension: str,
+        keys: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        formats: Iterable[str] = EXPORT_FORMATS,
+        max_processes: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Path]]:
+        """
+        Export per-book or per-platform report variants in parallel processes.
+
+        The variant reports, summary stats and portfolio-wide sections
+        are computed here from the loaded tracker; worker processes only
+        render and write them. Output names use safe_filename(key).
+
+        Args:
+            dimension: "book" or "platform"
+            keys: Book IDs / platform values (default: all with sales)
+            start_date: Report start date
+            end_date: Report end date
+            formats: Formats to produce per variant
+            max_processes: Worker process count (default: CPU count)
+
+        Returns:
+            Dictionary of variant key -> (format -> path)
+        """
+        if dimension not in ("book", "platform"):
+            raise ValueError(f"Unknown variant dimension: {dimension}")
+
+        if keys is None:
+            if dimension == "book":
+                keys = sorted({r.book_id for r in self.tracker.records})
+            else:
+                keys = sorted({r.platform.value for r in self.tracker.records})
+
+        end_date = end_date or date.today()
+        start_date = start_date or end_date.replace(day=1)
+        formats = list(formats)
+
+        stats = self.tracker.get_summary_stats()
+        context = self.dashboard.portfolio_context()
+
+        results: Dict[str, Dict[str, Path]] = {}
+        with ProcessPoolExecutor(max_workers=max_processes) as pool:
+            futures = {}
+            for key in keys:
+                if dimension == "book":
+                    report = self.tracker.generate_report(start_date, end_date, book_id=key)
+                else:
+                    report = self.tracker.generate_report(
+                        start_date, end_date, platform=Platform(key)
+                    )
+                futures[key] = pool.submit(
+                    _export_variant,
+                    self.dashboard.config,
+                    report,
+                    stats,
+                    context,
+                    f"{dimension}_{safe_filename(key)}_{end_date.isoformat()}",
+                    formats,
+                    self.max_workers,
+                )
+            for key, future in futures.items():
+                results[key] = future.result()
+
+        logger.info(f"Exported {len(results)} {dimension} variants")
+        return results
+
+
+def _export_variant(
+    config: DashboardConfig,
+    report: RevenueReport,
+    stats: Dict[str, Any],
+    context: PortfolioContext,
+    output_name: str,
+    formats: List[str],
+    max_workers: int,
+) -> Dict[str, Path]:
+    """Process-pool entry point: render and write one precomputed variant."""
+    return _render_formats(
+        ReportRenderer(config), report, stats, context, output_name, formats, max_workers
+    )
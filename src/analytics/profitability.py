@@ -0,0 +1,178 @@
+"""
+Title Profitability Engine
+
+Computes ROI and payback for every title in the catalog from the
+tracker's per-book daily net revenue rollup and each book's
+production_cost / publish_date.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Optional, List, Dict, Any
+
+from .revenue_tracker import RevenueTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TitleProfitability:
+    """Profitability metrics for a single title."""
+    book_id: str
+    title: str
+    production_cost: Decimal
+    cumulative_net: Decimal
+    publish_date: Optional[date]
+    first_sale: Optional[date]
+    payback_date: Optional[date] = None
+    days_to_breakeven: Optional[int] = None
+
+    @property
+    def profit(self) -> Decimal:
+        """Net revenue minus production cost."""
+        return self.cumulative_net - self.production_cost
+
+    @property
+    def roi_percent(self) -> Optional[Decimal]:
+        """Return on investment in percent (None when cost is zero)."""
+        if self.production_cost <= 0:
+            return None
+        return (self.profit / self.production_cost * 100).quantize(Decimal("0.1"))
+
+    @property
+    def status(self) -> str:
+        """Payback status: no_cost, paid_back or recovering."""
+        if self.production_cost <= 0:
+            return "no_cost"
+        return "paid_back" if self.payback_date else "recovering"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        roi = self.roi_percent
+        return {
+            "book_id": self.book_id,
+            "title": self.title,
+            "production_cost": str(self.production_cost),
+            "cumulative_net": str(self.cumulative_net),
+            "profit": str(self.profit),
+            "roi_percent": str(roi) if roi is not None else None,
+            "publish_date": self.publish_date.isoformat() if self.publish_date else None,
+            "first_sale": self.first_sale.isoformat() if self.first_sale else None,
+            "payback_date": self.payback_date.isoformat() if self.payback_date else None,
+            "days_to_breakeven": self.days_to_breakeven,
+            "status": self.status,
+        }
+
+
+class ProfitabilityEngine:
+    """
+    Batched ROI and payback computation for the whole catalog.
+
+    Features:
+    - One pass over the per-book daily net rollup (no per-book reports)
+    - Payback date and days-to-breakeven from publish date
+    - Portfolio-level totals and top/bottom ranking by ROI
+    """
+
+    def __init__(self, tracker: RevenueTracker) -> None:
+        """
+        Initialize profitability engine.
+
+        Args:
+            tracker: RevenueTracker instance
+        """
+        self.tracker = tracker
+
+    def compute(self, as_of: Optional[date] = None) -> List[TitleProfitability]:
+        """
+        Compute profitability for every catalog title and every title with sales.
+
+        Args:
+            as_of: Ignore revenue after this date (default: today)
+
+        Returns:
+            List of TitleProfitability, one per title
+        """
+        as_of = as_of or date.today()
+        daily_index = self.tracker.daily_net_by_book
+        catalog = self.tracker.books_catalog
+
+        results = []
+        for book_id in catalog.keys() | daily_index.keys():
+            book = catalog.get(book_id, {})
+            cost = Decimal(book.get("production_cost") or "0")
+            publish_date = (
+                date.fromisoformat(book["publish_date"])
+                if book.get("publish_date") else None
+            )
+
+            cumulative = Decimal("0")
+            first_sale = None
+            payback_date = None
+            for day in sorted(daily_index.get(book_id, {})):
+                if day > as_of:
+                    break
+                first_sale = first_sale or day
+                cumulative += daily_index[book_id][day]
+                if payback_date is None and cost > 0 and cumulative >= cost:
+                    payback_date = day
+
+            days_to_breakeven = None
+            start = publish_date or first_sale
+            if payback_date and start:
+                days_to_breakeven = max(0, (payback_date - start).days)
+
+            results.append(TitleProfitability(
+                book_id=book_id,
+                title=book.get("title", book_id),
+                production_cost=cost,
+                cumulative_net=cumulative,
+                publish_date=publish_date,
+                first_sale=first_sale,
+                payback_date=payback_date,
+                days_to_breakeven=days_to_breakeven,
+            ))
+
+        return results
+
+    def portfolio_summary(
+        self,
+        results: Optional[List[TitleProfitability]] = None,
+        k: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Summarize catalog profitability.
+
+        Args:
+            results: Output of compute() (computed if not given)
+            k: Number of best/worst titles by ROI to include
+
+        Returns:
+            Portfolio totals plus top/bottom titles
+        """
+        if results is None:
+            results = self.compute()
+
+        total_cost = sum((r.production_cost for r in results), Decimal("0"))
+        total_net = sum((r.cumulative_net for r in results), Decimal("0"))
+        paid_back = [r for r in results if r.status == "paid_back"]
+        ranked = [r for r in results if r.roi_percent is not None]
+        days = [r.days_to_breakeven for r in paid_back if r.days_to_breakeven is not None]
+
+        return {
+            "titles": len(results),
+            "paid_back": len(paid_back),
+            "recovering": sum(1 for r in results if r.status == "recovering"),
+            "total_cost": str(total_cost),
+            "total_net": str(total_net),
+            "portfolio_roi_percent": (
+                str(((total_net - total_cost) / total_cost * 100).quantize(Decimal("0.1")))
+                if total_cost > 0 else None
+            ),
+            "avg_days_to_breakeven": round(sum(days) / len(days), 1) if days else None,
+            "best": heapq.nlargest(k, ranked, key=lambda r: r.roi_percent),
+            "worst": heapq.nsmallest(k, ranked, key=lambda r: r.roi_percent),
+        }
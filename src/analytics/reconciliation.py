@@ -0,0 +1,290 @@
+"""
+Royalty Statement Reconciliation
+
+Matches payout statements sent by each platform against the internally
+recorded sales ledger. Both sides are keyed on
+(platform, book, month, territory) and hash-joined, so a reconciliation
+is linear in the size of the statement plus the ledger months it covers.
+"""
+
+import csv
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from .revenue_tracker import RevenueTracker, Platform
+
+logger = logging.getLogger(__name__)
+
+# Statement key: (platform, book_id, "YYYY-MM", territory)
+StatementKey = tuple[str, str, str, str]
+
+DEFAULT_STATEMENT_COLUMNS = {
+    "book_id": "Book ID",
+    "month": "Month",
+    "territory": "Territory",
+    "units": "Units",
+    "net": "Net Revenue",
+}
+
+
+@dataclass
+class StatementLine:
+    """Single aggregated line of a platform payout statement."""
+    platform: Platform
+    book_id: str
+    month: str  # YYYY-MM
+    territory: str
+    units: int
+    net_revenue: Decimal
+
+    @property
+    def key(self) -> StatementKey:
+        """Join key."""
+        return (self.platform.value, self.book_id, self.month, self.territory)
+
+
+@dataclass
+class ReconciliationLine:
+    """Outcome for one join key."""
+    key: StatementKey
+    status: str  # matched, rounding, mismatch, missing_in_ledger, missing_in_statement
+    ledger_units: int = 0
+    statement_units: int = 0
+    ledger_net: Decimal = Decimal("0")
+    statement_net: Decimal = Decimal("0")
+
+    @property
+    def difference(self) -> Decimal:
+        """Statement net minus ledger net."""
+        return self.statement_net - self.ledger_net
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        platform, book_id, month, territory = self.key
+        return {
+            "platform": platform,
+            "book_id": book_id,
+            "month": month,
+            "territory": territory,
+            "status": self.status,
+            "ledger_units": self.ledger_units,
+            "statement_units": self.statement_units,
+            "ledger_net": str(self.ledger_net),
+            "statement_net": str(self.statement_net),
+            "difference": str(self.difference),
+        }
+
+
+@dataclass
+class ReconciliationReport:
+    """Result of reconciling one statement against the ledger."""
+    matched: int = 0
+    rounding: List[ReconciliationLine] = field(default_factory=list)
+    mismatches: List[ReconciliationLine] = field(default_factory=list)
+    missing_in_ledger: List[ReconciliationLine] = field(default_factory=list)
+    missing_in_statement: List[ReconciliationLine] = field(default_factory=list)
+    generated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def rounding_drift(self) -> Decimal:
+        """Net sum of within-tolerance differences."""
+        return sum((line.difference for line in self.rounding), Decimal("0"))
+
+    @property
+    def is_clean(self) -> bool:
+        """True when only exact matches and rounding drift were found."""
+        return not (self.mismatches or self.missing_in_ledger or self.missing_in_statement)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "matched": self.matched,
+            "rounding_count": len(self.rounding),
+            "rounding_drift": str(self.rounding_drift),
+            "mismatches": [line.to_dict() for line in self.mismatches],
+            "missing_in_ledger": [line.to_dict() for line in self.missing_in_ledger],
+            "missing_in_statement": [line.to_dict() for line in self.missing_in_statement],
+            "is_clean": self.is_clean,
+            "generated_at": self.generated_at.isoformat(),
+        }
+
+
+def load_payout_statement(
+    csv_path: Path,
+    platform: Platform,
+    columns: Optional[Dict[str, str]] = None,
+) -> List[StatementLine]:
+    """
+    Load a payout statement CSV and aggregate it per join key.
+
+    Args:
+        csv_path: Path to statement CSV
+        platform: Platform that issued the statement
+        columns: Field -> CSV column overrides (see DEFAULT_STATEMENT_COLUMNS)
+
+    Returns:
+        One StatementLine per (book, month, territory)
+    """
+    cols = {**DEFAULT_STATEMENT_COLUMNS, **(columns or {})}
+    totals: Dict[StatementKey, Dict[str, Any]] = defaultdict(
+        lambda: {"units": 0, "net": Decimal("0")}
+    )
+
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                key = (
+                    platform.value,
+                    row[cols["book_id"]],
+                    row[cols["month"]][:7],  # accepts YYYY-MM or YYYY-MM-DD
+                    row.get(cols["territory"]) or "US",
+                )
+                units = int(row.get(cols["units"]) or 0)
+                net = Decimal(row.get(cols["net"]) or "0")
+            except (KeyError, ValueError, InvalidOperation) as e:
+                logger.warning(f"Error reading statement row: {e}")
+                continue
+
+            # Only fully parsed rows touch the totals
+            totals[key]["units"] += units
+            totals[key]["net"] += net
+
+    lines = [
+        StatementLine(
+            platform=platform,
+            book_id=book_id,
+            month=month,
+            territory=territory,
+            units=v["units"],
+            net_revenue=v["net"],
+        )
+        for (_, book_id, month, territory), v in totals.items()
+    ]
+    logger.info(f"Loaded {len(lines)} statement lines from {csv_path}")
+    return lines
+
+
+class StatementReconciler:
+    """
+    Reconcile platform payout statements against RevenueTracker.
+
+    Features:
+    - Hash join on (platform, book, month, territory)
+    - Probes the tracker's monthly rollup; never rescans sales records
+    - Separates rounding drift from real mismatches
+    - Reports rows missing on either side
+    """
+
+    def __init__(
+        self,
+        tracker: RevenueTracker,
+        tolerance: Decimal = Decimal("0.05"),
+    ) -> None:
+        """
+        Initialize reconciler.
+
+        Args:
+            tracker: RevenueTracker instance
+            tolerance: Max absolute net difference treated as rounding drift
+        """
+        self.tracker = tracker
+        self.tolerance = tolerance
+
+    def reconcile(self, lines: List[StatementLine]) -> ReconciliationReport:
+        """
+        Reconcile statement lines against the ledger.
+
+        Ledger rows are only reported missing for (platform, month) pairs
+        that the statement covers.
+
+        Args:
+            lines: Statement lines (e.g. from load_payout_statement)
+
+        Returns:
+            ReconciliationReport
+        """
+        result = ReconciliationReport()
+        rollup = self.tracker.monthly_rollup
+
+        # Build side: statement grouped per (platform, month)
+        statement: Dict[tuple[str, str], Dict[tuple[str, str], StatementLine]] = defaultdict(dict)
+        for line in lines:
+            statement[(line.platform.value, line.month)][(line.book_id, line.territory)] = line
+
+        for scope, stmt_cells in statement.items():
+            platform, month = scope
+            ledger_cells = rollup.get(scope, {})
+
+            # Probe side: each statement cell looks up the ledger cell
+            for cell_key, line in stmt_cells.items():
+                key = (platform, cell_key[0], month, cell_key[1])
+                ledger = ledger_cells.get(cell_key)
+                if ledger is None:
+                    result.missing_in_ledger.append(ReconciliationLine(
+                        key=key,
+                        status="missing_in_ledger",
+                        statement_units=line.units,
+                        statement_net=line.net_revenue,
+                    ))
+                    continue
+
+                outcome = ReconciliationLine(
+                    key=key,
+                    status="matched",
+                    ledger_units=ledger["units"],
+                    statement_units=line.units,
+                    ledger_net=ledger["net"],
+                    statement_net=line.net_revenue,
+                )
+                diff = abs(outcome.difference)
+                if outcome.ledger_units != outcome.statement_units or diff > self.tolerance:
+                    outcome.status = "mismatch"
+                    result.mismatches.append(outcome)
+                elif diff > 0:
+                    outcome.status = "rounding"
+                    result.rounding.append(outcome)
+                else:
+                    result.matched += 1
+
+            # Anti-join: ledger cells in this scope the statement never mentioned
+            for cell_key, ledger in ledger_cells.items():
+                if cell_key not in stmt_cells and (ledger["units"] or ledger["net"]):
+                    result.missing_in_statement.append(ReconciliationLine(
+                        key=(platform, cell_key[0], month, cell_key[1]),
+                        status="missing_in_statement",
+                        ledger_units=ledger["units"],
+                        ledger_net=ledger["net"],
+                    ))
+
+        logger.info(
+            f"Reconciled {len(lines)} statement lines: {result.matched} matched, "
+            f"{len(result.rounding)} rounding, {len(result.mismatches)} mismatched, "
+            f"{len(result.missing_in_ledger)} missing in ledger, "
+            f"{len(result.missing_in_statement)} missing in statement"
+        )
+        return result
+
+    def reconcile_csv(
+        self,
+        csv_path: Path,
+        platform: Platform,
+        columns: Optional[Dict[str, str]] = None,
+    ) -> ReconciliationReport:
+        """
+        Load a statement CSV and reconcile it.
+
+        Args:
+            csv_path: Path to statement CSV
+            platform: Platform that issued the statement
+            columns: Field -> CSV column overrides
+
+        Returns:
+            ReconciliationReport
+        """
+        return self.reconcile(load_payout_statement(csv_path, platform, columns))
@@ -8,7 +8,9 @@ Supports CSV import from platform reports, manual entry, and analytics.
 import os
 import json
 import csv
+import io
 import logging
+import math
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, date, timedelta
 from decimal import Decimal, ROUND_HALF_UP
@@ -17,6 +19,8 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any, Iterator, Callable
 from collections import defaultdict
 
+from .anomaly_detector import AnomalyDetector
+
 logger = logging.getLogger(__name__)
 
 
@@ -170,6 +174,110 @@ class RevenueReport:
         }
 
 
+@dataclass
+class ConcentrationSummary:
+    """Top-K and long-tail breakdown for one report dimension."""
+    dimension: str
+    top: List[tuple[str, Decimal]]
+    total: Decimal
+    tail_count: int
+    tail_total: Decimal
+    pareto_share: Decimal  # % of total held by the top 20% of entries
+    hhi: Decimal           # Herfindahl-Hirschman index (0-10000)
+
+    @property
+    def top_total(self) -> Decimal:
+        """Combined value of the top-K entries."""
+        return sum((v for _, v in self.top), Decimal("0"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "dimension": self.dimension,
+            "top": [{"key": k, "value": str(v)} for k, v in self.top],
+            "total": str(self.total),
+            "top_total": str(self.top_total),
+            "tail_count": self.tail_count,
+            "tail_total": str(self.tail_total),
+            "pareto_share": str(self.pareto_share),
+            "hhi": str(self.hhi),
+        }
+
+
+def summarize_concentration(
+    dimension: str,
+    values: Dict[str, Any],
+    k: int = 10,
+) -> ConcentrationSummary:
+    """
+    Build a top-K / long-tail summary from one sort of the breakdown.
+
+    Cost is O(n log n): the Pareto cut is a fixed fraction (top 20%) of
+    the n entries, so partial selection would not be asymptotically
+    cheaper, and a single sorted() serves both the top-K and the cut.
+
+    Args:
+        dimension: Name of the breakdown (platform, book, territory)
+        values: Mapping of key -> revenue or units
+        k: Number of top entries to return
+
+    Returns:
+        ConcentrationSummary for the breakdown
+    """
+    n = len(values)
+    pareto_n = math.ceil(n * 0.2)
+    ranked = sorted(values.items(), key=lambda x: x[1], reverse=True)
+
+    total = Decimal("0")
+    positive_total = Decimal("0")
+    for v in values.values():
+        total += v
+        if v > 0:
+            positive_total += v
+
+    hhi = Decimal("0")
+    if positive_total > 0:
+        # Shares in percent, squared and summed (10000 = single entry)
+        hhi = sum(
+            ((Decimal(v) / positive_total * 100) ** 2 for v in values.values() if v > 0),
+            Decimal("0"),
+        ).quantize(Decimal("0.1"))
+
+    top = [(key, Decimal(v)) for key, v in ranked[:k]]
+    top_total = sum((v for _, v in top), Decimal("0"))
+    pareto_total = sum((Decimal(v) for _, v in ranked[:pareto_n]), Decimal("0"))
+    pareto_share = (
+        (pareto_total / total * 100).quantize(Decimal("0.1"))
+        if total > 0 else Decimal("0")
+    )
+
+    return ConcentrationSummary(
+        dimension=dimension,
+        top=top,
+        total=Decimal(total),
+        tail_count=max(0, n - len(top)),
+        tail_total=Decimal(total) - top_total,
+        pareto_share=pareto_share,
+        hhi=hhi,
+    )
+
+
+def report_concentration(
+    report: RevenueReport,
+    k: int = 10,
+) -> Dict[str, ConcentrationSummary]:
+    """
+    Top-K, long-tail and concentration metrics per report dimension.
+
+    Platforms and books are ranked by net revenue, territories by units.
+    """
+    return {
+        "platform": summarize_concentration("platform", report.revenue_by_platform, k),
+        "book": summarize_concentration("book", report.revenue_by_book, k),
+        "territory": summarize_concentration("territory", report.units_by_territory, k),
+    }
+
+
 class RevenueTracker:
     """
     Revenue tracking and analytics system.
@@ -200,6 +308,16 @@ class RevenueTracker:
         self.books_catalog: Dict[str, Dict[str, Any]] = {}
         self.revenue_goals: Dict[str, Dict[str, Any]] = {}
 
+        # Rollups maintained incrementally as records are added
+        self.daily_net_by_book: Dict[str, Dict[date, Decimal]] = defaultdict(
+            lambda: defaultdict(Decimal)
+        )
+        # (platform, "YYYY-MM") -> (book_id, territory) -> units/net
+        self.monthly_rollup: Dict[tuple[str, str], Dict[tuple[str, str], Dict[str, Any]]] = defaultdict(
+            lambda: defaultdict(lambda: {"units": 0, "net": Decimal("0")})
+        )
+        self.anomaly_detector = AnomalyDetector()
+
         self._load_data()
 
     def _load_data(self) -> None:
@@ -210,10 +328,19 @@ class RevenueTracker:
                 with open(self.records_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     self.records = [SalesRecord.from_dict(r) for r in data]
+                for record in self.records:
+                    self._index_record(record, detect=False)
+                # History is replayed in date order and without alerts
+                self.anomaly_detector.rebuild(
+                    obs for record in self.records for obs in self._anomaly_observations(record)
+                )
                 logger.info(f"Loaded {len(self.records)} sales records")
             except Exception as e:
                 logger.error(f"Error loading records: {e}")
                 self.records = []
+                self.daily_net_by_book.clear()
+                self.monthly_rollup.clear()
+                self.anomaly_detector.reset()
 
         # Load books catalog
         if self.books_file.exists():
@@ -247,6 +374,27 @@ class RevenueTracker:
         with open(self.goals_file, "w", encoding="utf-8") as f:
             json.dump(self.revenue_goals, f, indent=2)
 
+    @staticmethod
+    def _anomaly_observations(record: SalesRecord) -> List[tuple]:
+        """Anomaly detector observations for one record."""
+        return [
+            (("book", record.book_id), record.date, record.net_revenue),
+            (("platform", record.platform.value), record.date, record.net_revenue),
+        ]
+
+    def _index_record(self, record: SalesRecord, detect: bool = True) -> None:
+        """Fold a record into the incremental rollups (and the anomaly detector)."""
+        self.daily_net_by_book[record.book_id][record.date] += record.net_revenue
+
+        month_key = (record.platform.value, record.date.strftime("%Y-%m"))
+        cell = self.monthly_rollup[month_key][(record.book_id, record.territory)]
+        cell["units"] += record.quantity
+        cell["net"] += record.net_revenue
+
+        if detect:
+            for series, day, value in self._anomaly_observations(record):
+                self.anomaly_detector.observe(series, day, value)
+
     def _generate_record_id(self) -> str:
         """Generate unique record ID."""
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
@@ -338,6 +486,7 @@ class RevenueTracker:
         )
 
         self.records.append(record)
+        self._index_record(record)
         self._save_data()
 
         logger.info(
@@ -497,6 +646,8 @@ class RevenueTracker:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         time_frame: TimeFrame = TimeFrame.MONTHLY,
+        platform: Optional[Platform] = None,
+        book_id: Optional[str] = None,
     ) -> RevenueReport:
         """
         Generate revenue report.
@@ -505,6 +656,8 @@ class RevenueTracker:
             start_date: Report start date
             end_date: Report end date
             time_frame: Grouping time frame
+            platform: Restrict report to one platform
+            book_id: Restrict report to one book
 
         Returns:
             RevenueReport with analytics
@@ -515,7 +668,7 @@ class RevenueTracker:
         if not start_date:
             start_date = end_date.replace(day=1)
 
-        records = self.get_records(start_date, end_date)
+        records = self.get_records(start_date, end_date, platform, book_id)
 
         # Aggregate data
         total_units = 0
@@ -558,8 +711,8 @@ class RevenueTracker:
                 continue
 
             book_units = sum(r.quantity for r in book_recs)
-            book_gross = sum(r.gross_revenue for r in book_recs)
-            book_net = sum(r.net_revenue for r in book_recs)
+            book_gross = sum((r.gross_revenue for r in book_recs), Decimal("0"))
+            book_net = sum((r.net_revenue for r in book_recs), Decimal("0"))
 
             summary = BookSummary(
                 book_id=book_id,
@@ -573,7 +726,7 @@ class RevenueTracker:
                     if any(r.platform == p for r in book_recs)
                 },
                 revenue_by_platform={
-                    p.value: sum(r.net_revenue for r in book_recs if r.platform == p)
+                    p.value: sum((r.net_revenue for r in book_recs if r.platform == p), Decimal("0"))
                     for p in Platform
                     if any(r.platform == p for r in book_recs)
                 },
@@ -701,35 +854,51 @@ class RevenueTracker:
             output_path: Output file path
         """
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Summary
-            writer.writerow(["Revenue Report"])
-            writer.writerow(["Period", f"{report.start_date} to {report.end_date}"])
-            writer.writerow([])
-            writer.writerow(["Summary"])
-            writer.writerow(["Total Units", report.total_units])
-            writer.writerow(["Gross Revenue", f"${report.total_gross_revenue}"])
-            writer.writerow(["Net Revenue", f"${report.total_net_revenue}"])
-            writer.writerow([])
-
-            # By platform
-            writer.writerow(["Revenue by Platform"])
-            writer.writerow(["Platform", "Units", "Revenue"])
-            for platform, units in report.units_by_platform.items():
-                revenue = report.revenue_by_platform.get(platform, Decimal("0"))
-                writer.writerow([platform, units, f"${revenue}"])
-            writer.writerow([])
-
-            # By book
-            writer.writerow(["Revenue by Book"])
-            writer.writerow(["Book", "Units", "Revenue"])
-            for book_id, units in report.units_by_book.items():
-                revenue = report.revenue_by_book.get(book_id, Decimal("0"))
-                writer.writerow([book_id, units, f"${revenue}"])
+            f.write(self.format_report_csv(report))
 
         logger.info(f"Exported report to {output_path}")
 
+    @staticmethod
+    def format_report_csv(report: RevenueReport) -> str:
+        """
+        Render report as CSV text.
+
+        Args:
+            report: Report to render
+
+        Returns:
+            CSV content
+        """
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer)
+
+        # Summary
+        writer.writerow(["Revenue Report"])
+        writer.writerow(["Period", f"{report.start_date} to {report.end_date}"])
+        writer.writerow([])
+        writer.writerow(["Summary"])
+        writer.writerow(["Total Units", report.total_units])
+        writer.writerow(["Gross Revenue", f"${report.total_gross_revenue}"])
+        writer.writerow(["Net Revenue", f"${report.total_net_revenue}"])
+        writer.writerow([])
+
+        # By platform
+        writer.writerow(["Revenue by Platform"])
+        writer.writerow(["Platform", "Units", "Revenue"])
+        for platform, units in report.units_by_platform.items():
+            revenue = report.revenue_by_platform.get(platform, Decimal("0"))
+            writer.writerow([platform, units, f"${revenue}"])
+        writer.writerow([])
+
+        # By book
+        writer.writerow(["Revenue by Book"])
+        writer.writerow(["Book", "Units", "Revenue"])
+        for book_id, units in report.units_by_book.items():
+            revenue = report.revenue_by_book.get(book_id, Decimal("0"))
+            writer.writerow([book_id, units, f"${revenue}"])
+
+        return buffer.getvalue()
+
     def get_projection(
         self,
         months_ahead: int = 12,
@@ -780,6 +949,25 @@ class RevenueTracker:
             "generated_at": datetime.now().isoformat(),
         }
 
+    def get_concentration(
+        self,
+        report: Optional[RevenueReport] = None,
+        k: int = 10,
+    ) -> Dict[str, ConcentrationSummary]:
+        """
+        Get top-K, long-tail and concentration metrics per dimension.
+
+        Platforms and books are ranked by net revenue, territories by units.
+
+        Args:
+            report: Report to analyze (default: current month)
+            k: Number of top entries per dimension
+
+        Returns:
+            Dictionary of dimension -> ConcentrationSummary
+        """
+        return report_concentration(report or self.generate_report(), k)
+
     def get_summary_stats(self) -> Dict[str, Any]:
         """
         Get high-level summary statistics.
@@ -22,9 +22,37 @@ from .gpu_orchestrator import (
     GPUOrchestrator,
     GPUTask,
     GPUStats,
+    TaskQueue,
     TaskType,
     TaskPriority,
     TaskStatus,
+    TaskPreempted,
+)
+from .gpu_telemetry import (
+    TelemetrySampler,
+    NvidiaSmiProvider,
+    FakeTelemetryProvider,
+)
+from .task_store import TaskStore
+from .scheduling_policy import (
+    ModelResidency,
+    ResidencyAwarePolicy,
+    StrictPriorityPolicy,
+)
+from .duration_model import DurationModel
+from .metrics import MetricsRegistry, MetricsServer
+from .throttle_controller import ThrottleController, ThrottleState
+from .worker_pool import WorkerCoordinator, TaskWorker, simulated_executor
+from .executor_backends import InlineBackend, SubprocessBackend
+from .tts_pipeline import ChunkedTTSPipeline, FakeTTSEngine, split_text
+from .artifact_cache import ArtifactCache
+from .llm_batching import BatchedLLMScheduler, FakeInferenceServer
+from .overnight_planner import OvernightPlanner, OvernightPlan, PlanItem
+from .cover_pipeline import CoverArtPipeline, FakeImageEngine
+from .gpu_simulator import (
+    SimulatedGPUOrchestrator,
+    SimulationResult,
+    run_simulation,
 )
 from .batch_processor import (
     BatchProcessor,
@@ -37,9 +65,42 @@ __all__ = [
     "GPUOrchestrator",
     "GPUTask",
     "GPUStats",
+    "TaskQueue",
     "TaskType",
     "TaskPriority",
     "TaskStatus",
+    "TaskPreempted",
+    "TelemetrySampler",
+    "NvidiaSmiProvider",
+    "FakeTelemetryProvider",
+    "TaskStore",
+    "ModelResidency",
+    "ResidencyAwarePolicy",
+    "StrictPriorityPolicy",
+    "ThrottleController",
+    "DurationModel",
+    "MetricsRegistry",
+    "MetricsServer",
+    "ThrottleState",
+    "WorkerCoordinator",
+    "TaskWorker",
+    "simulated_executor",
+    "InlineBackend",
+    "SubprocessBackend",
+    "ChunkedTTSPipeline",
+    "FakeTTSEngine",
+    "split_text",
+    "ArtifactCache",
+    "BatchedLLMScheduler",
+    "FakeInferenceServer",
+    "OvernightPlanner",
+    "OvernightPlan",
+    "PlanItem",
+    "CoverArtPipeline",
+    "FakeImageEngine",
+    "SimulatedGPUOrchestrator",
+    "SimulationResult",
+    "run_simulation",
     "BatchProcessor",
     "BatchJob",
     "BatchStatus",
@@ -0,0 +1,248 @@
+"""
+Content-Addressed Artifact Cache
+
+Stores synthesized TTS chunks and generated images under a hash of
+everything that determines their content (normalized text, voice and
+engine version for TTS; prompt, negative prompt, seed and dimensions for
+images). Re-running a chapter after a text fix only sends the changed
+chunks to the GPU; regenerating identical cover variants is a file copy.
+
+Entries are plain files fanned out by hash prefix. File mtimes double
+as LRU timestamps (touched on every hit), and the oldest entries are
+evicted once the cache grows past max_bytes.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, overload
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(kind: str, **parts: Any) -> str:
+    """
+    Hash of an artifact's inputs.
+
+    Args:
+        kind: Artifact family ("tts_chunk", "image", ...)
+        **parts: JSON-serializable inputs that determine the content
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps({"kind": kind, **parts}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize and collapse whitespace, so reflowed text still hits."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def tts_chunk_key(text: str, voice_profile: str, engine_version: str, **params: Any) -> str:
+    """Key for one synthesized TTS chunk."""
+    return content_key(
+        "tts_chunk",
+        text=normalize_text(text),
+        voice_profile=voice_profile,
+        engine=engine_version,
+        params=params,
+    )
+
+
+@overload
+def image_key(
+    prompt: str, negative_prompt: str, seed: int, width: int, height: int, **params: Any,
+) -> str: ...
+
+
+@overload
+def image_key(
+    prompt: str, negative_prompt: str, seed: Optional[int], width: int, height: int, **params: Any,
+) -> Optional[str]: ...
+
+
+def image_key(
+    prompt: str,
+    negative_prompt: str,
+    seed: Optional[int],
+    width: int,
+    height: int,
+    **params: Any,
+) -> Optional[str]:
+    """Key for one generated image (None when unseeded, i.e. not reproducible)."""
+    if seed is None:
+        return None
+    return content_key(
+        "image",
+        prompt=prompt.strip(),
+        negative_prompt=negative_prompt.strip(),
+        seed=seed,
+        width=width,
+        height=height,
+        params=params,
+    )
+
+
+class ArtifactCache:
+    """
+    Size-bounded, content-addressed, on-disk LRU cache.
+
+    Features:
+    - Atomic writes (temp file + rename), safe across processes
+    - Hits refresh the entry's mtime; eviction removes the oldest first
+    - Total size tracked in memory; the directory is scanned only at
+      startup and when eviction is needed
+    """
+
+    def __init__(self, root: Path, max_bytes: int = 20 * 1024 ** 3) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            root: Cache directory
+            max_bytes: Size above which least recently used entries are evicted
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, _, size in self._scan())
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def _scan(self) -> List[Tuple[float, Path, int]]:
+        """(mtime, path, size) for every entry."""
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def lookup(self, key: str, suffix: str = "") -> Optional[Path]:
+        """
+        Path of a cached entry, refreshing its LRU position.
+
+        Returns:
+            Path, or None on a miss
+        """
+        path = self._path(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def get(self, key: str, suffix: str = "") -> Optional[bytes]:
+        """Cached bytes, or None on a miss."""
+        path = self.lookup(key, suffix)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:  # Evicted by another process
+            return None
+
+    def restore(self, key: str, destination: Path, suffix: str = "") -> bool:
+        """
+        Copy a cached entry to destination.
+
+        Returns:
+            True on a hit
+        """
+        path = self.lookup(key, suffix)
+        if path is None:
+            return False
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put(self, key: str, data: bytes, suffix: str = "") -> Path:
+        """Store bytes under key (atomic), evicting old entries if over budget."""
+        path = self._path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        previous = path.stat().st_size if path.exists() else 0
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+        with self._lock:
+            self._total_bytes += len(data) - previous
+            over = self._total_bytes > self.max_bytes
+        if over:
+            self._evict()
+        return path
+
+    def put_file(self, key: str, source: Path, suffix: str = "") -> Path:
+        """Store a file's contents under key."""
+        return self.put(key, source.read_bytes(), suffix)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under 90% of max_bytes."""
+        target = self.max_bytes * 0.9
+        entries = sorted(self._scan(), key=lambda e: e[0])
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._total_bytes = total
+            self.evictions += evicted
+        logger.info(f"Artifact cache evicted {evicted} entries ({total / 1024 ** 2:.0f}MB kept)")
+
+    @property
+    def total_bytes(self) -> int:
+        """Current cache size."""
+        return self._total_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "size_mb": round(self._total_bytes / 1024 ** 2, 1),
+                "max_mb": round(self.max_bytes / 1024 ** 2, 1),
+            }
@@ -17,7 +17,7 @@ import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 import shutil
 
@@ -28,6 +28,8 @@ from .gpu_orchestrator import (
     TaskPriority,
     TaskStatus,
 )
+from .duration_model import CHARS_PER_WORD
+from .overnight_planner import OvernightPlan, PlanItem
 
 logger = logging.getLogger(__name__)
 
@@ -196,6 +198,15 @@ class BatchProcessor:
             data_dir=self.data_dir / "gpu_tasks"
         )
 
+        m = self.orchestrator.metrics
+        self._m_chapter = m.histogram("batch_chapter_synthesis_seconds", "Chapter synthesis time")
+        self._m_retries = m.counter("batch_chapter_retries_total", "Chapter synthesis retries")
+        self._m_chapter_failures = m.counter(
+            "batch_chapter_failures_total", "Chapters failed after all retries"
+        )
+        self._m_jobs = m.counter("batch_jobs_finished_total", "Batch jobs finished, by outcome")
+        self._m_job_seconds = m.histogram("batch_job_seconds", "Batch job wall-clock time")
+
         self.active_jobs: Dict[str, BatchJob] = {}
         self._load_persisted_jobs()
 
@@ -324,6 +335,7 @@ class BatchProcessor:
             voice_profile=job.voice_profile,
             output_dir=job.output_dir / "raw",
             overnight=True,
+            mastered_dir=job.output_dir / "mastered",
         )
 
         self._save_job(job)
@@ -343,11 +355,17 @@ class BatchProcessor:
         job.started_at = datetime.now()
         self._save_job(job)
 
+        # Chapters are mastered as soon as they are synthesized, overlapping
+        # with synthesis of the next chapter
+        mastering: List[asyncio.Task] = []
+
         try:
-            # Phase 1: Synthesize all chapters
+            # Phase 1: Synthesize all chapters (mastering pipelined behind)
             logger.info(f"Starting synthesis for {job.title}")
             for ch in job.chapters:
                 if ch.status in (TaskStatus.COMPLETED,):
+                    if not ch.mastered_path:
+                        mastering.append(asyncio.create_task(self._master_chapter(job, ch)))
                     continue
 
                 ch.status = TaskStatus.RUNNING
@@ -355,19 +373,26 @@ class BatchProcessor:
                 self._save_job(job)
 
                 success = await self._synthesize_chapter(job, ch)
+                self._m_chapter.observe(
+                    (datetime.now() - ch.started_at).total_seconds(),
+                    status="completed" if success else "failed",
+                )
 
                 if success:
                     ch.status = TaskStatus.COMPLETED
                     ch.completed_at = datetime.now()
+                    mastering.append(asyncio.create_task(self._master_chapter(job, ch)))
                 else:
                     if ch.retries < self.MAX_RETRIES:
                         ch.retries += 1
                         ch.status = TaskStatus.PENDING
+                        self._m_retries.inc()
                         logger.warning(
                             f"Chapter {ch.chapter_num} failed, retry {ch.retries}"
                         )
                     else:
                         ch.status = TaskStatus.FAILED
+                        self._m_chapter_failures.inc()
                         logger.error(
                             f"Chapter {ch.chapter_num} failed after {self.MAX_RETRIES} retries"
                         )
@@ -377,17 +402,19 @@ class BatchProcessor:
             # Check if all chapters completed
             failed_chapters = [ch for ch in job.chapters if ch.status == TaskStatus.FAILED]
             if failed_chapters:
+                await asyncio.gather(*mastering, return_exceptions=True)
                 job.status = BatchStatus.FAILED
                 job.error_message = f"{len(failed_chapters)} chapters failed"
                 self._save_job(job)
+                self._record_job_metrics(job)
                 return False
 
-            # Phase 2: Master audio
+            # Phase 2: Finish mastering still in flight
             job.status = BatchStatus.MASTERING
             self._save_job(job)
 
-            logger.info(f"Starting mastering for {job.title}")
-            await self._master_audio(job)
+            logger.info(f"Finishing mastering for {job.title}")
+            await asyncio.gather(*mastering)
 
             # Phase 3: Package final output
             job.status = BatchStatus.PACKAGING
@@ -404,6 +431,7 @@ class BatchProcessor:
             job.total_duration_seconds = total_duration
 
             self._save_job(job)
+            self._record_job_metrics(job)
 
             logger.info(
                 f"Completed job {job.job_id}: {job.title} "
@@ -413,12 +441,24 @@ class BatchProcessor:
             return True
 
         except Exception as e:
+            for pending in mastering:
+                pending.cancel()
             job.status = BatchStatus.FAILED
             job.error_message = str(e)
             self._save_job(job)
+            self._record_job_metrics(job)
             logger.error(f"Job {job.job_id} failed: {e}")
             return False
 
+    def _record_job_metrics(self, job: BatchJob) -> None:
+        """Count a finished job and its wall-clock time."""
+        self._m_jobs.inc(status=job.status.value)
+        if job.started_at:
+            self._m_job_seconds.observe(
+                (datetime.now() - job.started_at).total_seconds(),
+                status=job.status.value,
+            )
+
     async def _synthesize_chapter(
         self, job: BatchJob, chapter: ChapterProgress
     ) -> bool:
@@ -438,8 +478,16 @@ class BatchProcessor:
             # engine = TTSEngine(voice_profile=job.voice_profile)
             # await engine.synthesize(chapter_text, output_path)
 
+            started = datetime.now()
             await asyncio.sleep(0.5)  # Placeholder
 
+            await asyncio.to_thread(
+                self.orchestrator.durations.record,
+                TaskType.TTS_SYNTHESIS.value,
+                self._chapter_tts_input(job, chapter),
+                (datetime.now() - started).total_seconds(),
+            )
+
             chapter.audio_path = output_path
             # Estimate duration: ~150 words per minute
             chapter.duration_seconds = (chapter.word_count / 150) * 60
@@ -451,21 +499,20 @@ class BatchProcessor:
             logger.error(f"Failed to synthesize chapter {chapter.chapter_num}: {e}")
             return False
 
-    async def _master_audio(self, job: BatchJob) -> None:
-        """Master all chapter audio files."""
-        for ch in job.chapters:
-            if ch.audio_path and ch.audio_path.exists():
-                mastered_path = job.output_dir / "mastered" / ch.audio_path.name
+    async def _master_chapter(self, job: BatchJob, ch: ChapterProgress) -> None:
+        """Master one chapter's audio file."""
+        if ch.audio_path and ch.audio_path.exists():
+            mastered_path = job.output_dir / "mastered" / ch.audio_path.name
 
-                # In production, call audio mastering
-                # from src.audiobook.postprocessing import AudioMastering
-                # mastering = AudioMastering()
-                # await mastering.process(ch.audio_path, mastered_path)
+            # In production, call audio mastering
+            # from src.audiobook.postprocessing import AudioMastering
+            # mastering = AudioMastering()
+            # await mastering.process(ch.audio_path, mastered_path)
 
-                # Placeholder
-                await asyncio.sleep(0.1)
+            # Placeholder
+            await asyncio.sleep(0.1)
 
-                ch.mastered_path = mastered_path
+            ch.mastered_path = mastered_path
 
     async def _package_output(self, job: BatchJob) -> None:
         """Package final audiobook files."""
@@ -522,23 +569,82 @@ class BatchProcessor:
             "error": job.error_message,
         }
 
+    @staticmethod
+    def _chapter_tts_input(job: BatchJob, chapter: ChapterProgress) -> Dict[str, Any]:
+        """Duration-model input for synthesizing a chapter."""
+        return {
+            "text_chars": chapter.word_count * CHARS_PER_WORD,
+            "voice_profile": job.voice_profile,
+        }
+
     def _estimate_completion(self, job: BatchJob) -> Optional[str]:
         """Estimate job completion time."""
         if job.status in (BatchStatus.COMPLETED, BatchStatus.FAILED):
             return None
 
-        # Estimate based on word count (~1 minute per 1000 words for synthesis)
-        remaining_words = sum(
-            ch.word_count
+        # Learned synthesis timings for this voice profile; without history,
+        # ~1 minute per 1000 words plus 2 minutes per chapter overhead
+        estimated_minutes = sum(
+            self.orchestrator.durations.predict_minutes(
+                TaskType.TTS_SYNTHESIS.value,
+                self._chapter_tts_input(job, ch),
+                default=ch.word_count / 1000 + 2,
+            )
             for ch in job.chapters
             if ch.status not in (TaskStatus.COMPLETED,)
         )
-
-        estimated_minutes = remaining_words / 1000 + len(job.chapters) * 2  # +2 per chapter overhead
         completion_time = datetime.now() + timedelta(minutes=estimated_minutes)
 
         return completion_time.isoformat()
 
+    def plan_overnight(
+        self,
+        now: Optional[datetime] = None,
+    ) -> Tuple[OvernightPlan, Dict[str, Optional[datetime]]]:
+        """
+        Overnight plan covering every unfinished job.
+
+        Queued jobs are planned from their orchestrator tasks; jobs that
+        are not queued (created, or being run directly by run_job) from
+        the predicted synthesis time of their remaining chapters.
+
+        Returns:
+            Tuple of (plan, planned finish per job ID; None if the job
+            is finished or runs past the planning horizon)
+        """
+        weight = self.orchestrator.PLAN_VALUE_WEIGHTS[TaskPriority.OVERNIGHT]
+        unfinished = [
+            job for job in self.active_jobs.values()
+            if job.status not in (BatchStatus.COMPLETED, BatchStatus.FAILED)
+        ]
+
+        extra = []
+        for job in unfinished:
+            if job.status == BatchStatus.QUEUED:
+                continue
+            for ch in job.chapters:
+                if ch.status == TaskStatus.COMPLETED:
+                    continue
+                minutes = self.orchestrator.durations.predict_minutes(
+                    TaskType.TTS_SYNTHESIS.value,
+                    self._chapter_tts_input(job, ch),
+                    default=ch.word_count / 1000 + 2,
+                )
+                extra.append(PlanItem(
+                    item_id=f"{job.job_id}/{ch.chapter_id}",
+                    minutes=minutes,
+                    value=weight * max(minutes, 1.0),
+                    group=job.job_id,
+                    priority=TaskPriority.OVERNIGHT.value,
+                ))
+
+        plan = self.orchestrator.plan_overnight(now=now, extra_items=extra)
+        finish = plan.group_finish()
+        return plan, {
+            job.job_id: finish.get(job.book_id if job.status == BatchStatus.QUEUED else job.job_id)
+            for job in unfinished
+        }
+
     def list_jobs(self) -> List[Dict[str, Any]]:
         """List all active jobs."""
         return [
@@ -0,0 +1,681 @@
+"""
+GPU Scheduler Benchmark
+
+Replays synthetic (or recorded) task workloads against GPUOrchestrator
+on a virtual clock: tasks "run" by sleeping for their true duration plus
+any model load their scheduling caused, but asyncio time is simulated,
+so an overnight queue replays in seconds and runs are reproducible.
+
+Reports makespan, VRAM utilization (VRAM-seconds reserved over
+VRAM-seconds available), queue wait percentiles, model switches and
+preemptions as JSON. With --baseline, exits non-zero when
+a metric regresses past the tolerance, so scheduler changes can be
+checked before they ship.
+
+Usage:
+    python -m src.automation.benchmark --output bench.json
+    python -m src.automation.benchmark --baseline bench.json --tolerance 0.05
+    python -m src.automation.benchmark --replay gpu_tasks/tasks.db
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import selectors
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, TypeVar, TypeVarTuple, Unpack
+
+from .gpu_orchestrator import GPUTask, TaskType, TaskPriority
+from .gpu_simulator import SimulatedGPUOrchestrator
+from .scheduling_policy import ModelResidency, ResidencyAwarePolicy, StrictPriorityPolicy
+from .duration_model import DurationModel, CHARS_PER_WORD
+from .task_store import TaskStore
+from .metrics import percentile
+
+_T = TypeVar("_T")
+_Ts = TypeVarTuple("_Ts")
+
+
+# ---------------------------------------------------------------------------
+# Virtual clock
+# ---------------------------------------------------------------------------
+
+class _VirtualTimeSelector(selectors.DefaultSelector):
+    """Selector that jumps the loop's clock forward instead of sleeping."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loop: Optional["VirtualClockLoop"] = None
+
+    def select(self, timeout: Optional[float] = None) -> list:
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if self.loop is None:  # Not attached yet: behave like a real selector
+            return super().select(timeout)
+        if self.loop.executor_jobs:
+            # Thread work (to_thread persistence, telemetry) takes real
+            # time; hold the virtual clock until it reports back
+            return super().select(0.05)
+        if timeout is None:
+            return super().select(None)
+        self.loop.advance(timeout)
+        return []
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop whose time() is simulated.
+
+    Timers (asyncio.sleep, wait timeouts) fire in order without real
+    waiting: when nothing is ready, the clock advances straight to the
+    next timer. It never advances while run_in_executor work is
+    outstanding, so thread offloads complete at the virtual instant they
+    were started.
+    """
+
+    def __init__(self) -> None:
+        selector = _VirtualTimeSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self._virtual_now = 0.0
+        self.executor_jobs = 0
+
+    def time(self) -> float:
+        return self._virtual_now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self._virtual_now += max(0.0, seconds)
+
+    def run_in_executor(
+        self, executor: Any, func: Callable[[Unpack[_Ts]], _T], *args: Unpack[_Ts],
+    ) -> "asyncio.Future[_T]":
+        future = super().run_in_executor(executor, func, *args)
+        self.executor_jobs += 1
+
+        def done(_: asyncio.Future) -> None:
+            self.executor_jobs -= 1
+
+        future.add_done_callback(done)
+        return future
+
+
+def run_virtual(coro: Any) -> Any:
+    """Run a coroutine to completion on a VirtualClockLoop."""
+    loop = VirtualClockLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SyntheticTask:
+    """One task in a replayable workload."""
+    arrival_seconds: float
+    task_type: TaskType
+    priority: TaskPriority
+    true_seconds: float  # What the task really takes
+    estimated_minutes: int  # What the scheduler is told
+    input_data: Dict[str, Any] = field(default_factory=dict)
+    depends_on: List[int] = field(default_factory=list)  # Indices of earlier tasks
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "arrival_seconds": round(self.arrival_seconds, 3),
+            "task_type": self.task_type.value,
+            "priority": self.priority.value,
+            "true_seconds": round(self.true_seconds, 3),
+            "estimated_minutes": self.estimated_minutes,
+            "input_data": self.input_data,
+            "depends_on": self.depends_on,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SyntheticTask":
+        """Create from dictionary."""
+        return cls(
+            arrival_seconds=data["arrival_seconds"],
+            task_type=TaskType(data["task_type"]),
+            priority=TaskPriority(data["priority"]),
+            true_seconds=data["true_seconds"],
+            estimated_minutes=data["estimated_minutes"],
+            input_data=data.get("input_data", {}),
+            depends_on=list(data.get("depends_on", [])),
+        )
+
+
+def save_workload(tasks: List[SyntheticTask], path: Path) -> None:
+    """Write a workload as JSON (for replaying the exact same mix later)."""
+    path.write_text(json.dumps([t.to_dict() for t in tasks], indent=1))
+
+
+def load_workload(path: Path) -> List[SyntheticTask]:
+    """Read a workload written by save_workload."""
+    return [SyntheticTask.from_dict(d) for d in json.loads(path.read_text())]
+
+
+class WorkloadGenerator:
+    """
+    Synthetic task mixes with realistic size distributions.
+
+    Sizes are log-normal around production medians: chapters of ~4,500
+    words synthesized at ~0.3x real time, 1024px cover renders plus
+    upscale, companion-content LLM batches at ~25 tokens/s, and short
+    per-chapter mastering passes. Estimates given to the scheduler are
+    the true durations with log-normal error, as learned estimates are.
+    """
+
+    SPEECH_WORDS_PER_MINUTE = 150
+    TTS_REAL_TIME_FACTOR = 0.3
+    LLM_TOKENS_PER_SECOND = 25.0
+
+    def __init__(self, seed: int = 0, estimate_error: float = 0.25) -> None:
+        """
+        Initialize generator.
+
+        Args:
+            seed: Random seed
+            estimate_error: Sigma of the log-normal estimate error
+        """
+        self.rng = random.Random(seed)
+        self.estimate_error = estimate_error
+        self.tasks: List[SyntheticTask] = []
+
+    def _add(
+        self,
+        at: float,
+        task_type: TaskType,
+        priority: TaskPriority,
+        true_seconds: float,
+        input_data: Dict[str, Any],
+        depends_on: Optional[List[int]] = None,
+    ) -> int:
+        estimate = true_seconds * self.rng.lognormvariate(0.0, self.estimate_error)
+        self.tasks.append(SyntheticTask(
+            arrival_seconds=at,
+            task_type=task_type,
+            priority=priority,
+            true_seconds=true_seconds,
+            estimated_minutes=max(1, math.ceil(estimate / 60)),
+            input_data=input_data,
+            depends_on=depends_on or [],
+        ))
+        return len(self.tasks) - 1
+
+    def audiobook(self, at: float, priority: TaskPriority = TaskPriority.NORMAL) -> None:
+        """One book: chapter synthesis, each followed by its mastering."""
+        book = f"book_{len(self.tasks)}"
+        for i in range(self.rng.randint(12, 40)):
+            words = int(self.rng.lognormvariate(math.log(4500), 0.45))
+            audio_seconds = words / self.SPEECH_WORDS_PER_MINUTE * 60
+            tts = self._add(at, TaskType.TTS_SYNTHESIS, priority, audio_seconds * self.TTS_REAL_TIME_FACTOR, {
+                "book_id": book,
+                "chapter_index": i,
+                "text_chars": words * CHARS_PER_WORD,
+            })
+            self._add(at, TaskType.AUDIO_MASTERING, priority, 30 + audio_seconds * 0.02, {
+                "book_id": book,
+                "chapter_index": i,
+            }, depends_on=[tts])
+
+    def covers(self, at: float, priority: TaskPriority = TaskPriority.NORMAL) -> None:
+        """Cover-art variations for one title."""
+        book = f"book_{len(self.tasks)}"
+        for i in range(self.rng.choice([2, 4, 4, 8])):
+            self._add(at, TaskType.IMAGE_GENERATION, priority, self.rng.uniform(40, 90), {
+                "book_id": book,
+                "variation": i,
+                "width": 3000,
+                "height": 3000,
+            })
+
+    def companion(self, at: float, priority: TaskPriority = TaskPriority.LOW) -> None:
+        """Batched companion-content LLM tasks."""
+        for _ in range(self.rng.randint(1, 4)):
+            tokens = int(self.rng.lognormvariate(math.log(6000), 0.6))
+            self._add(at, TaskType.LLM_INFERENCE, priority, tokens / self.LLM_TOKENS_PER_SECOND, {
+                "prompt_tokens": tokens // 4,
+                "max_tokens": tokens,
+            })
+
+    def retake(self, at: float) -> None:
+        """Urgent single-chapter re-synthesis."""
+        words = int(self.rng.lognormvariate(math.log(3000), 0.4))
+        seconds = words / self.SPEECH_WORDS_PER_MINUTE * 60 * self.TTS_REAL_TIME_FACTOR
+        self._add(at, TaskType.TTS_SYNTHESIS, TaskPriority.CRITICAL, seconds, {
+            "book_id": "retake",
+            "text_chars": words * CHARS_PER_WORD,
+        })
+
+    def mix(self, name: str, hours: float = 8.0) -> List[SyntheticTask]:
+        """
+        Build a named mix.
+
+        Args:
+            name: "overnight" (books queued up front), "mixed" (Poisson
+                arrivals of every kind of job) or "burst" (everything at
+                once, with urgent retakes)
+            hours: Arrival horizon for "mixed"
+
+        Returns:
+            Tasks in arrival order
+        """
+        self.tasks = []
+        if name == "overnight":
+            for _ in range(3):
+                self.audiobook(0.0, TaskPriority.NORMAL)
+            self.covers(0.0)
+            self.companion(0.0)
+        elif name == "mixed":
+            horizon = hours * 3600
+            at = 0.0
+            while True:
+                at += self.rng.expovariate(1 / 1200)  # A job every ~20 minutes
+                if at > horizon:
+                    break
+                kind = self.rng.choices(
+                    ["audiobook", "covers", "companion", "retake"],
+                    weights=[1, 6, 6, 2],
+                )[0]
+                getattr(self, kind)(at)
+        elif name == "burst":
+            for _ in range(2):
+                self.audiobook(0.0, TaskPriority.HIGH)
+            for _ in range(4):
+                self.covers(0.0)
+                self.companion(0.0)
+            for i in range(5):
+                self.retake(600.0 * (i + 1))
+        else:
+            raise ValueError(f"Unknown workload mix: {name}")
+        return list(self.tasks)
+
+
+def workload_from_history(task_dicts: List[Dict[str, Any]]) -> List[SyntheticTask]:
+    """
+    Workload from recorded tasks (e.g. TaskStore.load_completed()).
+
+    Arrivals keep their recorded spacing; true durations are the measured
+    run times, and estimates the ones the scheduler had.
+    """
+    records = sorted(
+        (d for d in task_dicts if d.get("created_at")),
+        key=lambda d: d["created_at"],
+    )
+    if not records:
+        return []
+    t0 = datetime.fromisoformat(records[0]["created_at"])
+    index = {d["task_id"]: i for i, d in enumerate(records)}
+
+    tasks = []
+    for i, d in enumerate(records):
+        estimated = d.get("estimated_duration_minutes") or 1
+        tasks.append(SyntheticTask(
+            arrival_seconds=(datetime.fromisoformat(d["created_at"]) - t0).total_seconds(),
+            task_type=TaskType(d["task_type"]),
+            priority=TaskPriority(d["priority"]),
+            true_seconds=d.get("actual_duration_seconds") or estimated * 60,
+            estimated_minutes=estimated,
+            input_data={k: v for k, v in d.get("input_data", {}).items() if k != "text"},
+            depends_on=[index[dep] for dep in d.get("depends_on") or [] if index.get(dep, i) < i],
+        ))
+    return tasks
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+class _StaticDurations(DurationModel):
+    """Duration model that never learns, so estimates stay as generated."""
+
+    def record(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class _LoadTracker(ModelResidency):
+    """Residency tracker that remembers which model loads are still owed."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.owed: Counter = Counter()
+
+    def load(self, task_type: Any) -> bool:
+        switched = super().load(task_type)
+        if switched:
+            self.owed[task_type] += 1
+        return switched
+
+
+class BenchmarkOrchestrator(SimulatedGPUOrchestrator):
+    """
+    SimulatedGPUOrchestrator driven by a workload on the virtual clock.
+
+    Tasks run for their true duration; the first task of a type started
+    after a model switch also pays that model's load time.
+    """
+
+    def __init__(self, vram_gb: float = 16.0, **kwargs: Any) -> None:
+        """
+        Initialize benchmark orchestrator.
+
+        Args:
+            vram_gb: Simulated card VRAM
+            **kwargs: Passed to SimulatedGPUOrchestrator
+        """
+        kwargs.setdefault("telemetry_interval_seconds", 3600.0)
+        # A window covering the whole day keeps overnight checks out of the run
+        kwargs.setdefault("overnight_start_hour", 0)
+        kwargs.setdefault("overnight_end_hour", 0)
+        super().__init__(vram_gb=vram_gb, time_scale=1.0, **kwargs)
+
+        self.durations = _StaticDurations(self.data_dir / "benchmark_durations.json")
+        self.loads = _LoadTracker(
+            capacity_gb=vram_gb,
+            vram_requirements=self.VRAM_REQUIREMENTS,
+            switch_costs=self.MODEL_SWITCH_SECONDS,
+        )
+        self.residency = self.loads
+        self.true_seconds: Dict[str, float] = {}
+        self.task_types: Dict[str, str] = {}
+        self.arrivals: Dict[str, float] = {}
+        self.first_start: Dict[str, float] = {}
+        self.busy: List[tuple] = []  # (start, end, vram_gb, load_seconds)
+
+    def _now(self) -> float:
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:  # Not replaying yet
+            return 0.0
+
+    async def _execute(self, task: GPUTask) -> None:
+        """Sleep for the model load (if owed) and the task's true duration."""
+        start = self._now()
+        self.first_start.setdefault(task.task_id, start)
+        self._record("start", task)
+
+        load = 0.0
+        if self.loads.owed[task.task_type]:
+            self.loads.owed[task.task_type] -= 1
+            load = self.MODEL_SWITCH_SECONDS.get(task.task_type, 0.0)
+        try:
+            await asyncio.sleep(load)
+            total = self.true_seconds[task.task_id]
+            if task.task_type not in self.PREEMPTIBLE_TYPES:
+                await asyncio.sleep(total)
+                return
+            for chunk in range(task.checkpoint.get("chunk", 0), self.SIMULATED_CHUNKS):
+                await asyncio.sleep(total / self.SIMULATED_CHUNKS)
+                task.progress = (chunk + 1) / self.SIMULATED_CHUNKS
+                self._checkpoint(task, chunk=chunk + 1)
+        finally:
+            self.busy.append((start, self._now(), self.required_vram_gb(task), load))
+            self._record("finish", task)
+
+    def _admit_arrivals(
+        self,
+        workload: List[SyntheticTask],
+        batch: List[int],
+        created: List[Optional[GPUTask]],
+    ) -> None:
+        """Create and enqueue the tasks arriving at one instant."""
+        tasks = []
+        for i in batch:
+            spec = workload[i]
+            task = self._create_task(
+                task_type=spec.task_type,
+                input_data=dict(spec.input_data),
+                output_path=self.data_dir / "outputs" / f"task_{i}.out",
+                priority=spec.priority,
+                estimated_minutes=spec.estimated_minutes,
+                depends_on=[created[d] for d in spec.depends_on],
+            )
+            self.true_seconds[task.task_id] = spec.true_seconds
+            self.task_types[task.task_id] = spec.task_type.value
+            self.arrivals[task.task_id] = spec.arrival_seconds
+            created[i] = task
+            tasks.append(task)
+        self._enqueue(tasks)
+
+    async def replay(self, workload: List[SyntheticTask]) -> None:
+        """Feed the workload at its arrival times and process until done."""
+        created: List[Optional[GPUTask]] = [None] * len(workload)
+        batches: Dict[float, List[int]] = {}
+        for i, spec in enumerate(workload):
+            batches.setdefault(spec.arrival_seconds, []).append(i)
+        arrived = asyncio.Event()
+
+        async def feed() -> None:
+            for at in sorted(batches):
+                await asyncio.sleep(at - self._now())
+                self._admit_arrivals(workload, batches[at], created)
+                self._signal_wakeup()
+                arrived.set()
+
+        self._t0 = self._now()
+        self.events = []
+        feeder = asyncio.create_task(feed())
+        while True:
+            await self.process_queue()
+            if self.task_queue:
+                continue  # Arrived while the loop was shutting down
+            if feeder.done():
+                break
+            arrived.clear()
+            waiter = asyncio.create_task(arrived.wait())
+            await asyncio.wait({feeder, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+        await feeder
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+def _wait_summary(waits: List[float]) -> Dict[str, float]:
+    return {
+        "p50": round(percentile(waits, 0.50), 1),
+        "p90": round(percentile(waits, 0.90), 1),
+        "p95": round(percentile(waits, 0.95), 1),
+        "p99": round(percentile(waits, 0.99), 1),
+        "max": round(max(waits, default=0.0), 1),
+        "mean": round(sum(waits) / len(waits), 1) if waits else 0.0,
+    }
+
+
+POLICIES = {
+    "residency": ResidencyAwarePolicy,
+    "strict": StrictPriorityPolicy,
+}
+
+
+def run_benchmark(
+    workload: List[SyntheticTask],
+    name: str = "custom",
+    policy: str = "residency",
+    vram_gb: float = 16.0,
+    max_concurrent_tasks: int = 2,
+) -> Dict[str, Any]:
+    """
+    Replay a workload and measure the schedule.
+
+    Args:
+        workload: Tasks to replay (see WorkloadGenerator)
+        name: Label for the report
+        policy: Scheduling policy name (see POLICIES)
+        vram_gb: Simulated card VRAM
+        max_concurrent_tasks: Orchestrator concurrency limit
+
+    Returns:
+        Machine-readable report (times in simulated seconds)
+    """
+    wall_start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="gpu_bench_") as tmp:
+        bench = BenchmarkOrchestrator(
+            vram_gb=vram_gb,
+            data_dir=Path(tmp),
+            max_concurrent_tasks=max_concurrent_tasks,
+            scheduling_policy=POLICIES[policy](),
+        )
+        run_virtual(bench.replay(workload))
+        bench.store.close()
+
+    makespan = max((end for _, end, *_ in bench.busy), default=0.0)
+    compute = sum(t.true_seconds for t in workload)
+    load_seconds = sum(load for *_, load in bench.busy)
+    vram_seconds = sum((end - start) * vram for start, end, vram, _ in bench.busy)
+
+    waits_by_type: Dict[str, List[float]] = {}
+    for task_id, started in bench.first_start.items():
+        waits_by_type.setdefault(bench.task_types[task_id], []).append(
+            started - bench.arrivals[task_id]
+        )
+    waits = [w for values in waits_by_type.values() for w in values]
+
+    failed = sum(1 for t in bench.completed_tasks if t.status.value == "failed")
+    return {
+        "benchmark": name,
+        "policy": policy,
+        "vram_gb": vram_gb,
+        "max_concurrent_tasks": max_concurrent_tasks,
+        "workload": {
+            "tasks": len(workload),
+            "by_type": dict(Counter(t.task_type.value for t in workload)),
+            "compute_seconds": round(compute, 1),
+        },
+        "results": {
+            "tasks_completed": len(bench.completed_tasks) - failed,
+            "tasks_failed": failed,
+            "makespan_seconds": round(makespan, 1),
+            # VRAM-seconds reserved over VRAM-seconds available; a busy
+            # fraction would be ~1.0 for any work-conserving policy
+            "vram_utilization": round(vram_seconds / (vram_gb * makespan), 4) if makespan else 0.0,
+            "model_switches": bench.residency.switches,
+            "model_load_seconds": round(load_seconds, 1),
+            "preemptions": bench.preemptions,
+            "queue_wait_seconds": _wait_summary(waits),
+            "queue_wait_seconds_by_type": {
+                task_type: _wait_summary(values) for task_type, values in sorted(waits_by_type.items())
+            },
+            "throughput_tasks_per_hour": round(len(workload) / makespan * 3600, 1) if makespan else 0.0,
+        },
+        "wall_seconds": round(time.perf_counter() - wall_start, 2),
+    }
+
+
+# Metrics checked against a baseline: (path in results, True if higher is worse)
+REGRESSION_METRICS = [
+    ("makespan_seconds", True),
+    ("vram_utilization", False),
+    ("model_switches", True),
+    ("queue_wait_seconds.p95", True),
+]
+
+
+def compare_reports(
+    current: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float = 0.05,
+) -> List[str]:
+    """
+    Regressions of current reports against a baseline run.
+
+    Reports are matched by (benchmark, policy); a metric regresses when
+    it is worse than the baseline by more than tolerance (relative).
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    previous = {(r["benchmark"], r["policy"]): r for r in baseline}
+    regressions = []
+    for report in current:
+        base = previous.get((report["benchmark"], report["policy"]))
+        if base is None:
+            continue
+        for path, higher_is_worse in REGRESSION_METRICS:
+            now_value, base_value = report["results"], base["results"]
+            for key in path.split("."):
+                now_value, base_value = now_value[key], base_value[key]
+            limit = abs(base_value) * tolerance
+            worse = now_value - base_value if higher_is_worse else base_value - now_value
+            if worse > limit and worse > 1e-9:
+                regressions.append(
+                    f"{report['benchmark']}/{report['policy']}: {path} "
+                    f"{base_value} -> {now_value}"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="GPU scheduler benchmark (virtual clock)")
+    parser.add_argument("--mix", action="append", choices=["overnight", "mixed", "burst"],
+                        help="Workload mix (repeatable; default: all)")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES),
+                        help="Scheduling policy (repeatable; default: residency)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--workload", type=Path, help="Replay a saved workload JSON")
+    parser.add_argument("--save-workload", type=Path, help="Write the generated workload(s) here")
+    parser.add_argument("--replay", type=Path, help="Replay completed tasks from a tasks.db")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Fail on regressions against this report")
+    parser.add_argument("--tolerance", type=float, default=0.05)
+    args = parser.parse_args()
+
+    workloads: Dict[str, List[SyntheticTask]] = {}
+    if args.workload:
+        workloads[args.workload.stem] = load_workload(args.workload)
+    elif args.replay:
+        store = TaskStore(args.replay)
+        workloads["replay"] = workload_from_history(store.load_completed())
+        store.close()
+    else:
+        mixes = args.mix or ["overnight", "mixed", "burst"]
+        for mix in mixes:
+            workloads[mix] = WorkloadGenerator(seed=args.seed).mix(mix)
+            if args.save_workload:
+                target = args.save_workload
+                if len(mixes) > 1:
+                    target = target.with_name(f"{target.stem}_{mix}{target.suffix}")
+                save_workload(workloads[mix], target)
+
+    reports = [
+        run_benchmark(workload, name=name, policy=policy, max_concurrent_tasks=args.concurrency)
+        for name, workload in workloads.items()
+        for policy in args.policy or ["residency"]
+    ]
+    output = json.dumps(reports, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    print(output)
+
+    if args.baseline:
+        regressions = compare_reports(
+            reports, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,612 @@
+"""
+Cover Art Production Pipeline
+
+Produces KDP covers without rendering every candidate at full size:
+seeds are swept in batches at a low candidate resolution, candidates are
+scored and perceptual-hashed on the CPU, near-duplicates and weak
+candidates are dropped, and only the selected few are upscaled to the
+final 3000x3000 (an img2img / hires pass from the candidate, so the
+composition that was picked is the one that gets delivered).
+
+Engines are plain objects with a max_batch_size attribute, a blocking
+generate_batch(prompt, negative_prompt, seeds, width, height) returning
+RasterImages, and a blocking upscale(image, width, height, prompt,
+negative_prompt, seed). Optional: a `version` string (part of the cache
+keys) and a `gpu_seconds` counter (reported in stats). FakeImageEngine
+stands in on CPU-only machines.
+"""
+
+import math
+import zlib
+import struct
+import random
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Iterable
+
+from .artifact_cache import ArtifactCache, image_key
+
+logger = logging.getLogger(__name__)
+
+# Called with (stage, done, total); stage is "sweep" or "upscale"
+CoverProgress = Callable[[str, int, int], None]
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@dataclass
+class RasterImage:
+    """8-bit RGB image, rows top to bottom."""
+    width: int
+    height: int
+    pixels: bytes  # width * height * 3
+
+    def pixel(self, x: int, y: int) -> tuple:
+        i = 3 * (y * self.width + x)
+        return self.pixels[i], self.pixels[i + 1], self.pixels[i + 2]
+
+
+def encode_png(image: RasterImage, level: int = 6) -> bytes:
+    """Encode an RGB image as PNG."""
+    stride = image.width * 3
+    raw = b"".join(
+        b"\x00" + image.pixels[y * stride:(y + 1) * stride]
+        for y in range(image.height)
+    )
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", image.width, image.height, 8, 2, 0, 0, 0)
+    return (
+        _PNG_SIGNATURE
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, level))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _unfilter(kind: int, line: bytearray, previous: bytes, bpp: int) -> None:
+    """Reverse one PNG scanline filter in place."""
+    if kind == 1:
+        for i in range(bpp, len(line)):
+            line[i] = (line[i] + line[i - bpp]) & 0xFF
+    elif kind == 2:
+        for i in range(len(line)):
+            line[i] = (line[i] + previous[i]) & 0xFF
+    elif kind == 3:
+        for i in range(len(line)):
+            left = line[i - bpp] if i >= bpp else 0
+            line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+    elif kind == 4:
+        for i in range(len(line)):
+            a = line[i - bpp] if i >= bpp else 0
+            b = previous[i]
+            c = previous[i - bpp] if i >= bpp else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            predictor = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+            line[i] = (line[i] + predictor) & 0xFF
+
+
+def decode_png(data: bytes) -> RasterImage:
+    """
+    Decode an 8-bit, non-interlaced RGB or RGBA PNG (alpha is dropped).
+
+    Raises:
+        ValueError: For other PNG flavours
+    """
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError("Not a PNG file")
+    pos, idat = len(_PNG_SIGNATURE), []
+    width = height = color = 0
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", body)
+            if depth != 8 or color not in (2, 6) or interlace:
+                raise ValueError("Only 8-bit non-interlaced RGB/RGBA PNGs are supported")
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+
+    bpp = 3 if color == 2 else 4
+    stride = width * bpp
+    raw = zlib.decompress(b"".join(idat))
+    rows, previous = [], bytes(stride)
+    for y in range(height):
+        start = y * (stride + 1)
+        line = bytearray(raw[start + 1:start + 1 + stride])
+        _unfilter(raw[start], line, previous, bpp)
+        previous = bytes(line)
+        rows.append(previous if bpp == 3 else b"".join(
+            previous[i:i + 3] for i in range(0, stride, 4)
+        ))
+    return RasterImage(width, height, b"".join(rows))
+
+
+def resize_nearest(image: RasterImage, width: int, height: int) -> RasterImage:
+    """Nearest-neighbour resize (repeated source rows are built once)."""
+    columns = [3 * (x * image.width // width) for x in range(width)]
+    stride = image.width * 3
+    built: Dict[int, bytes] = {}
+    rows = []
+    for y in range(height):
+        source = y * image.height // height
+        if source not in built:
+            row = image.pixels[source * stride:(source + 1) * stride]
+            built[source] = b"".join(row[c:c + 3] for c in columns)
+        rows.append(built[source])
+    return RasterImage(width, height, b"".join(rows))
+
+
+def luminance_grid(image: RasterImage, columns: int, rows: int, samples: int = 4) -> List[List[float]]:
+    """
+    Mean luminance of a columns x rows grid of cells.
+
+    Each cell is averaged over samples x samples evenly spaced pixels, so
+    the cost does not grow with the image size.
+    """
+    grid = []
+    for gy in range(rows):
+        row = []
+        for gx in range(columns):
+            total = 0.0
+            for sy in range(samples):
+                y = int((gy + (sy + 0.5) / samples) * image.height / rows)
+                for sx in range(samples):
+                    x = int((gx + (sx + 0.5) / samples) * image.width / columns)
+                    r, g, b = image.pixel(x, y)
+                    total += 0.299 * r + 0.587 * g + 0.114 * b
+            row.append(total / (samples * samples))
+        grid.append(row)
+    return grid
+
+
+def dhash(image: RasterImage, size: int = 8) -> int:
+    """Difference hash: size*size bits of left-to-right luminance gradients."""
+    grid = luminance_grid(image, size + 1, size)
+    bits = 0
+    for row in grid:
+        for x in range(size):
+            bits = (bits << 1) | (row[x] > row[x + 1])
+    return bits
+
+
+def hamming(a: int, b: int) -> int:
+    """Differing bits between two hashes."""
+    return bin(a ^ b).count("1")
+
+
+def score_image(image: RasterImage, title_band: float = 0.25) -> float:
+    """
+    Cheap CPU quality score in [0, 1].
+
+    Rewards global contrast and colourfulness (flat or washed-out renders
+    score low) and a calm band at the top where the title is set.
+    """
+    size = 24
+    lum = luminance_grid(image, size, size, samples=2)
+    values = [v for row in lum for v in row]
+    mean = sum(values) / len(values)
+    contrast = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values)) / 128
+
+    # Hasler-Suesstrunk colourfulness on a sparse sample
+    rg, yb = [], []
+    step_x, step_y = max(1, image.width // 32), max(1, image.height // 32)
+    for y in range(0, image.height, step_y):
+        for x in range(0, image.width, step_x):
+            r, g, b = image.pixel(x, y)
+            rg.append(r - g)
+            yb.append((r + g) / 2 - b)
+
+    def spread(vals: List[float]) -> tuple:
+        m = sum(vals) / len(vals)
+        return m, math.sqrt(sum((v - m) ** 2 for v in vals) / len(vals))
+
+    (m_rg, s_rg), (m_yb, s_yb) = spread(rg), spread(yb)
+    colourful = (math.hypot(s_rg, s_yb) + 0.3 * math.hypot(m_rg, m_yb)) / 110
+
+    band = lum[:max(1, int(size * title_band))]
+    edges = [abs(row[x] - row[x + 1]) for row in band for x in range(size - 1)]
+    calm = 1 - min(1.0, (sum(edges) / len(edges)) / 40)
+
+    return round(0.4 * min(1.0, contrast) + 0.35 * min(1.0, colourful) + 0.25 * calm, 4)
+
+
+class FakeImageEngine:
+    """
+    Deterministic CPU engine for tests and simulations.
+
+    Renders soft colour blobs from the seed; some seeds deliberately
+    land on a neighbour's composition (as real samplers often do), so
+    duplicate filtering has something to catch. GPU time is modelled,
+    not spent: gpu_seconds accumulates what an SDXL-class model on the
+    target card would take.
+    """
+
+    # Seconds per 1024x1024 image, and the exponent on pixel count
+    BASE_SECONDS = 5.0
+    PIXEL_EXPONENT = 1.15
+    UPSCALE_SECONDS = 12.0
+
+    def __init__(self, max_batch_size: int = 4, duplicate_rate: float = 0.25) -> None:
+        """
+        Initialize fake engine.
+
+        Args:
+            max_batch_size: Images per generate_batch call
+            duplicate_rate: Chance a seed reuses a neighbour's composition
+        """
+        self.max_batch_size = max_batch_size
+        self.duplicate_rate = duplicate_rate
+        self.version = "fake-blobs-1"
+        self.gpu_seconds = 0.0
+        self.images_generated = 0
+        self.upscales = 0
+
+    @classmethod
+    def render_seconds(cls, width: int, height: int) -> float:
+        """Modelled GPU time for one image at the given size."""
+        return cls.BASE_SECONDS * (width * height / 1024 ** 2) ** cls.PIXEL_EXPONENT
+
+    def _render(self, seed: int, width: int, height: int) -> RasterImage:
+        rng = random.Random(seed)
+        base = seed
+        if rng.random() < self.duplicate_rate:
+            base = seed - 1 - rng.randrange(2)
+        layout = random.Random(base)
+
+        blobs = [
+            (layout.random(), layout.random(), layout.uniform(0.15, 0.45),
+             [layout.randrange(256) for _ in range(3)])
+            for _ in range(layout.randint(2, 5))
+        ]
+        background = [layout.randrange(64) for _ in range(3)]
+
+        grid = 32
+        pixels = bytearray()
+        for gy in range(grid):
+            for gx in range(grid):
+                x, y = (gx + 0.5) / grid, (gy + 0.5) / grid
+                colour: List[float] = [float(c) for c in background]
+                for bx, by, radius, rgb in blobs:
+                    weight = math.exp(-((x - bx) ** 2 + (y - by) ** 2) / (2 * radius ** 2))
+                    colour = [c + (t - c) * weight for c, t in zip(colour, rgb)]
+                jitter = rng.uniform(-6, 6)  # Per-seed grain
+                pixels.extend(max(0, min(255, int(c + jitter))) for c in colour)
+        return resize_nearest(RasterImage(grid, grid, bytes(pixels)), width, height)
+
+    def generate_batch(
+        self,
+        prompt: str,
+        negative_prompt: str,
+        seeds: List[int],
+        width: int,
+        height: int,
+    ) -> List[RasterImage]:
+        """Render one image per seed."""
+        self.gpu_seconds += len(seeds) * self.render_seconds(width, height)
+        self.images_generated += len(seeds)
+        return [self._render(seed, width, height) for seed in seeds]
+
+    def upscale(
+        self,
+        image: RasterImage,
+        width: int,
+        height: int,
+        prompt: str = "",
+        negative_prompt: str = "",
+        seed: int = 0,
+    ) -> RasterImage:
+        """Upscale a candidate to the final size."""
+        self.gpu_seconds += self.UPSCALE_SECONDS
+        self.upscales += 1
+        return resize_nearest(image, width, height)
+
+
+@dataclass
+class CoverCandidate:
+    """One low-resolution sweep result."""
+    seed: int
+    score: float
+    phash: int
+    path: Optional[Path] = None
+    image: Optional[RasterImage] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "seed": self.seed,
+            "score": self.score,
+            "phash": f"{self.phash:016x}",
+            "path": str(self.path) if self.path else None,
+        }
+
+
+@dataclass
+class CoverResult:
+    """Outcome of one cover production run."""
+    covers: List[Path]
+    selected: List[CoverCandidate]
+    candidates: int
+    duplicates_dropped: int
+    low_score_dropped: int
+    gpu_seconds: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "covers": [str(p) for p in self.covers],
+            "selected": [c.to_dict() for c in self.selected],
+            "candidates": self.candidates,
+            "duplicates_dropped": self.duplicates_dropped,
+            "low_score_dropped": self.low_score_dropped,
+            "gpu_seconds": round(self.gpu_seconds, 1) if self.gpu_seconds is not None else None,
+            "gpu_seconds_per_cover": (
+                round(self.gpu_seconds / len(self.covers), 1)
+                if self.gpu_seconds is not None and self.covers else None
+            ),
+        }
+
+
+class CoverArtPipeline:
+    """
+    Seed sweep, CPU selection, selective upscale.
+
+    Features:
+    - Candidates rendered at candidate_size in engine.max_batch_size batches
+    - Scoring and perceptual hashing off the event loop, on the CPU
+    - Near-duplicates (dHash within hash_distance bits of a better
+      candidate) and candidates under min_score are dropped
+    - Only the kept candidates are upscaled to the final size
+    - Candidates and upscales cached by prompt, seed and size
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        candidate_size: int = 512,
+        final_size: tuple[int, int] = (3000, 3000),
+        hash_distance: int = 10,
+        min_score: float = 0.2,
+        cache: Optional[ArtifactCache] = None,
+    ) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            engine: Image engine (see module docstring)
+            candidate_size: Edge length of sweep renders
+            final_size: Delivered cover size (KDP: 3000x3000 or larger)
+            hash_distance: dHash bit distance treated as a duplicate
+            min_score: Candidates scoring lower are never selected
+            cache: Artifact cache for candidates and upscales
+        """
+        self.engine = engine
+        self.candidate_size = candidate_size
+        self.final_size = final_size
+        self.hash_distance = hash_distance
+        self.min_score = min_score
+        self.cache = cache
+
+        self.candidates_rendered = 0
+        self.candidates_cached = 0
+        self.duplicates_dropped = 0
+        self.low_score_dropped = 0
+        self.upscales_rendered = 0
+        self.upscales_cached = 0
+        self.covers_produced = 0
+
+    @property
+    def _engine_version(self) -> str:
+        return str(getattr(self.engine, "version", type(self.engine).__name__))
+
+    def _key(
+        self,
+        prompt: str,
+        negative_prompt: str,
+        seed: int,
+        size: tuple[int, int],
+        stage: str,
+        candidate_size: int,
+    ) -> str:
+        return image_key(
+            prompt, negative_prompt, seed, size[0], size[1],
+            stage=stage, engine=self._engine_version, candidate_size=candidate_size,
+        )
+
+    @staticmethod
+    def _evaluate(seed: int, image: RasterImage) -> CoverCandidate:
+        return CoverCandidate(seed=seed, score=score_image(image), phash=dhash(image), image=image)
+
+    async def _sweep(
+        self,
+        prompt: str,
+        negative_prompt: str,
+        seeds: List[int],
+        size: int,
+        candidate_dir: Optional[Path],
+        on_progress: Optional[CoverProgress],
+    ) -> List[CoverCandidate]:
+        """Render (or restore) and evaluate every seed's candidate."""
+        images: Dict[int, RasterImage] = {}
+
+        def key(seed: int) -> str:
+            return self._key(prompt, negative_prompt, seed, (size, size), "candidate", size)
+
+        if self.cache is not None:
+            for seed in seeds:
+                data = await asyncio.to_thread(self.cache.get, key(seed), ".png")
+                if data is not None:
+                    images[seed] = await asyncio.to_thread(decode_png, data)
+                    self.candidates_cached += 1
+
+        pending = [s for s in seeds if s not in images]
+        batch = max(1, self.engine.max_batch_size)
+        for start in range(0, len(pending), batch):
+            group = pending[start:start + batch]
+            rendered = await asyncio.to_thread(
+                self.engine.generate_batch, prompt, negative_prompt, group, size, size
+            )
+            if len(rendered) != len(group):
+                raise RuntimeError(f"Engine returned {len(rendered)} images for {len(group)} seeds")
+            for seed, image in zip(group, rendered):
+                images[seed] = image
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, key(seed), encode_png(image), ".png")
+            self.candidates_rendered += len(group)
+            if on_progress:
+                on_progress("sweep", len(images), len(seeds))
+
+        candidates = []
+        for seed in seeds:
+            candidate = await asyncio.to_thread(self._evaluate, seed, images[seed])
+            if candidate_dir is not None:
+                candidate.path = candidate_dir / f"seed_{seed}.png"
+                await asyncio.to_thread(_write_png, candidate.path, images[seed])
+            candidates.append(candidate)
+        return candidates
+
+    def select(self, candidates: Iterable[CoverCandidate], keep: int) -> tuple:
+        """
+        Best-scoring distinct candidates.
+
+        Returns:
+            Tuple of (selected, duplicates dropped, low scores dropped)
+        """
+        selected: List[CoverCandidate] = []
+        duplicates = low = 0
+        for candidate in sorted(candidates, key=lambda c: (-c.score, c.seed)):
+            if candidate.score < self.min_score:
+                low += 1
+                continue
+            if any(hamming(candidate.phash, s.phash) <= self.hash_distance for s in selected):
+                duplicates += 1
+                continue
+            if len(selected) < keep:
+                selected.append(candidate)
+        return selected, duplicates, low
+
+    async def produce(
+        self,
+        prompt: str,
+        negative_prompt: str,
+        output_dir: Path,
+        candidates: int = 16,
+        keep: int = 2,
+        seed: int = 0,
+        name: str = "cover",
+        keep_candidates: bool = True,
+        candidate_size: Optional[int] = None,
+        final_size: Optional[tuple[int, int]] = None,
+        on_progress: Optional[CoverProgress] = None,
+    ) -> CoverResult:
+        """
+        Produce covers for one prompt.
+
+        Args:
+            prompt: Generation prompt
+            negative_prompt: Negative prompt
+            output_dir: Where covers (and candidates/) are written
+            candidates: Seeds to sweep (seed .. seed + candidates - 1)
+            keep: Covers to deliver
+            seed: First seed
+            name: Cover file name prefix
+            keep_candidates: Also write the low-res candidates for review
+            candidate_size: Override the sweep render size
+            final_size: Override the delivered cover size
+            on_progress: Called after every sweep batch and upscale
+
+        Returns:
+            CoverResult (may hold fewer than keep covers if too few
+            distinct candidates pass min_score)
+        """
+        gpu_before = getattr(self.engine, "gpu_seconds", None)
+        candidate_size = candidate_size or self.candidate_size
+        final_size = final_size or self.final_size
+        seeds = list(range(seed, seed + candidates))
+        candidate_dir = output_dir / "candidates" if keep_candidates else None
+        swept = await self._sweep(
+            prompt, negative_prompt, seeds, candidate_size, candidate_dir, on_progress
+        )
+
+        selected, duplicates, low = self.select(swept, keep)
+        self.duplicates_dropped += duplicates
+        self.low_score_dropped += low
+        logger.info(
+            f"Cover sweep: {len(swept)} candidates, {duplicates} near-duplicates, "
+            f"{low} below score {self.min_score}, upscaling {len(selected)}"
+        )
+
+        width, height = final_size
+        covers = []
+        for n, candidate in enumerate(selected, 1):
+            path = output_dir / f"{name}_{n}.png"
+            key = self._key(
+                prompt, negative_prompt, candidate.seed, final_size, "upscale", candidate_size
+            )
+            restored = self.cache is not None and await asyncio.to_thread(
+                self.cache.restore, key, path, ".png"
+            )
+            if restored:
+                self.upscales_cached += 1
+            else:
+                image = await asyncio.to_thread(
+                    self.engine.upscale, candidate.image, width, height,
+                    prompt, negative_prompt, candidate.seed,
+                )
+                data = await asyncio.to_thread(encode_png, image)
+                await asyncio.to_thread(_write_bytes, path, data)
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, key, data, ".png")
+                self.upscales_rendered += 1
+            covers.append(path)
+            if on_progress:
+                on_progress("upscale", n, len(selected))
+
+        for candidate in swept:
+            candidate.image = None  # Don't hold pixel data in the result
+        self.covers_produced += len(covers)
+
+        gpu_after = getattr(self.engine, "gpu_seconds", None)
+        return CoverResult(
+            covers=covers,
+            selected=selected,
+            candidates=len(swept),
+            duplicates_dropped=duplicates,
+            low_score_dropped=low,
+            gpu_seconds=gpu_after - gpu_before if gpu_before is not None else None,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Pipeline counters."""
+        gpu = getattr(self.engine, "gpu_seconds", None)
+        return {
+            "candidates_rendered": self.candidates_rendered,
+            "candidates_cached": self.candidates_cached,
+            "duplicates_dropped": self.duplicates_dropped,
+            "low_score_dropped": self.low_score_dropped,
+            "upscales_rendered": self.upscales_rendered,
+            "upscales_cached": self.upscales_cached,
+            "covers_produced": self.covers_produced,
+            "gpu_seconds_per_cover": (
+                round(gpu / self.covers_produced, 1)
+                if gpu is not None and self.covers_produced else None
+            ),
+        }
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _write_png(path: Path, image: RasterImage) -> None:
+    _write_bytes(path, encode_png(image, level=1))
@@ -0,0 +1,252 @@
+"""
+Learned Task Duration Model
+
+Records actual GPU task timings and fits, per task type and profile
+(voice profile for TTS, model for LLM), a linear regression of
+seconds against task size (characters of text, megapixels, prompt
+characters). Predictions replace the fixed per-type guesses used for
+ETAs and let the scheduler check whether a task fits before the
+overnight window closes.
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Average characters per word in English prose (including the space)
+CHARS_PER_WORD = 5.7
+
+
+def work_units(task_type: str, input_data: Dict[str, Any]) -> float:
+    """
+    Size of a task in its type's natural unit.
+
+    Args:
+        task_type: TaskType value ("tts", "image", "llm", ...)
+        input_data: GPUTask input data
+
+    Returns:
+        Characters for TTS/LLM (requested tokens for batched LLM tasks),
+        megapixels for images (sweep renders plus upscales for cover
+        sweeps), 1.0 otherwise
+    """
+    if task_type == "tts":
+        if "text_chars" in input_data:
+            return float(input_data["text_chars"])
+        return float(len(input_data.get("text", "")))
+    if task_type == "image":
+        pixels = input_data.get("width", 1024) * input_data.get("height", 1024)
+        if "candidates" in input_data:  # Seed sweep plus upscales
+            pixels = (
+                input_data["candidates"] * input_data.get("candidate_size", 512) ** 2
+                + input_data.get("keep", 1) * pixels
+            )
+        return pixels / 1_000_000
+    if task_type == "llm":
+        if "max_tokens_list" in input_data:
+            return float(sum(input_data["max_tokens_list"]))
+        return float(len(input_data.get("prompt", "")) or input_data.get("max_tokens", 1))
+    return 1.0
+
+
+def work_profile(task_type: str, input_data: Dict[str, Any]) -> str:
+    """Profile that changes throughput within a task type."""
+    if task_type == "tts":
+        return str(input_data.get("voice_profile", "*"))
+    if task_type == "llm":
+        return str(input_data.get("model", "*"))
+    if task_type == "image" and "candidates" in input_data:
+        return "sweep"
+    return "*"
+
+
+@dataclass
+class RegressionStats:
+    """Exponentially decayed sufficient statistics for y = a + b*x."""
+    n: float = 0.0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+    samples: int = 0
+
+    def update(self, x: float, y: float, decay: float) -> None:
+        """Fold one observation in, down-weighting older ones."""
+        self.n = self.n * decay + 1
+        self.sum_x = self.sum_x * decay + x
+        self.sum_y = self.sum_y * decay + y
+        self.sum_xx = self.sum_xx * decay + x * x
+        self.sum_xy = self.sum_xy * decay + x * y
+        self.samples += 1
+
+    def coefficients(self) -> tuple[float, float]:
+        """
+        Fitted (intercept, slope).
+
+        Falls back to a through-origin rate when the sizes seen so far
+        are too similar to separate fixed overhead from per-unit cost.
+        """
+        denom = self.n * self.sum_xx - self.sum_x ** 2
+        if self.n >= 2 and denom > 1e-9 * max(self.n * self.sum_xx, 1.0):
+            slope = (self.n * self.sum_xy - self.sum_x * self.sum_y) / denom
+            intercept = (self.sum_y - slope * self.sum_x) / self.n
+            if slope >= 0 and intercept >= 0:
+                return intercept, slope
+        if self.sum_x > 0:
+            return 0.0, self.sum_y / self.sum_x
+        return self.sum_y / self.n if self.n else 0.0, 0.0
+
+    def predict(self, x: float) -> float:
+        """Predicted seconds for a task of size x."""
+        intercept, slope = self.coefficients()
+        return max(intercept + slope * x, 0.0)
+
+
+class DurationModel:
+    """
+    Per (task type, profile) duration regressions.
+
+    Features:
+    - O(1) update per completed task, no timing history retained
+    - Recent timings weighted more (decay) so driver/model changes show up
+    - Falls back from (type, profile) to the type-wide model, then to None
+    - Persisted as a small JSON file, written atomically
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        min_samples: int = 3,
+        decay: float = 0.98,
+    ) -> None:
+        """
+        Initialize duration model.
+
+        Args:
+            path: JSON file for persistence (None keeps it in memory)
+            min_samples: Timings needed before a model is used
+            decay: Weight kept by older timings per new one
+        """
+        self.path = path
+        self.min_samples = min_samples
+        self.decay = decay
+        self._models: Dict[str, RegressionStats] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(task_type: str, profile: str) -> str:
+        return f"{task_type}/{profile}"
+
+    def _load(self) -> None:
+        """Load persisted statistics."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self._models = {
+                key: RegressionStats(**stats) for key, stats in data.get("models", {}).items()
+            }
+        except Exception as e:
+            logger.error(f"Failed to load duration model: {e}")
+
+    def save(self) -> None:
+        """Write statistics to disk (atomic replace)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {"models": {key: asdict(stats) for key, stats in self._models.items()}}
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def record(
+        self,
+        task_type: str,
+        input_data: Dict[str, Any],
+        seconds: float,
+        save: bool = True,
+    ) -> None:
+        """
+        Record an actual task timing.
+
+        Args:
+            task_type: TaskType value
+            input_data: Task input data (sizes and profile are read from it)
+            seconds: Wall-clock duration
+            save: Persist immediately
+        """
+        units = work_units(task_type, input_data)
+        profile = work_profile(task_type, input_data)
+
+        with self._lock:
+            keys = {self._key(task_type, profile), self._key(task_type, "*")}
+            for key in keys:
+                self._models.setdefault(key, RegressionStats()).update(units, seconds, self.decay)
+
+        if save:
+            try:
+                self.save()
+            except Exception as e:
+                logger.warning(f"Failed to save duration model: {e}")
+
+    def _model_for(self, task_type: str, profile: str) -> Optional[RegressionStats]:
+        """Most specific model with enough samples."""
+        for key in (self._key(task_type, profile), self._key(task_type, "*")):
+            stats = self._models.get(key)
+            if stats and stats.samples >= self.min_samples:
+                return stats
+        return None
+
+    def predict_seconds(
+        self,
+        task_type: str,
+        input_data: Dict[str, Any],
+    ) -> Optional[float]:
+        """
+        Predict a task's duration.
+
+        Returns:
+            Seconds, or None if there is not enough history
+        """
+        with self._lock:
+            stats = self._model_for(task_type, work_profile(task_type, input_data))
+            if stats is None:
+                return None
+            return stats.predict(work_units(task_type, input_data))
+
+    def predict_minutes(
+        self,
+        task_type: str,
+        input_data: Dict[str, Any],
+        default: float,
+    ) -> float:
+        """Predicted minutes, or default when there is no usable model."""
+        seconds = self.predict_seconds(task_type, input_data)
+        return default if seconds is None else seconds / 60
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Fitted models for status reporting."""
+        with self._lock:
+            result = {}
+            for key, stats in sorted(self._models.items()):
+                intercept, slope = stats.coefficients()
+                result[key] = {
+                    "samples": stats.samples,
+                    "overhead_seconds": round(intercept, 2),
+                    "seconds_per_unit": round(slope, 6),
+                }
+            return result
@@ -0,0 +1,331 @@
+"""
+Task Executor Backends
+
+Pluggable execution for GPU tasks. SubprocessBackend keeps one
+persistent worker process per model type, so blocking XTTS/SDXL calls
+never stall the orchestrator's event loop and leaked model memory is
+reclaimed by restarting the worker after N tasks or once its RSS
+crosses a threshold.
+
+Worker protocol (multiprocessing Pipe):
+    parent -> worker   ("run", task_dict)
+    worker -> parent   ("progress", fraction)          zero or more
+                       ("ok", result, shm_name, size, rss_bytes)
+                       ("error", message, rss_bytes)
+
+Handlers are plain functions referenced as "module:function" (so they
+can be imported under the spawn start method). A handler takes the task
+dict plus a progress callback and returns a result dict; bytes under
+"payload" (rendered audio/image) are returned through a shared-memory
+block instead of being pickled through the pipe.
+"""
+
+import io
+import os
+import sys
+import wave
+import asyncio
+import logging
+import importlib
+import multiprocessing
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+from .gpu_orchestrator import GPUTask
+
+logger = logging.getLogger(__name__)
+
+# Handler signature: (task_dict, report_progress) -> result dict
+TaskHandler = Callable[[Dict[str, Any], Callable[[float], None]], Dict[str, Any]]
+
+
+def _current_rss_bytes() -> int:
+    """Resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _load_handler(path: str) -> TaskHandler:
+    """Import a "module:function" handler."""
+    module_name, _, func_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _shm_view(shm: shared_memory.SharedMemory) -> memoryview:
+    """Mapped buffer of an open shared memory block."""
+    if shm.buf is None:
+        raise RuntimeError(f"Shared memory {shm.name} is closed")
+    return shm.buf
+
+
+def _worker_main(conn: Any, handler_path: str) -> None:
+    """Worker process loop: run tasks until the pipe closes."""
+    handler = _load_handler(handler_path)
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message[0] != "run":
+            break
+
+        try:
+            result = handler(message[1], lambda p: conn.send(("progress", float(p))))
+            payload = result.pop("payload", None)
+            shm_name, size = None, 0
+            if payload:
+                size = len(payload)
+                shm = shared_memory.SharedMemory(create=True, size=size)
+                _shm_view(shm)[:size] = payload
+                shm_name = shm.name
+                shm.close()  # Parent unlinks after copying out
+            conn.send(("ok", result, shm_name, size, _current_rss_bytes()))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}", _current_rss_bytes()))
+
+    conn.close()
+
+
+class InlineBackend:
+    """Run a coroutine function in the orchestrator's own event loop."""
+
+    def __init__(self, runner: Callable[[GPUTask], Any]) -> None:
+        """
+        Initialize backend.
+
+        Args:
+            runner: async function(task) doing the work
+        """
+        self.runner = runner
+
+    async def run(self, task: GPUTask) -> Dict[str, Any]:
+        """Run the task in-process."""
+        await self.runner(task)
+        return {}
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend counters."""
+        return {"backend": "inline"}
+
+
+class SubprocessBackend:
+    """
+    Persistent worker process for one model type.
+
+    Features:
+    - Model stays loaded across tasks (worker is reused)
+    - Blocking inference runs outside the event loop
+    - Payloads returned via shared memory
+    - Recycled after max_tasks tasks or when RSS exceeds max_rss_mb
+    - Crashed workers are replaced on the next task
+    """
+
+    def __init__(
+        self,
+        handler: str,
+        name: str = "",
+        max_tasks: int = 50,
+        max_rss_mb: Optional[float] = None,
+        write_payload: bool = True,
+    ) -> None:
+        """
+        Initialize backend.
+
+        Args:
+            handler: "module:function" run in the worker for each task
+            name: Label used in logs and stats
+            max_tasks: Tasks per worker before it is restarted
+            max_rss_mb: Worker RSS that triggers a restart
+            write_payload: Write returned payload bytes to task.output_path
+        """
+        self.handler = handler
+        self.name = name or handler
+        self.max_tasks = max_tasks
+        self.max_rss_mb = max_rss_mb
+        self.write_payload = write_payload
+
+        self._ctx = multiprocessing.get_context("spawn")
+        # multiprocessing Process / Connection, None while no worker runs
+        self._process: Any = None
+        self._conn: Any = None
+        self._lock = asyncio.Lock()
+        self._tasks_on_worker = 0
+        self.last_rss_bytes = 0
+        self.restarts = 0
+        self.tasks_run = 0
+
+    @property
+    def is_alive(self) -> bool:
+        """True while a worker process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def _spawn(self) -> None:
+        """Start a fresh worker process."""
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.handler),
+            name=f"executor-{self.name}",
+            daemon=True,
+        )
+        try:
+            process.start()
+        except Exception:
+            parent_conn.close()
+            raise
+        finally:
+            child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        self._tasks_on_worker = 0
+        logger.info(f"Started {self.name} worker (pid {self._process.pid})")
+
+    def _stop_worker(self, reason: str, force: bool = False) -> None:
+        """Stop the current worker process (force: kill without waiting)."""
+        if self._process is None:
+            return
+        logger.info(f"Stopping {self.name} worker (pid {self._process.pid}): {reason}")
+        if not force:
+            try:
+                self._conn.send(("stop",))
+            except (OSError, BrokenPipeError):
+                pass
+            self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+        self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def _needs_restart(self) -> Optional[str]:
+        """Reason to recycle the worker, if any."""
+        if self._tasks_on_worker >= self.max_tasks:
+            return f"{self._tasks_on_worker} tasks"
+        if self.max_rss_mb and self.last_rss_bytes > self.max_rss_mb * 1024 * 1024:
+            return f"RSS {self.last_rss_bytes / 1024 / 1024:.0f}MB"
+        return None
+
+    @staticmethod
+    def _take_payload(shm_name: str, size: int) -> bytes:
+        """Copy a payload out of shared memory and free the block."""
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            return bytes(_shm_view(shm)[:size])
+        finally:
+            shm.close()
+            shm.unlink()
+
+    async def run(self, task: GPUTask) -> Dict[str, Any]:
+        """
+        Run a task on the worker process.
+
+        Returns:
+            Handler result dict (payload already written to output_path
+            when write_payload is set, otherwise under "payload")
+
+        Raises:
+            RuntimeError: If the handler failed or the worker died
+        """
+        async with self._lock:
+            if not self.is_alive:
+                if self._process is not None:
+                    self._stop_worker("worker exited")
+                    self.restarts += 1
+                self._spawn()
+
+            self._conn.send(("run", task.to_dict()))
+            try:
+                while True:
+                    message = await asyncio.to_thread(self._conn.recv)
+                    if message[0] != "progress":
+                        break
+                    task.progress = message[1]
+            except (EOFError, OSError) as e:
+                self._stop_worker("worker died")
+                self.restarts += 1
+                raise RuntimeError(f"{self.name} worker died during {task.task_id}") from e
+            except asyncio.CancelledError:
+                # The worker is mid-task and can't be interrupted cleanly
+                self._stop_worker(f"{task.task_id} cancelled", force=True)
+                self.restarts += 1
+                raise
+
+            self._tasks_on_worker += 1
+            self.tasks_run += 1
+            self.last_rss_bytes = message[-1]
+
+            reason = self._needs_restart()
+            if reason:
+                self._stop_worker(reason)
+                self.restarts += 1
+
+        if message[0] == "error":
+            raise RuntimeError(message[1])
+
+        _, result, shm_name, size, _ = message
+        if shm_name:
+            payload = self._take_payload(shm_name, size)
+            if self.write_payload:
+                await asyncio.to_thread(self._write, task.output_path, payload)
+                result["bytes_written"] = size
+            else:
+                result["payload"] = payload
+        return result
+
+    @staticmethod
+    def _write(path: Path, payload: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        self._stop_worker("backend closed")
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend counters."""
+        return {
+            "backend": "subprocess",
+            "handler": self.handler,
+            "alive": self.is_alive,
+            "pid": self._process.pid if self.is_alive else None,
+            "tasks_run": self.tasks_run,
+            "tasks_on_worker": self._tasks_on_worker,
+            "restarts": self.restarts,
+            "last_rss_mb": round(self.last_rss_bytes / 1024 / 1024, 1),
+        }
+
+
+def placeholder_tts_handler(
+    task: Dict[str, Any],
+    report_progress: Callable[[float], None],
+) -> Dict[str, Any]:
+    """
+    Stand-in TTS handler: renders silence sized to the chapter text.
+
+    In production this loads XTTS-v2 once per worker (module global) and
+    synthesizes task["input_data"]["text"].
+    """
+    text = task["input_data"].get("text", "")
+    sample_rate = 24000
+    seconds = min(max(len(text) / 15, 0.1), 10.0)  # ~15 chars/s speech, capped
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * int(sample_rate * seconds))
+    report_progress(1.0)
+
+    return {"duration_seconds": seconds, "sample_rate": sample_rate, "payload": buffer.getvalue()}
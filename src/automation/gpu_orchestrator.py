@@ -12,17 +12,44 @@ Designed for overnight batch processing with monitoring.
 
 import os
 import json
+import shutil
+import math
+import time
+import heapq
+import itertools
 import logging
 import asyncio
-import subprocess
+import queue
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable
-from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Iterator, Set, AbstractSet
+from concurrent.futures import Future, ThreadPoolExecutor
 import threading
 
+from .gpu_telemetry import (
+    GPUStats,
+    NvidiaSmiProvider,
+    TelemetryProvider,
+    TelemetrySampler,
+)
+from .task_store import TaskStore
+from .duration_model import DurationModel
+from .metrics import MetricsRegistry
+from .throttle_controller import ThrottleController
+from .tts_pipeline import ChunkedTTSPipeline, write_wav
+from .artifact_cache import ArtifactCache, image_key
+from .cover_pipeline import CoverArtPipeline
+from .llm_batching import (
+    BatchedLLMScheduler,
+    COMPANION_SYSTEM_PROMPT,
+    COMPANION_WORD_TARGETS,
+    TOKENS_PER_WORD,
+)
+from .scheduling_policy import ModelResidency, ResidencyAwarePolicy
+from .overnight_planner import OvernightPlan, OvernightPlanner, PlanItem
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,9 +99,21 @@ class GPUTask:
     completed_at: Optional[datetime] = None
     estimated_duration_minutes: int = 0
     actual_duration_minutes: int = 0
+    actual_duration_seconds: float = 0.0
     gpu_memory_required_gb: float = 0.0
+    deadline: Optional[datetime] = None
+    depends_on: List[str] = field(default_factory=list)
+    checkpoint: Dict[str, Any] = field(default_factory=dict)
+    preemptions: int = 0
     callback: Optional[Callable] = None
 
+    @property
+    def missed_deadline(self) -> bool:
+        """True if the task finished (or is still unfinished) after its deadline."""
+        if self.deadline is None:
+            return False
+        return (self.completed_at or datetime.now()) > self.deadline
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -89,19 +128,208 @@ class GPUTask:
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "estimated_duration_minutes": self.estimated_duration_minutes,
             "actual_duration_minutes": self.actual_duration_minutes,
+            "actual_duration_seconds": self.actual_duration_seconds,
+            "gpu_memory_required_gb": self.gpu_memory_required_gb,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "depends_on": self.depends_on,
+            "checkpoint": self.checkpoint,
+            "preemptions": self.preemptions,
+            "input_data": self.input_data,
+            "output_path": str(self.output_path),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GPUTask":
+        """Create from dictionary (callbacks are not persisted)."""
+        task = cls(
+            task_id=data["task_id"],
+            task_type=TaskType(data["task_type"]),
+            priority=TaskPriority(data["priority"]),
+            input_data=data.get("input_data", {}),
+            output_path=Path(data.get("output_path", ".")),
+            status=TaskStatus(data.get("status", "pending")),
+            progress=data.get("progress", 0.0),
+            error_message=data.get("error_message"),
+            estimated_duration_minutes=data.get("estimated_duration_minutes", 0),
+            actual_duration_minutes=data.get("actual_duration_minutes", 0),
+            actual_duration_seconds=data.get("actual_duration_seconds", 0.0),
+            gpu_memory_required_gb=data.get("gpu_memory_required_gb", 0.0),
+            depends_on=list(data.get("depends_on") or []),
+            checkpoint=data.get("checkpoint") or {},
+            preemptions=data.get("preemptions", 0),
+        )
+
+        if data.get("created_at"):
+            task.created_at = datetime.fromisoformat(data["created_at"])
+        if data.get("started_at"):
+            task.started_at = datetime.fromisoformat(data["started_at"])
+        if data.get("completed_at"):
+            task.completed_at = datetime.fromisoformat(data["completed_at"])
+        if data.get("deadline"):
+            task.deadline = datetime.fromisoformat(data["deadline"])
+
+        return task
+
+
+class TaskPreempted(Exception):
+    """Raised at a checkpoint when a running task has been asked to yield."""
+
+
+class TaskQueue:
+    """
+    Stable heap-backed priority queue of GPU tasks.
+
+    Lower priority values run first; within a priority band tasks run
+    earliest-deadline-first, and tasks without a deadline follow in
+    insertion order. Push/pop are O(log n), bulk extend is a single
+    heapify, and removal is lazy (entries are tombstoned).
+
+    Not thread-safe: the orchestrator reads and changes it only while
+    holding its lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty queue."""
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}
+        self._counter = itertools.count()
+
+    def _entry(self, task: GPUTask) -> list:
+        """Build heap entry: [priority, deadline, sequence, task]."""
+        deadline = task.deadline.timestamp() if task.deadline else math.inf
+        entry = [task.priority.value, deadline, next(self._counter), task]
+        self._entries[task.task_id] = entry
+        return entry
+
+    def push(self, task: GPUTask) -> None:
+        """Add a task in O(log n)."""
+        heapq.heappush(self._heap, self._entry(task))
+
+    def extend(self, tasks: List[GPUTask]) -> None:
+        """Add many tasks with a single heapify."""
+        self._heap.extend(self._entry(t) for t in tasks)
+        heapq.heapify(self._heap)
+
+    def pop(self) -> Optional[GPUTask]:
+        """Remove and return the highest-priority task."""
+        return self.pop_first(lambda task: True)
+
+    def pop_first(
+        self,
+        predicate: Callable[[GPUTask], bool],
+        stop: Optional[Callable[[GPUTask], bool]] = None,
+    ) -> Optional[GPUTask]:
+        """
+        Remove and return the highest-priority task matching predicate.
+
+        Skipped tasks are restored with their original sequence numbers,
+        so ordering stays stable.
+
+        Args:
+            predicate: Acceptance test for a candidate task
+            stop: Optional test that ends the scan at a candidate
+
+        Returns:
+            Matching task, or None
+        """
+        skipped = []
+        found = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            task = entry[-1]
+            if task is None:
+                continue
+            if stop and stop(task):
+                skipped.append(entry)
+                break
+            if predicate(task):
+                del self._entries[task.task_id]
+                found = task
+                break
+            skipped.append(entry)
+
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def scan(
+        self,
+        predicate: Callable[[GPUTask], bool],
+        stop: Optional[Callable[[GPUTask], bool]] = None,
+        limit: Optional[int] = None,
+    ) -> List[GPUTask]:
+        """
+        Matching tasks in run order, without removing them.
+
+        Args:
+            predicate: Acceptance test for a candidate task
+            stop: Optional test that ends the scan at a candidate
+            limit: Max matches to return
+
+        Returns:
+            Matching tasks in run order
+        """
+        popped = []
+        found: List[GPUTask] = []
+        while self._heap and (limit is None or len(found) < limit):
+            entry = heapq.heappop(self._heap)
+            task = entry[-1]
+            if task is None:
+                continue
+            popped.append(entry)
+            if stop and stop(task):
+                break
+            if predicate(task):
+                found.append(task)
+
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def peek(self) -> Optional[GPUTask]:
+        """Return the highest-priority task without removing it."""
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][-1] if self._heap else None
+
+    def remove(self, task: GPUTask) -> bool:
+        """Remove a task in O(1) (lazy deletion). Returns True if queued."""
+        entry = self._entries.pop(task.task_id, None)
+        if entry is None:
+            return False
+        entry[-1] = None
+        return True
+
+    def head(self, n: int) -> List[GPUTask]:
+        """First n tasks in run order."""
+        return [e[-1] for e in heapq.nsmallest(n, self._entries.values())]
+
+    def ordered(self) -> List[GPUTask]:
+        """All queued tasks in run order."""
+        return [e[-1] for e in sorted(self._entries.values())]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task: Any) -> bool:
+        """Membership by GPUTask or task ID."""
+        task_id = task if isinstance(task, str) else task.task_id
+        return task_id in self._entries
+
+    def __iter__(self) -> Iterator[GPUTask]:
+        """Iterate queued tasks (heap order, not run order)."""
+        return iter([e[-1] for e in self._entries.values()])
+
 
 @dataclass
-class GPUStats:
-    """GPU statistics."""
-    name: str = "Unknown"
-    memory_total_gb: float = 0.0
-    memory_used_gb: float = 0.0
-    memory_free_gb: float = 0.0
-    utilization_percent: float = 0.0
-    temperature_celsius: float = 0.0
-    power_draw_watts: float = 0.0
+class _QueueSnapshot:
+    """Copies of the orchestrator's task collections, taken under its lock."""
+    queued: List[GPUTask]  # Run order
+    blocked: List[GPUTask]
+    running: List[GPUTask]
+    completed: List[GPUTask]
+    resident_models: List[str]
+    plan_waiting: int
 
 
 class GPUOrchestrator:
@@ -131,12 +359,57 @@ class GPUOrchestrator:
         TaskType.BATCH_MIXED: 8.0,        # Average
     }
 
+    # Throttling: work scales down from the targets and stops at the limits
+    THERMAL_TARGET_CELSIUS = 78.0
+    THERMAL_LIMIT_CELSIUS = 87.0
+    POWER_TARGET_FRACTION = 0.9  # of TDP
+
+    # TTS text per synthesis call at full speed (characters)
+    TTS_CHUNK_CHARS = 2000
+
+    # Scheduler wakeups: telemetry change that counts as "VRAM freed",
+    # and the longest the loop sleeps without any event
+    WAKE_VRAM_DELTA_GB = 1.0
+    IDLE_RECHECK_SECONDS = 300.0
+
+    # Overnight planner value per predicted GPU minute, by priority
+    PLAN_VALUE_WEIGHTS = {
+        TaskPriority.CRITICAL: 16.0,
+        TaskPriority.HIGH: 8.0,
+        TaskPriority.NORMAL: 4.0,
+        TaskPriority.LOW: 1.0,
+        TaskPriority.OVERNIGHT: 2.0,
+    }
+
+    # Task types that checkpoint at chunk boundaries and can be preempted
+    PREEMPTIBLE_TYPES = {TaskType.TTS_SYNTHESIS, TaskType.LLM_INFERENCE}
+
+    # Model load time when switching to a task type (seconds)
+    MODEL_SWITCH_SECONDS = {
+        TaskType.TTS_SYNTHESIS: 30.0,     # XTTS-v2 checkpoint
+        TaskType.LLM_INFERENCE: 20.0,     # Quantized 7B
+        TaskType.IMAGE_GENERATION: 45.0,  # SDXL base + VAE
+        TaskType.AUDIO_MASTERING: 0.0,    # No model
+        TaskType.VIDEO_GENERATION: 60.0,
+        TaskType.BATCH_MIXED: 0.0,
+    }
+
     def __init__(
         self,
         data_dir: Optional[Path] = None,
         max_concurrent_tasks: int = 1,  # GPU tasks usually sequential
         overnight_start_hour: int = 23,
         overnight_end_hour: int = 6,
+        telemetry_provider: Optional[TelemetryProvider] = None,
+        telemetry_interval_seconds: float = 5.0,
+        scheduling_policy: Optional[Any] = None,
+        throttle_controller: Optional[ThrottleController] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        executor_backends: Optional[Dict[TaskType, Any]] = None,
+        tts_engine: Optional[Any] = None,
+        artifact_cache: Optional[ArtifactCache] = None,
+        llm_server: Optional[Any] = None,
+        image_engine: Optional[Any] = None,
     ) -> None:
         """
         Initialize GPU orchestrator.
@@ -146,6 +419,21 @@ class GPUOrchestrator:
             max_concurrent_tasks: Maximum parallel GPU tasks
             overnight_start_hour: Hour to start overnight batch (24h)
             overnight_end_hour: Hour to end overnight batch (24h)
+            telemetry_provider: GPU stats source (default: nvidia-smi)
+            telemetry_interval_seconds: Telemetry sampling interval
+            scheduling_policy: Task selection policy (default: residency-aware)
+            throttle_controller: Thermal/power controller (default: RTX 5080 targets)
+            metrics: Metrics registry (default: a new private registry)
+            executor_backends: Per-type backends (e.g. SubprocessBackend);
+                types without one run in-process
+            tts_engine: Batch TTS engine for chunked in-process synthesis
+                (see tts_pipeline); None keeps the placeholder runner
+            artifact_cache: Content-addressed cache for TTS chunks and
+                images (default: artifact_cache/ in data_dir, 20GB)
+            llm_server: Local inference server for continuous-batched LLM
+                tasks (see llm_batching); None keeps the placeholder runner
+            image_engine: Image engine for seed-sweep cover production
+                (see cover_pipeline); None keeps the placeholder runner
         """
         self.data_dir = data_dir or Path.cwd() / "gpu_tasks"
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -154,33 +442,156 @@ class GPUOrchestrator:
         self.overnight_start = overnight_start_hour
         self.overnight_end = overnight_end_hour
 
-        self.task_queue: List[GPUTask] = []
+        self.task_queue = TaskQueue()
         self.running_tasks: Dict[str, GPUTask] = {}
         self.completed_tasks: List[GPUTask] = []
 
+        # Guards in-memory queue/DAG/running state only. Held for short
+        # bookkeeping, never across an await, disk or subprocess I/O, or
+        # user callbacks, so producers on other threads never wait on GPU work
         self._lock = threading.Lock()
+        self._submissions: "queue.SimpleQueue[tuple[Dict[str, Any], Future]]" = queue.SimpleQueue()
+        self._task_counter = itertools.count()
         self._executor = ThreadPoolExecutor(max_workers=max_concurrent_tasks)
         self._running = False
         self._overnight_mode = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._preempt_requests: Set[str] = set()
+        self.preemptions = 0
+
+        # Applied overnight plan: deferred overnight tasks wait until
+        # everything selected for tonight has started
+        self.overnight_plan: Optional[OvernightPlan] = None
+        self._plan_selected: Set[str] = set()
+        self._plan_deferred: Set[str] = set()
+
+        self.metrics = metrics or MetricsRegistry()
+        self._init_metrics()
+
+        # Types with a backend run there (e.g. an isolated worker process)
+        self.backends: Dict[TaskType, Any] = dict(executor_backends or {})
+        self.artifacts = artifact_cache or ArtifactCache(self.data_dir / "artifact_cache")
+        self.tts_pipeline = ChunkedTTSPipeline(
+            tts_engine,
+            vram_budget_gb=self.VRAM_REQUIREMENTS[TaskType.TTS_SYNTHESIS],
+            cache=self.artifacts,
+        ) if tts_engine is not None else None
+        self.llm = BatchedLLMScheduler(
+            llm_server, metrics=self.metrics,
+        ) if llm_server is not None else None
+        self.covers = CoverArtPipeline(
+            image_engine, cache=self.artifacts,
+        ) if image_engine is not None else None
+
+        # Dependency DAG: tasks wait in _blocked until their in-degree
+        # (unfinished dependencies) drops to zero, then enter task_queue
+        self._blocked: Dict[str, GPUTask] = {}
+        self._in_degree: Dict[str, int] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._finished: Dict[str, TaskStatus] = {}
+
+        self.telemetry = TelemetrySampler(
+            telemetry_provider or NvidiaSmiProvider(default_vram_gb=self.RTX_5080_VRAM_GB),
+            interval_seconds=telemetry_interval_seconds,
+        )
+        self.throttle = throttle_controller or ThrottleController(
+            target_temp_celsius=self.THERMAL_TARGET_CELSIUS,
+            max_temp_celsius=self.THERMAL_LIMIT_CELSIUS,
+            target_power_watts=self.RTX_5080_TDP_WATTS * self.POWER_TARGET_FRACTION,
+            max_power_watts=self.RTX_5080_TDP_WATTS,
+        )
+        self.telemetry.add_listener(self._on_telemetry)
 
+        self.policy = scheduling_policy or ResidencyAwarePolicy()
+        self.residency = ModelResidency(
+            capacity_gb=self.RTX_5080_VRAM_GB,
+            vram_requirements=self.VRAM_REQUIREMENTS,
+            switch_costs=self.MODEL_SWITCH_SECONDS,
+        )
+
+        self.durations = DurationModel(self.data_dir / "duration_model.json")
+        self.store = TaskStore(self.data_dir / "tasks.db")
         self._load_state()
 
+    def _init_metrics(self) -> None:
+        """Create the orchestrator's metrics."""
+        m = self.metrics
+        self._m_added = m.counter("gpu_tasks_added_total", "Tasks added to the queue")
+        self._m_finished = m.counter("gpu_tasks_finished_total", "Tasks finished, by outcome")
+        self._m_requeued = m.counter("gpu_tasks_requeued_total", "Tasks returned to the queue by workers")
+        self._m_preempted = m.counter("gpu_task_preemptions_total", "Running tasks asked to yield")
+        self._m_switches = m.counter("gpu_model_switches_total", "Model loads caused by scheduling")
+        self._m_wait = m.histogram("gpu_task_queue_wait_seconds", "Time from add to first start")
+        self._m_run = m.histogram("gpu_task_run_seconds", "Task execution time (per run segment)")
+        self._m_schedule = m.histogram(
+            "gpu_schedule_pass_seconds",
+            "Latency of one scheduling pass",
+            buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1),
+        )
+        self._m_reserved = m.gauge("gpu_vram_reserved_gb", "VRAM reserved by running tasks")
+        self._m_queue = m.gauge("gpu_queue_tasks", "Tasks by queue state")
+        self._m_temperature = m.gauge("gpu_temperature_celsius", "GPU temperature")
+        self._m_power = m.gauge("gpu_power_draw_watts", "GPU power draw")
+        self._m_memory_used = m.gauge("gpu_memory_used_gb", "GPU memory in use (all processes)")
+        self._m_throttle = m.gauge("gpu_throttle_factor", "Throttle controller throughput factor")
+
+    def _update_queue_gauges(self) -> None:
+        """Refresh queue-size and reservation gauges."""
+        self._m_reserved.set(self.reserved_vram_gb)
+        self._m_queue.set(len(self.task_queue), state="pending")
+        self._m_queue.set(len(self._blocked), state="blocked")
+        self._m_queue.set(len(self.running_tasks), state="running")
+
     def _load_state(self) -> None:
-        """Load persisted task queue state."""
-        state_file = self.data_dir / "orchestrator_state.json"
-        if state_file.exists():
+        """
+        Rebuild the task queue from the durable store.
+
+        Tasks that were RUNNING when the process died are re-queued as
+        PENDING; they restart from their last persisted checkpoint (the
+        point they were last preempted at), or from the beginning.
+        """
+        restored = []
+        requeued = []
+        for data in self.store.load_unfinished():
             try:
-                with open(state_file, "r") as f:
-                    state = json.load(f)
-                    logger.info(f"Loaded {len(state.get('pending_tasks', []))} pending tasks")
+                task = GPUTask.from_dict(data)
             except Exception as e:
-                logger.warning(f"Could not load state: {e}")
+                logger.warning(f"Could not restore task {data.get('task_id')}: {e}")
+                continue
+
+            if task.status == TaskStatus.RUNNING:
+                task.status = TaskStatus.PENDING
+                task.progress = 0.0
+                task.started_at = None
+                requeued.append(task)
+            restored.append(task)
+
+        if restored:
+            # Dependencies that finished before the restart are only in the store
+            with self._lock:
+                unresolved = self._unresolved_dependencies(restored)
+            stored = self.store.statuses(unresolved) if unresolved else {}
+            with self._lock:
+                ready, cancelled = self._admit(restored, stored=stored)
+            self.task_queue.extend(ready)
+            self.store.upsert_many(t.to_dict() for t in requeued + cancelled)
+            logger.info(
+                f"Restored {len(restored)} pending tasks "
+                f"({len(requeued)} interrupted while running)"
+            )
+
+    def _persist(self, *tasks: GPUTask) -> None:
+        """Write task rows to the durable store."""
+        self.store.upsert_many(t.to_dict() for t in tasks)
 
     def _save_state(self) -> None:
-        """Persist task queue state."""
+        """Write a small queue summary (tasks themselves live in the store)."""
         state_file = self.data_dir / "orchestrator_state.json"
         state = {
-            "pending_tasks": [t.to_dict() for t in self.task_queue],
+            "pending_count": len(self.task_queue),
+            "blocked_count": len(self._blocked),
+            "running_count": len(self.running_tasks),
             "completed_count": len(self.completed_tasks),
             "saved_at": datetime.now().isoformat(),
         }
@@ -189,81 +600,454 @@ class GPUOrchestrator:
 
     def get_gpu_stats(self) -> GPUStats:
         """
-        Get current GPU statistics using nvidia-smi.
+        Sample current GPU statistics now (bypasses the cached snapshot).
 
         Returns:
             GPUStats with current GPU state
         """
-        stats = GPUStats()
+        return self.telemetry.refresh()
 
-        try:
-            result = subprocess.run(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=name,memory.total,memory.used,memory.free,utilization.gpu,temperature.gpu,power.draw",
-                    "--format=csv,noheader,nounits"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+    def required_vram_gb(self, task: GPUTask) -> float:
+        """VRAM a task reserves while running."""
+        return task.gpu_memory_required_gb or self.VRAM_REQUIREMENTS.get(task.task_type, 8.0)
 
-            if result.returncode == 0:
-                parts = result.stdout.strip().split(", ")
-                if len(parts) >= 7:
-                    stats.name = parts[0]
-                    stats.memory_total_gb = float(parts[1]) / 1024
-                    stats.memory_used_gb = float(parts[2]) / 1024
-                    stats.memory_free_gb = float(parts[3]) / 1024
-                    stats.utilization_percent = float(parts[4])
-                    stats.temperature_celsius = float(parts[5])
-                    stats.power_draw_watts = float(parts[6])
+    @property
+    def reserved_vram_gb(self) -> float:
+        """VRAM reserved by currently running tasks."""
+        return sum(self.required_vram_gb(t) for t in self.running_tasks.values())
 
-        except Exception as e:
-            logger.warning(f"Could not get GPU stats: {e}")
-            # Return defaults for RTX 5080
-            stats.name = "NVIDIA GeForce RTX 5080 (estimated)"
-            stats.memory_total_gb = self.RTX_5080_VRAM_GB
-            stats.memory_free_gb = self.RTX_5080_VRAM_GB
+    def available_vram_gb(self, stats: Optional[GPUStats] = None) -> float:
+        """
+        VRAM available for new tasks.
 
-        return stats
+        Capacity minus our reservations minus memory used by other
+        processes (telemetry usage beyond what we have reserved).
+        """
+        stats = stats or self.telemetry.snapshot()
+        capacity = stats.memory_total_gb or self.RTX_5080_VRAM_GB
+        reserved = self.reserved_vram_gb
+        external_used = max(0.0, stats.memory_used_gb - reserved)
+        return capacity - external_used - reserved
 
-    def can_run_task(self, task: GPUTask) -> tuple[bool, str]:
+    def can_run_task(
+        self,
+        task: GPUTask,
+        stats: Optional[GPUStats] = None,
+    ) -> tuple[bool, str]:
         """
         Check if a task can run given current GPU state.
 
         Args:
             task: Task to check
+            stats: Telemetry to judge against (default: cached snapshot)
 
         Returns:
             Tuple of (can_run, reason)
         """
-        stats = self.get_gpu_stats()
+        stats = stats or self.telemetry.snapshot()
+
+        # Check VRAM (net of reservations held by running tasks)
+        required_vram = self.required_vram_gb(task)
+        available_vram = self.available_vram_gb(stats)
+        if available_vram < required_vram:
+            return False, f"Insufficient VRAM: {available_vram:.1f}GB free, {required_vram:.1f}GB needed"
+
+        # Check temperature/power (hard limits and deep throttling; above
+        # pause_below the controller scales concurrency and duty cycle)
+        if self.throttle.state.critical:
+            return False, (
+                f"GPU over limit: {stats.temperature_celsius}C, "
+                f"{stats.power_draw_watts}W"
+            )
+        if self.throttle.paused:
+            return False, (
+                f"Dispatch paused by throttle ({self.throttle.state.reason}, "
+                f"factor {self.throttle.factor:.2f})"
+            )
 
-        # Check VRAM
-        required_vram = self.VRAM_REQUIREMENTS.get(task.task_type, 8.0)
-        if stats.memory_free_gb < required_vram:
-            return False, f"Insufficient VRAM: {stats.memory_free_gb:.1f}GB free, {required_vram:.1f}GB needed"
+        # Check overnight mode
+        if task.priority == TaskPriority.OVERNIGHT:
+            if not self.is_overnight_window():
+                return False, "Task scheduled for overnight only"
+
+            if task.task_id in self._plan_deferred and self._plan_outstanding():
+                return False, "Deferred by overnight plan"
+
+            # Leave tasks that would overrun the window for the next one,
+            # unless they are too long to fit in any window
+            predicted = self.predicted_minutes(task)
+            remaining = self.seconds_until_window_change() / 60
+            if remaining < predicted <= self.overnight_window_minutes:
+                return False, (
+                    f"Would overrun overnight window: {predicted:.0f}min "
+                    f"predicted, {remaining:.0f}min left"
+                )
+
+        # Check concurrent limit (scaled by the throttle controller)
+        limit = self.concurrency_limit
+        if len(self.running_tasks) >= limit:
+            return False, f"Max concurrent tasks ({limit}) reached"
 
-        # Check temperature (throttle at 80C)
-        if stats.temperature_celsius > 80:
-            return False, f"GPU too hot: {stats.temperature_celsius}C"
+        return True, "OK"
 
-        # Check overnight mode
-        current_hour = datetime.now().hour
-        is_overnight = (
+    @property
+    def concurrency_limit(self) -> int:
+        """max_concurrent_tasks scaled by the throttle controller."""
+        return self.throttle.concurrency_limit(self.max_concurrent)
+
+    async def _duty_cycle_pause(self, busy_seconds: float) -> None:
+        """Idle between chunks for the throttle the concurrency limit can't apply."""
+        delay = self.throttle.duty_cycle_delay(busy_seconds, self.max_concurrent)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def is_overnight_window(self, now: Optional[datetime] = None) -> bool:
+        """True if now falls inside the overnight batch window."""
+        current_hour = (now or datetime.now()).hour
+        return (
             current_hour >= self.overnight_start or
             current_hour < self.overnight_end
         )
 
-        if task.priority == TaskPriority.OVERNIGHT and not is_overnight:
-            return False, "Task scheduled for overnight only"
+    @property
+    def overnight_window_minutes(self) -> float:
+        """Length of the overnight window."""
+        hours = (self.overnight_end - self.overnight_start) % 24 or 24
+        return hours * 60.0
 
-        # Check concurrent limit
-        if len(self.running_tasks) >= self.max_concurrent:
-            return False, f"Max concurrent tasks ({self.max_concurrent}) reached"
+    def _not_started(self, task_id: str) -> bool:
+        """True while a task is still queued or blocked on dependencies."""
+        return task_id in self.task_queue or task_id in self._blocked
 
-        return True, "OK"
+    def _plan_waiting(self) -> List[str]:
+        """Tonight's selected tasks that have not started yet."""
+        return [task_id for task_id in self._plan_selected if self._not_started(task_id)]
+
+    def _plan_outstanding(self) -> bool:
+        """
+        True while work selected for tonight has not started.
+
+        Read-only, so can_run_task may call it without the lock:
+        _plan_selected is only ever replaced, never mutated in place.
+        """
+        return any(self._not_started(task_id) for task_id in self._plan_selected)
+
+    def plan_overnight(
+        self,
+        now: Optional[datetime] = None,
+        extra_items: Optional[List[PlanItem]] = None,
+        apply: bool = False,
+    ) -> OvernightPlan:
+        """
+        Plan the queue into tonight's window and the nights after it.
+
+        Each queued or blocked task becomes a PlanItem weighted by its
+        predicted duration and valued by priority, and the planner packs
+        tonight's window as a knapsack (see overnight_planner).
+
+        Args:
+            now: Planning time (default: now)
+            extra_items: Work not yet queued (e.g. unqueued batch jobs)
+            apply: Hold back deferred overnight tasks until tonight's
+                selection has started
+
+        Returns:
+            OvernightPlan
+        """
+        with self._lock:
+            tasks = self.task_queue.ordered() + list(self._blocked.values())
+            busy = [
+                self.predicted_minutes(t) * (1 - t.progress)
+                for t in self.running_tasks.values()
+            ]
+            items = [
+                PlanItem(
+                    item_id=t.task_id,
+                    minutes=self.predicted_minutes(t),
+                    value=self.PLAN_VALUE_WEIGHTS[t.priority] * max(self.predicted_minutes(t), 1.0),
+                    group=str(t.input_data.get("book_id", "")),
+                    priority=t.priority.value,
+                    deadline=t.deadline,
+                    depends_on=list(t.depends_on),
+                )
+                for t in tasks
+            ]
+
+        planner = OvernightPlanner(
+            start_hour=self.overnight_start,
+            end_hour=self.overnight_end,
+            lanes=self.max_concurrent,
+        )
+        plan = planner.plan(items + list(extra_items or []), now=now, busy_minutes=busy)
+
+        if apply:
+            overnight = {t.task_id for t in tasks if t.priority == TaskPriority.OVERNIGHT}
+            with self._lock:
+                self.overnight_plan = plan
+                self._plan_selected = {i.item_id for i in plan.tonight}
+                self._plan_deferred = {i.item_id for i in plan.deferred} & overnight
+            logger.info(
+                f"Overnight plan: {len(plan.tonight)} tasks "
+                f"({plan.planned_minutes:.0f}/{plan.capacity_minutes:.0f}min), "
+                f"{len(plan.deferred)} deferred"
+            )
+        return plan
+
+    def predicted_minutes(self, task: GPUTask) -> float:
+        """Learned duration for a task, or its static estimate."""
+        return self.durations.predict_minutes(
+            task.task_type.value,
+            task.input_data,
+            default=task.estimated_duration_minutes,
+        )
+
+    def seconds_until_window_change(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the overnight window next opens or closes."""
+        now = now or datetime.now()
+        boundaries = []
+        for hour in (self.overnight_start, self.overnight_end):
+            boundary = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+            if boundary <= now:
+                boundary += timedelta(days=1)
+            boundaries.append(boundary)
+        return (min(boundaries) - now).total_seconds()
+
+    def _signal_wakeup(self) -> None:
+        """Wake the scheduler loop (safe to call from any thread)."""
+        loop, event = self._loop, self._wakeup
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # Loop shut down between the check and the call
+
+    def _on_telemetry(self, previous: Optional[GPUStats], current: GPUStats) -> None:
+        """Update the throttle; wake the scheduler when VRAM or headroom frees up."""
+        limit_before = self.concurrency_limit
+        self.throttle.update(self.telemetry.recent(self.throttle.window))
+        self._m_temperature.set(current.temperature_celsius)
+        self._m_power.set(current.power_draw_watts)
+        self._m_memory_used.set(current.memory_used_gb)
+        self._m_throttle.set(self.throttle.factor)
+        if previous is None:
+            return
+        freed = current.memory_free_gb - previous.memory_free_gb
+        if freed >= self.WAKE_VRAM_DELTA_GB or self.concurrency_limit > limit_before:
+            self._signal_wakeup()
+
+    def _create_task(
+        self,
+        task_type: TaskType,
+        input_data: Dict[str, Any],
+        output_path: Path,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        estimated_minutes: int = 30,
+        callback: Optional[Callable] = None,
+        deadline: Optional[datetime] = None,
+        depends_on: Optional[List[Any]] = None,
+    ) -> GPUTask:
+        """Build a GPUTask with a unique ID (not yet queued)."""
+        task_id = (
+            f"{task_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            f"_{next(self._task_counter)}"
+        )
+
+        # Prefer the learned duration over the caller's static guess
+        predicted = self.durations.predict_seconds(task_type.value, input_data)
+        if predicted is not None:
+            estimated_minutes = max(1, math.ceil(predicted / 60))
+
+        return GPUTask(
+            task_id=task_id,
+            task_type=task_type,
+            priority=priority,
+            input_data=input_data,
+            output_path=output_path,
+            estimated_duration_minutes=estimated_minutes,
+            gpu_memory_required_gb=self.VRAM_REQUIREMENTS.get(task_type, 8.0),
+            deadline=deadline,
+            depends_on=[d.task_id if isinstance(d, GPUTask) else d for d in depends_on or []],
+            callback=callback,
+        )
+
+    def _unresolved_dependencies(self, tasks: List[GPUTask]) -> List[str]:
+        """Dependencies not known in memory (caller holds the lock)."""
+        known = {t.task_id for t in tasks}
+        return [
+            d for t in tasks for d in t.depends_on
+            if d not in self._finished and d not in known and not self._is_tracked(d)
+        ]
+
+    def _admit(
+        self,
+        tasks: List[GPUTask],
+        cached: AbstractSet[str] = frozenset(),
+        stored: Optional[Dict[str, str]] = None,
+    ) -> tuple[List[GPUTask], List[GPUTask]]:
+        """
+        Register tasks in the dependency DAG (caller holds the lock).
+
+        Tasks are processed in order, so a task may depend on one earlier
+        in the same list. Dependencies that already finished are looked
+        up in memory, then in `stored` (statuses the caller read from the
+        durable store before taking the lock). Tasks in `cached` had
+        their output restored from the artifact cache and complete
+        without being queued.
+
+        Returns:
+            Tuple of (ready tasks for the queue, tasks cancelled because a
+            dependency failed)
+
+        Raises:
+            ValueError: If a dependency is unknown (nothing is admitted)
+        """
+        known = {t.task_id for t in tasks}
+        stored = stored or {}
+        for dep in self._unresolved_dependencies(tasks):
+            if dep not in stored:
+                owner = next(t.task_id for t in tasks if dep in t.depends_on)
+                raise ValueError(f"Task {owner} depends on unknown task {dep}")
+
+        ready: List[GPUTask] = []
+        cancelled: List[GPUTask] = []
+        for task in tasks:
+            in_degree = 0
+            failed_dep = None
+            for dep in task.depends_on:
+                status = self._finished.get(dep)
+                if status is None and dep in stored:
+                    status = TaskStatus(stored[dep])
+
+                if status == TaskStatus.COMPLETED:
+                    continue
+                if status in (TaskStatus.FAILED, TaskStatus.CANCELLED):
+                    failed_dep = dep
+                    break
+                in_degree += 1
+                self._dependents.setdefault(dep, []).append(task.task_id)
+
+            if failed_dep:
+                self._cancel(task, failed_dep, cancelled)
+            elif in_degree:
+                self._blocked[task.task_id] = task
+                self._in_degree[task.task_id] = in_degree
+            elif task.task_id in cached:
+                self._complete_cached(task)
+            else:
+                ready.append(task)
+
+        return ready, cancelled
+
+    def _artifact_key(self, task: GPUTask) -> Optional[str]:
+        """Artifact cache key for a task's whole output (None if not cacheable)."""
+        if task.task_type != TaskType.IMAGE_GENERATION:
+            return None
+        data = task.input_data
+        if "candidates" in data:
+            return None  # Seed sweeps cache per candidate (see cover_pipeline)
+        return image_key(
+            data.get("prompt", ""),
+            data.get("negative_prompt", ""),
+            data.get("seed"),
+            data.get("width", 1024),
+            data.get("height", 1024),
+        )
+
+    def _restore_cached(self, tasks: List[GPUTask]) -> Set[str]:
+        """
+        Restore outputs of dependency-free tasks from the artifact cache.
+
+        Returns:
+            IDs of tasks whose output is now in place
+        """
+        restored = set()
+        for task in tasks:
+            key = None if task.depends_on else self._artifact_key(task)
+            if key and self.artifacts.restore(key, task.output_path, task.output_path.suffix):
+                restored.add(task.task_id)
+        return restored
+
+    def _complete_cached(self, task: GPUTask) -> None:
+        """Mark a task completed from the artifact cache (caller holds the lock)."""
+        task.status = TaskStatus.COMPLETED
+        task.started_at = task.completed_at = datetime.now()
+        task.progress = 1.0
+        self._finished[task.task_id] = TaskStatus.COMPLETED
+        self._m_finished.inc(type=task.task_type.value, status="cached")
+        self.completed_tasks.append(task)
+        logger.info(f"Task {task.task_id} restored from artifact cache")
+
+    @staticmethod
+    def _run_callback(task: GPUTask) -> None:
+        """Run a finished task's completion callback; errors are only logged."""
+        if task.callback is None:
+            return
+        try:
+            task.callback(task)
+        except Exception as e:
+            logger.error(f"Callback for task {task.task_id} failed: {e}")
+
+    def _run_cached_callbacks(self, tasks: List[GPUTask], cached: Set[str]) -> None:
+        """Completion callbacks for tasks satisfied from the cache."""
+        for task in tasks:
+            if task.task_id in cached:
+                self._run_callback(task)
+
+    def _is_tracked(self, task_id: str) -> bool:
+        """True if the task is queued, blocked or running in this process."""
+        return (
+            task_id in self._blocked
+            or task_id in self.running_tasks
+            or task_id in self.task_queue
+        )
+
+    def _cancel(self, task: GPUTask, failed_dep: str, cancelled: List[GPUTask]) -> None:
+        """Cancel a task (and, transitively, its dependents) after a failed dependency."""
+        task.status = TaskStatus.CANCELLED
+        task.error_message = f"Dependency {failed_dep} did not complete"
+        task.completed_at = datetime.now()
+        self._finished[task.task_id] = TaskStatus.CANCELLED
+        self._m_finished.inc(type=task.task_type.value, status="cancelled")
+        self.completed_tasks.append(task)
+        cancelled.append(task)
+        logger.warning(f"Cancelled {task.task_id}: {task.error_message}")
+
+        for child_id in self._dependents.pop(task.task_id, []):
+            child = self._blocked.pop(child_id, None)
+            self._in_degree.pop(child_id, None)
+            if child:
+                self._cancel(child, task.task_id, cancelled)
+
+    def _resolve_dependents(self, task: GPUTask) -> tuple[List[GPUTask], List[GPUTask]]:
+        """
+        Update the DAG after a task finishes (caller holds the lock).
+
+        Returns:
+            Tuple of (dependents that became ready, dependents cancelled)
+        """
+        self._finished[task.task_id] = task.status
+        ready: List[GPUTask] = []
+        cancelled: List[GPUTask] = []
+
+        for child_id in self._dependents.pop(task.task_id, []):
+            child = self._blocked.get(child_id)
+            if child is None:
+                continue
+            if task.status != TaskStatus.COMPLETED:
+                del self._blocked[child_id]
+                self._in_degree.pop(child_id, None)
+                self._cancel(child, task.task_id, cancelled)
+                continue
+            self._in_degree[child_id] -= 1
+            if self._in_degree[child_id] == 0:
+                del self._blocked[child_id]
+                del self._in_degree[child_id]
+                ready.append(child)
+
+        for child in ready:
+            self.task_queue.push(child)
+        return ready, cancelled
 
     def add_task(
         self,
@@ -273,6 +1057,8 @@ class GPUOrchestrator:
         priority: TaskPriority = TaskPriority.NORMAL,
         estimated_minutes: int = 30,
         callback: Optional[Callable] = None,
+        deadline: Optional[datetime] = None,
+        depends_on: Optional[List[Any]] = None,
     ) -> GPUTask:
         """
         Add a task to the queue.
@@ -284,32 +1070,142 @@ class GPUOrchestrator:
             priority: Task priority
             estimated_minutes: Estimated duration
             callback: Optional completion callback
+            deadline: Optional completion deadline (EDF within the band)
+            depends_on: Tasks (or task IDs) that must complete first
 
         Returns:
             Created GPUTask
-        """
-        task_id = f"{task_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
 
-        task = GPUTask(
-            task_id=task_id,
+        Raises:
+            ValueError: If a dependency is unknown
+        """
+        task = self._create_task(
             task_type=task_type,
-            priority=priority,
             input_data=input_data,
             output_path=output_path,
-            estimated_duration_minutes=estimated_minutes,
-            gpu_memory_required_gb=self.VRAM_REQUIREMENTS.get(task_type, 8.0),
+            priority=priority,
+            estimated_minutes=estimated_minutes,
             callback=callback,
+            deadline=deadline,
+            depends_on=depends_on,
         )
 
+        self._enqueue([task])
+        logger.info(f"Added task {task.task_id} (priority: {priority.name})")
+
+        return task
+
+    def add_tasks(self, task_specs: List[Dict[str, Any]]) -> List[GPUTask]:
+        """
+        Add many tasks at once with a single heapify and a single state save.
+
+        Specs may depend on tasks created earlier in the same list (pass
+        the GPUTask objects returned by _create_task, or task IDs).
+
+        Args:
+            task_specs: List of add_task keyword-argument dicts
+
+        Returns:
+            Created GPUTasks, in spec order
+        """
+        tasks = [self._create_task(**spec) for spec in task_specs]
+        self._enqueue(tasks)
+        logger.info(f"Added {len(tasks)} tasks")
+
+        return tasks
+
+    def _enqueue(self, tasks: List[GPUTask]) -> None:
+        """
+        Admit created tasks into the DAG and queue.
+
+        Cache restores, store lookups, persistence and callbacks all run
+        outside the lock; it is held only for in-memory bookkeeping.
+
+        Raises:
+            ValueError: If a dependency is unknown
+        """
+        cached = self._restore_cached(tasks)
         with self._lock:
-            self.task_queue.append(task)
-            # Sort by priority
-            self.task_queue.sort(key=lambda t: t.priority.value)
+            unresolved = self._unresolved_dependencies(tasks)
+        stored = self.store.statuses(unresolved) if unresolved else {}
 
-        self._save_state()
-        logger.info(f"Added task {task_id} (priority: {priority.name})")
+        with self._lock:
+            ready, _ = self._admit(tasks, cached, stored)
+            self.task_queue.extend(ready)
 
-        return task
+        self._persist(*tasks)
+        self._run_cached_callbacks(tasks, cached)
+        self._count_added(tasks)
+        self._signal_wakeup()
+
+    def submit_threadsafe(self, **spec: Any) -> Future:
+        """
+        Queue a task from any thread without touching orchestrator state.
+
+        The spec (add_task keyword arguments) is picked up by the
+        processing loop, which admits everything submitted since its last
+        pass as one batch. Without a running loop, submissions wait for
+        the next process_queue or drain_submissions call.
+
+        Returns:
+            Future resolving to the created GPUTask (or raising ValueError
+            for an unknown dependency)
+        """
+        future: Future = Future()
+        self._submissions.put((spec, future))
+        self._signal_wakeup()
+        return future
+
+    def drain_submissions(self) -> int:
+        """
+        Admit tasks queued by submit_threadsafe.
+
+        Returns:
+            Number of submissions processed
+        """
+        batch = []
+        while True:
+            try:
+                batch.append(self._submissions.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return 0
+
+        created = []
+        for spec, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                created.append((self._create_task(**spec), future))
+            except Exception as e:
+                future.set_exception(e)
+
+        try:
+            self._enqueue([task for task, _ in created])
+        except ValueError:
+            # Isolate the bad submission(s); admit the rest one by one
+            for task, future in created:
+                try:
+                    self._enqueue([task])
+                except ValueError as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(task)
+        else:
+            for task, future in created:
+                future.set_result(task)
+
+        logger.debug(f"Admitted {len(created)} submitted tasks")
+        return len(batch)
+
+    def _count_added(self, tasks: List[GPUTask]) -> None:
+        """Count added tasks per type."""
+        counts: Dict[str, int] = {}
+        for task in tasks:
+            counts[task.task_type.value] = counts.get(task.task_type.value, 0) + 1
+        for task_type, count in counts.items():
+            self._m_added.inc(count, type=task_type)
 
     def add_audiobook_batch(
         self,
@@ -318,25 +1214,30 @@ class GPUOrchestrator:
         voice_profile: str,
         output_dir: Path,
         overnight: bool = True,
+        mastered_dir: Optional[Path] = None,
     ) -> List[GPUTask]:
         """
         Add a batch of audiobook chapter synthesis tasks.
 
+        With mastered_dir, each chapter also gets a mastering task that
+        depends only on its own synthesis, so chapter N is mastered while
+        chapter N+1 is still synthesizing.
+
         Args:
             book_id: Book identifier
             chapters: List of chapter data
             voice_profile: Voice profile ID
             output_dir: Output directory
             overnight: Schedule for overnight processing
+            mastered_dir: Output directory for per-chapter mastering tasks
 
         Returns:
-            List of created tasks
+            List of created tasks (synthesis, then mastering)
         """
-        tasks = []
         priority = TaskPriority.OVERNIGHT if overnight else TaskPriority.NORMAL
 
-        for i, chapter in enumerate(chapters):
-            task = self.add_task(
+        synthesis = [
+            self._create_task(
                 task_type=TaskType.TTS_SYNTHESIS,
                 input_data={
                     "book_id": book_id,
@@ -350,9 +1251,29 @@ class GPUOrchestrator:
                 priority=priority,
                 estimated_minutes=len(chapter.get("text", "")) // 1000 + 5,  # ~1min per 1000 chars
             )
-            tasks.append(task)
+            for i, chapter in enumerate(chapters)
+        ]
+
+        mastering = [
+            self._create_task(
+                task_type=TaskType.AUDIO_MASTERING,
+                input_data={
+                    "book_id": book_id,
+                    "chapter_index": tts.input_data["chapter_index"],
+                    "input_path": str(tts.output_path),
+                },
+                output_path=mastered_dir / tts.output_path.name,
+                priority=priority,
+                estimated_minutes=2,
+                depends_on=[tts],
+            )
+            for tts in synthesis
+        ] if mastered_dir else []
 
-        logger.info(f"Queued {len(tasks)} chapters for {book_id}")
+        tasks = synthesis + mastering
+        self._enqueue(tasks)
+
+        logger.info(f"Queued {len(synthesis)} chapters for {book_id}")
         return tasks
 
     def add_cover_art_batch(
@@ -361,39 +1282,159 @@ class GPUOrchestrator:
         prompts: List[str],
         output_dir: Path,
         dimensions: tuple[int, int] = (3000, 3000),
+        seed: int = 0,
     ) -> List[GPUTask]:
         """
         Add batch of cover art generation tasks.
 
+        Variations are seeded (seed + index), so an unchanged prompt is
+        restored from the artifact cache instead of regenerated.
+
         Args:
             book_id: Book identifier
             prompts: List of prompts for different variations
             output_dir: Output directory
             dimensions: Output image dimensions
+            seed: Base seed for the variations
 
         Returns:
-            List of created tasks
+            List of created tasks (cache hits already completed)
         """
-        tasks = []
+        negative_prompt = self._get_negative_prompt(book_id)
+        return self.add_tasks([
+            {
+                "task_type": TaskType.IMAGE_GENERATION,
+                "input_data": {
+                    "book_id": book_id,
+                    "prompt": prompt,
+                    "negative_prompt": negative_prompt,
+                    "width": dimensions[0],
+                    "height": dimensions[1],
+                    "variation": i,
+                    "seed": seed + i,
+                },
+                "output_path": output_dir / f"cover_v{i+1}.png",
+                "priority": TaskPriority.NORMAL,
+                "estimated_minutes": 2,
+            }
+            for i, prompt in enumerate(prompts)
+        ])
+
+    def add_cover_production(
+        self,
+        book_id: str,
+        prompts: List[str],
+        output_dir: Path,
+        candidates: int = 16,
+        keep: int = 2,
+        dimensions: tuple[int, int] = (3000, 3000),
+        candidate_size: int = 512,
+        seed: int = 0,
+        priority: TaskPriority = TaskPriority.NORMAL,
+    ) -> List[GPUTask]:
+        """
+        Add seed-sweep cover production tasks, one per prompt.
 
-        for i, prompt in enumerate(prompts):
-            task = self.add_task(
-                task_type=TaskType.IMAGE_GENERATION,
-                input_data={
+        Each task renders `candidates` seeds at candidate_size, drops
+        near-duplicates and weak renders on the CPU, and upscales only
+        the best `keep` to full size (see cover_pipeline). Covers are
+        written as cover_p{prompt}_{n}.png with a JSON manifest per prompt.
+
+        Args:
+            book_id: Book identifier
+            prompts: One prompt per cover concept
+            output_dir: Output directory
+            candidates: Seeds swept per prompt
+            keep: Covers delivered per prompt
+            dimensions: Final cover size
+            candidate_size: Edge length of sweep renders
+            seed: First seed (prompt i sweeps from seed + i * candidates)
+            priority: Task priority
+
+        Returns:
+            List of created tasks
+        """
+        negative_prompt = self._get_negative_prompt(book_id)
+        # Modelled SDXL-class timings: sweep renders plus one upscale pass each
+        sweep_seconds = candidates * 5.0 * (candidate_size ** 2 / 1024 ** 2) ** 1.15
+        estimated = max(1, math.ceil((sweep_seconds + keep * 12.0) / 60))
+
+        return self.add_tasks([
+            {
+                "task_type": TaskType.IMAGE_GENERATION,
+                "input_data": {
                     "book_id": book_id,
                     "prompt": prompt,
-                    "negative_prompt": self._get_negative_prompt(book_id),
+                    "negative_prompt": negative_prompt,
                     "width": dimensions[0],
                     "height": dimensions[1],
                     "variation": i,
+                    "seed": seed + i * candidates,
+                    "candidates": candidates,
+                    "keep": keep,
+                    "candidate_size": candidate_size,
                 },
-                output_path=output_dir / f"cover_v{i+1}.png",
-                priority=TaskPriority.NORMAL,
-                estimated_minutes=2,
-            )
-            tasks.append(task)
+                "output_path": output_dir / f"cover_p{i+1}.json",
+                "priority": priority,
+                "estimated_minutes": estimated,
+            }
+            for i, prompt in enumerate(prompts)
+        ])
+
+    def add_companion_content_batch(
+        self,
+        titles: List[Dict[str, str]],
+        output_dir: Path,
+        word_targets: Optional[Dict[str, int]] = None,
+        system_prompt: str = COMPANION_SYSTEM_PROMPT,
+        titles_per_task: int = 4,
+        priority: TaskPriority = TaskPriority.LOW,
+    ) -> List[GPUTask]:
+        """
+        Add batched LLM tasks generating companion content sections.
 
-        return tasks
+        Each task covers several titles, so its prompts (one per section
+        per title) share a decode batch and the system-prompt prefix.
+
+        Args:
+            titles: Dicts with "book_id" and "title"
+            output_dir: Where each task's sections JSON is written
+            word_targets: Words per section (default: content creator targets)
+            system_prompt: Instructions shared by every prompt
+            titles_per_task: Titles grouped into one task
+            priority: Task priority
+
+        Returns:
+            List of created tasks
+        """
+        targets = word_targets or COMPANION_WORD_TARGETS
+        specs = []
+        for start in range(0, len(titles), titles_per_task):
+            group = titles[start:start + titles_per_task]
+            prompts, names, limits = [], [], []
+            for work in group:
+                for section, words in targets.items():
+                    prompts.append(
+                        f"Write the {section.replace('_', ' ')} for an annotated edition "
+                        f"of \"{work['title']}\". Target length: about {words} words."
+                    )
+                    names.append(f"{work['book_id']}/{section}")
+                    limits.append(math.ceil(words * TOKENS_PER_WORD))
+
+            specs.append({
+                "task_type": TaskType.LLM_INFERENCE,
+                "input_data": {
+                    "task_name": "companion_content:" + ",".join(w["book_id"] for w in group),
+                    "system_prompt": system_prompt,
+                    "prompts": prompts,
+                    "prompt_names": names,
+                    "max_tokens_list": limits,
+                },
+                "output_path": output_dir / f"companion_{start // titles_per_task + 1:03d}.json",
+                "priority": priority,
+                "estimated_minutes": max(1, math.ceil(sum(limits) / (25 * 60))),
+            })
+        return self.add_tasks(specs)
 
     def _get_negative_prompt(self, book_id: str) -> str:
         """Get negative prompt for cover art based on book."""
@@ -432,63 +1473,179 @@ class GPUOrchestrator:
         Returns:
             True if successful
         """
+        segment_start = datetime.now()
+        task_type = task.task_type.value
+        if task.started_at is None:
+            self._m_wait.observe(
+                (segment_start - task.created_at).total_seconds(), type=task_type
+            )
         task.status = TaskStatus.RUNNING
-        task.started_at = datetime.now()
+        task.started_at = task.started_at or segment_start
+        await asyncio.to_thread(self._persist, task)
 
         try:
-            logger.info(f"Starting task {task.task_id}")
-
-            if task.task_type == TaskType.TTS_SYNTHESIS:
-                await self._run_tts_task(task)
-            elif task.task_type == TaskType.IMAGE_GENERATION:
-                await self._run_image_task(task)
-            elif task.task_type == TaskType.LLM_INFERENCE:
-                await self._run_llm_task(task)
-            elif task.task_type == TaskType.AUDIO_MASTERING:
-                await self._run_mastering_task(task)
+            if task.checkpoint:
+                logger.info(f"Resuming task {task.task_id} from {task.checkpoint}")
             else:
-                raise ValueError(f"Unknown task type: {task.task_type}")
+                logger.info(f"Starting task {task.task_id}")
+
+            await self._execute(task)
 
             task.status = TaskStatus.COMPLETED
             task.progress = 1.0
             task.completed_at = datetime.now()
-            task.actual_duration_minutes = int(
-                (task.completed_at - task.started_at).total_seconds() / 60
+            segment = (task.completed_at - segment_start).total_seconds()
+            task.actual_duration_seconds += segment
+            task.actual_duration_minutes = int(task.actual_duration_seconds / 60)
+            self._m_run.observe(segment, type=task_type, status="completed")
+            self._m_finished.inc(type=task_type, status="completed")
+            await asyncio.to_thread(
+                self.durations.record,
+                task.task_type.value,
+                task.input_data,
+                task.actual_duration_seconds,
             )
 
             logger.info(
                 f"Completed task {task.task_id} in {task.actual_duration_minutes} minutes"
             )
-
-            if task.callback:
-                task.callback(task)
-
-            return True
+            self._note_deadline(task)
+
+        except TaskPreempted:
+            segment = (datetime.now() - segment_start).total_seconds()
+            task.status = TaskStatus.PAUSED
+            task.preemptions += 1
+            task.actual_duration_seconds += segment
+            self._m_run.observe(segment, type=task_type, status="preempted")
+            logger.info(f"Preempted task {task.task_id} at {task.checkpoint}")
+            return False
 
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.error_message = str(e)
             task.completed_at = datetime.now()
+            self._m_run.observe(
+                (task.completed_at - segment_start).total_seconds(),
+                type=task_type,
+                status="failed",
+            )
+            self._m_finished.inc(type=task_type, status="failed")
             logger.error(f"Task {task.task_id} failed: {e}")
             return False
 
+        # Outside the try: the task's outcome is final before user code runs
+        self._run_callback(task)
+        return True
+
+    def _checkpoint(self, task: GPUTask, **state: Any) -> None:
+        """
+        Record resumable progress at a chunk boundary.
+
+        Raises:
+            TaskPreempted: If the scheduler asked this task to yield
+        """
+        task.checkpoint = state
+        if task.task_id in self._preempt_requests:
+            raise TaskPreempted(task.task_id)
+
+    def _note_deadline(self, task: GPUTask) -> None:
+        """Log a finished task that missed its deadline."""
+        if task.missed_deadline and task.completed_at and task.deadline:
+            late = task.completed_at - task.deadline
+            logger.warning(
+                f"Task {task.task_id} missed its deadline by "
+                f"{late.total_seconds() / 60:.0f} minutes"
+            )
+
+    async def _execute(self, task: GPUTask) -> None:
+        """Dispatch a task to its backend or type-specific runner."""
+        backend = self.backends.get(task.task_type)
+        if backend is not None:
+            await backend.run(task)
+        elif task.task_type == TaskType.TTS_SYNTHESIS:
+            await self._run_tts_task(task)
+        elif task.task_type == TaskType.IMAGE_GENERATION:
+            await self._run_image_task(task)
+        elif task.task_type == TaskType.LLM_INFERENCE:
+            await self._run_llm_task(task)
+        elif task.task_type == TaskType.AUDIO_MASTERING:
+            await self._run_mastering_task(task)
+        else:
+            raise ValueError(f"Unknown task type: {task.task_type}")
+
     async def _run_tts_task(self, task: GPUTask) -> None:
         """Run TTS synthesis task."""
         # This would integrate with the audiobook pipeline
         # For now, placeholder that shows the structure
 
         data = task.input_data
+        text = data['text']
         logger.info(
             f"TTS: {data['book_id']} - {data['chapter_title']} "
-            f"({len(data['text'])} chars)"
+            f"({len(text)} chars)"
         )
 
-        # Simulate TTS processing
-        # In production, this calls src.audiobook.tts.tts_engine
-        task.progress = 0.5
+        if self.tts_pipeline is not None:
+            await self._run_chunked_tts(task, self.tts_pipeline)
+            return
+
+        # Chunk size and idle time are re-read per chunk so throttling
+        # takes effect mid-chapter
+        position = task.checkpoint.get("position", 0)
+        while position < len(text):
+            chunk_chars = self.throttle.batch_size(self.TTS_CHUNK_CHARS, minimum=200)
+            chunk = text[position:position + chunk_chars]
+            position += len(chunk)
+
+            # In production, this calls src.audiobook.tts.tts_engine per chunk
+            started = time.monotonic()
+            await asyncio.sleep(0)
+            task.progress = 0.9 * position / len(text)
+            self._checkpoint(task, position=position)
+            await self._duty_cycle_pause(time.monotonic() - started)
+
         await asyncio.sleep(1)  # Placeholder
         task.progress = 1.0
 
+    async def _run_chunked_tts(self, task: GPUTask, pipeline: ChunkedTTSPipeline) -> None:
+        """
+        Synthesize a chapter through the chunked TTS pipeline.
+
+        Finished chunks are kept next to the output (named by content
+        key, so edited text is re-rendered), and a preempted chapter
+        resumes from its last finished batch. On failure the directory is
+        removed; a re-queued chapter still reuses its finished chunks
+        through the artifact cache.
+        """
+        chunk_dir = task.output_path.with_suffix(".chunks")
+
+        def on_progress(done: int, total: int) -> None:
+            task.progress = 0.95 * done / total
+            self._checkpoint(task, chunks_done=done)
+
+        try:
+            samples = await pipeline.synthesize(
+                task.input_data["text"],
+                voice_profile=task.input_data.get("voice_profile", "default"),
+                chunk_dir=chunk_dir,
+                on_progress=on_progress,
+                max_concurrency=self.throttle.batch_size(pipeline.max_concurrent_batches),
+                # Batch concurrency is already scaled; pace only the remainder
+                pace=lambda busy: self.throttle.duty_cycle_delay(
+                    busy, self.max_concurrent * pipeline.max_concurrent_batches
+                ),
+            )
+        except TaskPreempted:
+            raise
+        except Exception:
+            await asyncio.to_thread(shutil.rmtree, chunk_dir, True)
+            raise
+        await asyncio.to_thread(
+            write_wav, task.output_path, samples, pipeline.engine.sample_rate
+        )
+        await asyncio.to_thread(shutil.rmtree, chunk_dir, True)
+        task.progress = 1.0
+
     async def _run_image_task(self, task: GPUTask) -> None:
         """Run image generation task."""
         data = task.input_data
@@ -497,21 +1654,122 @@ class GPUOrchestrator:
             f"({data['width']}x{data['height']})"
         )
 
+        if self.covers is not None and "candidates" in data:
+            await self._run_cover_sweep(task, self.covers)
+            return
+
+        # Cache check covers tasks that were blocked when they were added
+        key = self._artifact_key(task)
+        suffix = task.output_path.suffix
+        if key is not None and await asyncio.to_thread(
+            self.artifacts.restore, key, task.output_path, suffix
+        ):
+            task.progress = 1.0
+            return
+
         # Would call Stable Diffusion
         task.progress = 0.5
         await asyncio.sleep(1)  # Placeholder
         task.progress = 1.0
 
+        if key and task.output_path.exists():
+            await asyncio.to_thread(self.artifacts.put_file, key, task.output_path, suffix)
+
+    async def _run_cover_sweep(self, task: GPUTask, covers: CoverArtPipeline) -> None:
+        """Sweep seeds at low resolution, select on CPU, upscale the keepers."""
+        data = task.input_data
+
+        def on_progress(stage: str, done: int, total: int) -> None:
+            if stage == "sweep":
+                task.progress = 0.7 * done / total
+            else:
+                task.progress = 0.7 + 0.25 * done / total
+
+        result = await covers.produce(
+            data["prompt"],
+            data.get("negative_prompt", ""),
+            task.output_path.parent,
+            candidates=data["candidates"],
+            keep=data.get("keep", 1),
+            seed=data.get("seed", 0),
+            name=task.output_path.stem,
+            candidate_size=data.get("candidate_size"),
+            final_size=(data["width"], data["height"]),
+            on_progress=on_progress,
+        )
+        await asyncio.to_thread(self._write_json, task.output_path, result.to_dict())
+        task.progress = 1.0
+
     async def _run_llm_task(self, task: GPUTask) -> None:
         """Run LLM inference task."""
         data = task.input_data
         logger.info(f"LLM: {data.get('task_name', 'inference')}")
 
-        # Would call Ollama or local LLM
-        task.progress = 0.5
-        await asyncio.sleep(1)  # Placeholder
+        if self.llm is not None:
+            await self._run_batched_llm(task, self.llm)
+            return
+
+        # Each prompt is a chunk boundary (checkpoint/preemption point)
+        prompts = data.get("prompts") or [data.get("prompt", "")]
+        for index in range(task.checkpoint.get("prompt_index", 0), len(prompts)):
+            # Would call Ollama or local LLM
+            await asyncio.sleep(1 / len(prompts))  # Placeholder
+            task.progress = (index + 1) / len(prompts)
+            self._checkpoint(task, prompt_index=index + 1)
+
+        task.progress = 1.0
+
+    async def _run_batched_llm(self, task: GPUTask, llm: BatchedLLMScheduler) -> None:
+        """
+        Run a task's prompts through the shared continuous-batching scheduler.
+
+        Completed prompts are written to the output JSON as they finish,
+        so a preempted or failed task resumes with only the rest.
+        """
+        data = task.input_data
+        prompts = data.get("prompts") or [data.get("prompt", "")]
+        names = data.get("prompt_names") or [str(i) for i in range(len(prompts))]
+        limits = data.get("max_tokens_list") or [data.get("max_tokens", 512)] * len(prompts)
+
+        output: Dict[str, Any] = {"sections": {}}
+        if task.output_path.exists():
+            output = json.loads(await asyncio.to_thread(task.output_path.read_text))
+        sections = output["sections"]
+
+        start = time.perf_counter()
+        futures = {
+            llm.submit(prompt, data.get("system_prompt", ""), limit): name
+            for prompt, name, limit in zip(prompts, names, limits)
+            if name not in sections
+        }
+        results = []
+        try:
+            waiting = set(futures)
+            while waiting:
+                done, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results.append(result)
+                    sections[futures[future]] = result.text
+                await asyncio.to_thread(self._write_json, task.output_path, output)
+                task.progress = len(sections) / len(prompts)
+                self._checkpoint(task, completed=len(sections))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        if results:
+            output["report"] = llm.report(results, time.perf_counter() - start).to_dict()
+            await asyncio.to_thread(self._write_json, task.output_path, output)
         task.progress = 1.0
 
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
     async def _run_mastering_task(self, task: GPUTask) -> None:
         """Run audio mastering task."""
         data = task.input_data
@@ -522,58 +1780,339 @@ class GPUOrchestrator:
         await asyncio.sleep(1)  # Placeholder
         task.progress = 1.0
 
-    async def process_queue(self) -> None:
-        """Process tasks in the queue."""
-        self._running = True
+    def _schedule_ready(self, stats: GPUStats) -> List[GPUTask]:
+        """
+        Pack runnable tasks into free VRAM (caller holds the lock).
 
-        while self._running and self.task_queue:
-            # Get next task
-            with self._lock:
-                if not self.task_queue:
-                    break
+        `stats` is a telemetry snapshot taken before the lock, so no
+        sampling (nvidia-smi) can happen while it is held.
 
-                task = None
-                for t in self.task_queue:
-                    can_run, reason = self.can_run_task(t)
-                    if can_run:
-                        task = t
-                        self.task_queue.remove(t)
-                        self.running_tasks[t.task_id] = t
-                        break
-
-                if not task:
-                    # No runnable tasks, wait
-                    await asyncio.sleep(60)
-                    continue
+        Eligible tasks from the best runnable priority band (plus the
+        policy's lookahead bands) are handed to the scheduling policy,
+        which picks one; this repeats until nothing else fits. When a
+        task is held back only by VRAM, lower priority bands may not
+        backfill around it, so large high-priority tasks are not starved
+        by small ones.
 
-            # Run the task
-            success = await self.run_task(task)
+        Returns:
+            Tasks moved from the queue to running_tasks
+        """
+        launched: List[GPUTask] = []
+
+        while len(self.running_tasks) < self.concurrency_limit:
+            blocked_band: Optional[int] = None
+            first_band: Optional[int] = None
+
+            def eligible(task: GPUTask) -> bool:
+                nonlocal blocked_band, first_band
+                can_run, _ = self.can_run_task(task, stats)
+                if can_run:
+                    if first_band is None:
+                        first_band = task.priority.value
+                    return True
+                if blocked_band is None and self.required_vram_gb(task) > self.available_vram_gb(stats):
+                    blocked_band = task.priority.value
+                return False
+
+            def stop(task: GPUTask) -> bool:
+                band = task.priority.value
+                if blocked_band is not None and band > blocked_band:
+                    return True
+                return first_band is not None and band > first_band + self.policy.lookahead_bands
+
+            candidates = self.task_queue.scan(eligible, stop=stop, limit=self.policy.window)
+            if not candidates:
+                break
+
+            task = self.policy.select(
+                candidates, self.residency,
+                now=datetime.now(),
+                predict_seconds=lambda t: self.predicted_minutes(t) * 60,
+            )
+            self.task_queue.remove(task)
+            if self.residency.load(task.task_type):
+                self._m_switches.inc(type=task.task_type.value)
+                logger.info(f"Loading {task.task_type.value} model for {task.task_id}")
 
-            # Move to completed
+            self.running_tasks[task.task_id] = task
+            launched.append(task)
+            logger.info(
+                f"Scheduled {task.task_id} ({self.required_vram_gb(task):.1f}GB, "
+                f"{self.reserved_vram_gb:.1f}GB reserved)"
+            )
+
+        self._maybe_preempt(stats)
+        return launched
+
+    def _maybe_preempt(self, stats: GPUStats) -> Optional[GPUTask]:
+        """
+        Ask a running task to yield to an urgent queued one (caller holds the lock).
+
+        The head of the queue preempts a running TTS/LLM task from a lower
+        priority band when it is CRITICAL, or when waiting for that task
+        would make it miss its deadline, and only if the victim's slot or
+        VRAM is what it is waiting for. The victim stops at its next
+        checkpoint and is re-queued to resume from there. Tasks running on
+        an executor backend never reach a checkpoint, so they are not
+        victims.
+
+        Returns:
+            Task asked to yield, or None
+        """
+        if self._preempt_requests:
+            return None  # One preemption in flight at a time
+
+        waiting = self.task_queue.peek()
+        if waiting is None:
+            return None
+        can_run, reason = self.can_run_task(waiting, stats)
+        vram_bound = reason.startswith("Insufficient VRAM")
+        if can_run or not (vram_bound or reason.startswith("Max concurrent")):
+            return None
+
+        victims = [
+            t for t in self.running_tasks.values()
+            if t.task_type in self.PREEMPTIBLE_TYPES
+            and t.task_type not in self.backends
+            and t.priority.value > waiting.priority.value
+            and (
+                not vram_bound
+                or self.required_vram_gb(waiting)
+                <= self.available_vram_gb(stats) + self.required_vram_gb(t)
+            )
+        ]
+        if not victims:
+            return None
+        victim = max(victims, key=lambda t: (t.priority.value, -t.progress))
+
+        urgent = waiting.priority == TaskPriority.CRITICAL
+        if not urgent and waiting.deadline:
+            wait_minutes = self.predicted_minutes(victim) * (1 - victim.progress)
+            finish = datetime.now() + timedelta(
+                minutes=wait_minutes + self.predicted_minutes(waiting)
+            )
+            urgent = finish > waiting.deadline
+        if not urgent:
+            return None
+
+        self._preempt_requests.add(victim.task_id)
+        self.preemptions += 1
+        self._m_preempted.inc(type=victim.task_type.value)
+        logger.warning(f"Preempting {victim.task_id} for {waiting.task_id}")
+        return victim
+
+    async def _run_and_release(self, task: GPUTask) -> bool:
+        """Run a scheduled task, then release its VRAM reservation."""
+        try:
+            return await self.run_task(task)
+        finally:
             with self._lock:
-                del self.running_tasks[task.task_id]
-                self.completed_tasks.append(task)
+                self.running_tasks.pop(task.task_id, None)
+                self._preempt_requests.discard(task.task_id)
+                ready: List[GPUTask] = []
+                cancelled: List[GPUTask] = []
+                if task.status == TaskStatus.PAUSED:
+                    self.task_queue.push(task)  # Resumes from its checkpoint
+                else:
+                    self.completed_tasks.append(task)
+                    ready, cancelled = self._resolve_dependents(task)
+                self._update_queue_gauges()
+            await asyncio.to_thread(self._persist, task, *cancelled)
+            if ready:
+                logger.info(f"{len(ready)} task(s) unblocked by {task.task_id}")
+
+    def claim_task(self, predicate: Callable[[GPUTask], bool]) -> Optional[GPUTask]:
+        """
+        Hand the first matching queued task to an external worker.
 
-            self._save_state()
+        The task leaves the queue and is marked RUNNING in the store; the
+        caller must later call finish_claimed_task or requeue_task.
 
-        self._running = False
+        Args:
+            predicate: Whether the worker can run a candidate task
+
+        Returns:
+            Claimed task, or None
+        """
+        with self._lock:
+            task = self.task_queue.pop_first(predicate)
+        if task is None:
+            return None
+
+        task.status = TaskStatus.RUNNING
+        task.started_at = datetime.now()
+        task.progress = 0.0
+        self._persist(task)
+        self._m_wait.observe(
+            (task.started_at - task.created_at).total_seconds(),
+            type=task.task_type.value,
+        )
+        return task
+
+    def requeue_task(self, task: GPUTask, reason: str = "") -> None:
+        """Return a claimed task to the queue (e.g. after a lost lease)."""
+        task.status = TaskStatus.PENDING
+        task.started_at = None
+        task.progress = 0.0
+        with self._lock:
+            self.task_queue.push(task)
+        self._persist(task)
+        self._m_requeued.inc(type=task.task_type.value)
+        self._signal_wakeup()
+        logger.warning(f"Requeued task {task.task_id}{': ' + reason if reason else ''}")
+
+    def finish_claimed_task(
+        self,
+        task: GPUTask,
+        success: bool,
+        error: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Record the outcome of a task run by an external worker.
+
+        Args:
+            task: Task returned by claim_task
+            success: Whether the worker completed it
+            error: Failure message
+            duration_seconds: Worker-measured run time (default: since claim)
+        """
+        task.completed_at = datetime.now()
+        if duration_seconds is None and task.started_at:
+            duration_seconds = (task.completed_at - task.started_at).total_seconds()
+        outcome = "completed" if success else "failed"
+        self._m_run.observe(duration_seconds or 0.0, type=task.task_type.value, status=outcome)
+        self._m_finished.inc(type=task.task_type.value, status=outcome)
+
+        if success:
+            task.status = TaskStatus.COMPLETED
+            task.progress = 1.0
+            task.actual_duration_seconds = duration_seconds or 0.0
+            task.actual_duration_minutes = int(task.actual_duration_seconds / 60)
+            self.durations.record(
+                task.task_type.value, task.input_data, task.actual_duration_seconds
+            )
+            logger.info(f"Worker completed task {task.task_id}")
+        else:
+            task.status = TaskStatus.FAILED
+            task.error_message = error
+            logger.error(f"Task {task.task_id} failed on worker: {error}")
+        self._note_deadline(task)
+
+        with self._lock:
+            self.completed_tasks.append(task)
+            ready, cancelled = self._resolve_dependents(task)
+        self._persist(task, *cancelled)
+        if ready:
+            self._signal_wakeup()
+
+        if success:
+            self._run_callback(task)
+
+    async def process_queue(self) -> None:
+        """
+        Process tasks in the queue.
+
+        Runs as many tasks concurrently as fit in VRAM and
+        max_concurrent_tasks allow. The loop sleeps until something can
+        change the schedule: a task completes, a task is added, telemetry
+        shows freed VRAM or a cooled GPU, or the overnight window opens
+        or closes.
+        """
+        self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.telemetry.start()
+        active: Dict[asyncio.Task, GPUTask] = {}
+
+        try:
+            while self._running and (
+                self.task_queue or active or not self._submissions.empty()
+            ):
+                self._wakeup.clear()
+                if not self._submissions.empty():
+                    await asyncio.to_thread(self.drain_submissions)
+
+                stats = await asyncio.to_thread(self.telemetry.snapshot)
+                pass_start = time.perf_counter()
+                with self._lock:
+                    launched = self._schedule_ready(stats)
+                    self._update_queue_gauges()
+                self._m_schedule.observe(time.perf_counter() - pass_start)
+
+                for task in launched:
+                    active[asyncio.create_task(self._run_and_release(task))] = task
+
+                waiter = asyncio.create_task(self._wakeup.wait())
+                timeout = min(
+                    self.seconds_until_window_change() + 1,
+                    self.IDLE_RECHECK_SECONDS,
+                )
+                done, _ = await asyncio.wait(
+                    {*active.keys(), waiter},
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                waiter.cancel()
+                for finished in done:
+                    active.pop(finished, None)
+
+            # Graceful stop: let in-flight tasks finish
+            if active:
+                await asyncio.gather(*active.keys())
+        finally:
+            self._running = False
+            self._loop = None
+            self._wakeup = None
+            await asyncio.to_thread(self.telemetry.stop)
+            await asyncio.to_thread(self.close_backends)
+            await asyncio.to_thread(self._save_state)
 
     def start_overnight_batch(self) -> None:
         """Start overnight batch processing."""
         logger.info("Starting overnight batch processing")
         self._overnight_mode = True
+        self.plan_overnight(apply=True)
 
         # Run async processing
         asyncio.run(self.process_queue())
 
+    def close_backends(self) -> None:
+        """Stop executor backend worker processes."""
+        for backend in self.backends.values():
+            try:
+                backend.close()
+            except Exception as e:
+                logger.warning(f"Failed to close executor backend: {e}")
+
     def stop_processing(self) -> None:
         """Stop processing (gracefully finish current task)."""
         logger.info("Stopping processing after current task")
         self._running = False
+        self._signal_wakeup()
+
+    def _snapshot(self) -> _QueueSnapshot:
+        """
+        Copy the shared task state under the lock.
+
+        Producers and the processing loop change the queue, the running
+        and blocked maps and the completed list under the lock, so
+        readers copy them here and do their computation outside it.
+        """
+        with self._lock:
+            return _QueueSnapshot(
+                queued=self.task_queue.ordered(),
+                blocked=list(self._blocked.values()),
+                running=list(self.running_tasks.values()),
+                completed=list(self.completed_tasks),
+                resident_models=[t.value for t in self.residency.resident],
+                plan_waiting=len(self._plan_waiting()),
+            )
 
     def get_queue_status(self) -> Dict[str, Any]:
         """Get current queue status."""
-        stats = self.get_gpu_stats()
+        stats = self.telemetry.snapshot()
+        snapshot = self._snapshot()
 
         return {
             "gpu": {
@@ -584,33 +2123,111 @@ class GPUOrchestrator:
                 "temperature_celsius": stats.temperature_celsius,
             },
             "queue": {
-                "pending": len(self.task_queue),
-                "running": len(self.running_tasks),
-                "completed": len(self.completed_tasks),
+                "pending": len(snapshot.queued),
+                "blocked": len(snapshot.blocked),
+                "running": len(snapshot.running),
+                "completed": len(snapshot.completed),
             },
             "tasks": {
-                "pending": [t.to_dict() for t in self.task_queue[:10]],
-                "running": [t.to_dict() for t in self.running_tasks.values()],
+                "pending": [t.to_dict() for t in snapshot.queued[:10]],
+                "running": [t.to_dict() for t in snapshot.running],
             },
+            "scheduling": {
+                **self.policy.stats(),
+                "model_switches": self.residency.switches,
+                "resident_models": snapshot.resident_models,
+            },
+            "throttle": self.throttle.to_dict(self.max_concurrent),
+            "deadlines": self._deadline_report(snapshot),
+            "overnight_plan": {
+                "generated_at": self.overnight_plan.generated_at.isoformat(),
+                "tonight": len(self.overnight_plan.tonight),
+                "deferred": len(self.overnight_plan.deferred),
+                "utilization": round(self.overnight_plan.utilization, 3),
+                "selected_waiting": snapshot.plan_waiting,
+            } if self.overnight_plan else None,
+            "backends": {t.value: b.stats() for t, b in self.backends.items()},
+            "artifact_cache": self.artifacts.stats(),
+            "llm": self.llm.stats() if self.llm else None,
+            "covers": self.covers.stats() if self.covers else None,
             "overnight_mode": self._overnight_mode,
             "is_running": self._running,
         }
 
+    def deadline_report(self) -> Dict[str, Any]:
+        """
+        Deadline misses and risks.
+
+        Returns:
+            Dict with finished tasks that missed their deadline, queued or
+            running tasks projected to miss theirs (tasks run back to back
+            in queue order), and the preemption count
+        """
+        return self._deadline_report(self._snapshot())
+
+    def _deadline_report(self, snapshot: _QueueSnapshot) -> Dict[str, Any]:
+        """Deadline report computed from a snapshot of the queue."""
+        now = datetime.now()
+        at_risk = []
+
+        def check(task: GPUTask, minutes: float) -> None:
+            projected = now + timedelta(minutes=minutes)
+            if task.deadline and projected > task.deadline:
+                at_risk.append({
+                    "task_id": task.task_id,
+                    "deadline": task.deadline.isoformat(),
+                    "projected_finish": projected.isoformat(),
+                    "status": task.status.value,
+                })
+
+        # Running tasks finish in parallel; queued ones follow back to back
+        backlog = 0.0
+        for task in snapshot.running:
+            remaining = self.predicted_minutes(task) * (1 - task.progress)
+            check(task, remaining)
+            backlog += remaining
+        for task in snapshot.queued + snapshot.blocked:
+            backlog += self.predicted_minutes(task)
+            check(task, backlog)
+
+        missed = [
+            {
+                "task_id": t.task_id,
+                "deadline": t.deadline.isoformat(),
+                "completed_at": t.completed_at.isoformat(),
+                "late_minutes": round((t.completed_at - t.deadline).total_seconds() / 60, 1),
+            }
+            for t in snapshot.completed
+            if t.missed_deadline and t.completed_at and t.deadline
+        ]
+
+        return {
+            "missed": missed,
+            "at_risk": at_risk,
+            "preemptions": self.preemptions,
+        }
+
     def estimate_completion_time(self) -> Dict[str, Any]:
-        """Estimate when queue will complete."""
-        total_minutes = sum(t.estimated_duration_minutes for t in self.task_queue)
+        """Estimate when queue will complete (learned durations where available)."""
+        snapshot = self._snapshot()
+        total_minutes = sum(
+            self.predicted_minutes(t) for t in snapshot.queued + snapshot.blocked
+        )
 
         # Add running task remaining time
-        for task in self.running_tasks.values():
-            remaining = task.estimated_duration_minutes * (1 - task.progress)
+        for task in snapshot.running:
+            remaining = self.predicted_minutes(task) * (1 - task.progress)
             total_minutes += remaining
 
         completion_time = datetime.now() + timedelta(minutes=total_minutes)
 
         return {
-            "total_estimated_minutes": total_minutes,
+            "total_estimated_minutes": round(total_minutes, 1),
             "estimated_completion": completion_time.isoformat(),
-            "tasks_remaining": len(self.task_queue) + len(self.running_tasks),
+            "tasks_remaining": (
+                len(snapshot.queued) + len(snapshot.blocked) + len(snapshot.running)
+            ),
+            "duration_models": self.durations.to_dict(),
         }
 
 
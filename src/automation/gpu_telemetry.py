@@ -0,0 +1,236 @@
+"""
+GPU Telemetry Sampling
+
+Samples GPU statistics on a background thread and serves a cached
+snapshot, so scheduling decisions never fork nvidia-smi. Providers are
+plain callables returning GPUStats, which lets tests and simulations
+plug in a fake GPU.
+"""
+
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Optional, List, Any, Callable, Deque
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GPUStats:
+    """GPU statistics."""
+    name: str = "Unknown"
+    memory_total_gb: float = 0.0
+    memory_used_gb: float = 0.0
+    memory_free_gb: float = 0.0
+    utilization_percent: float = 0.0
+    temperature_celsius: float = 0.0
+    power_draw_watts: float = 0.0
+    sampled_at: float = field(default_factory=time.time)
+
+
+TelemetryProvider = Callable[[], GPUStats]
+
+# Called with (previous, current) after every sample
+TelemetryListener = Callable[[Optional[GPUStats], GPUStats], None]
+
+
+class NvidiaSmiProvider:
+    """Telemetry provider backed by the nvidia-smi CLI."""
+
+    QUERY = (
+        "--query-gpu=name,memory.total,memory.used,memory.free,"
+        "utilization.gpu,temperature.gpu,power.draw"
+    )
+
+    def __init__(
+        self,
+        default_name: str = "NVIDIA GeForce RTX 5080 (estimated)",
+        default_vram_gb: float = 16.0,
+        device_index: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize provider.
+
+        Args:
+            default_name: GPU name reported when nvidia-smi is unavailable
+            default_vram_gb: VRAM reported when nvidia-smi is unavailable
+            device_index: GPU to query on multi-GPU hosts (default: first)
+        """
+        self.default_name = default_name
+        self.default_vram_gb = default_vram_gb
+        self.device_index = device_index
+
+    def __call__(self) -> GPUStats:
+        """Query nvidia-smi once."""
+        stats = GPUStats()
+
+        try:
+            command = ["nvidia-smi", self.QUERY, "--format=csv,noheader,nounits"]
+            if self.device_index is not None:
+                command.append(f"--id={self.device_index}")
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+
+            if result.returncode == 0:
+                parts = result.stdout.strip().splitlines()[0].split(", ")
+                if len(parts) >= 7:
+                    stats.name = parts[0]
+                    stats.memory_total_gb = float(parts[1]) / 1024
+                    stats.memory_used_gb = float(parts[2]) / 1024
+                    stats.memory_free_gb = float(parts[3]) / 1024
+                    stats.utilization_percent = float(parts[4])
+                    stats.temperature_celsius = float(parts[5])
+                    stats.power_draw_watts = float(parts[6])
+
+        except Exception as e:
+            logger.warning(f"Could not get GPU stats: {e}")
+            # Return defaults for RTX 5080
+            stats.name = self.default_name
+            stats.memory_total_gb = self.default_vram_gb
+            stats.memory_free_gb = self.default_vram_gb
+
+        return stats
+
+
+class FakeTelemetryProvider:
+    """Settable telemetry provider for tests and simulations."""
+
+    def __init__(self, stats: Optional[GPUStats] = None) -> None:
+        """
+        Initialize fake provider.
+
+        Args:
+            stats: Initial stats (default: idle 16GB GPU)
+        """
+        self.stats = stats or GPUStats(
+            name="Fake GPU",
+            memory_total_gb=16.0,
+            memory_free_gb=16.0,
+            temperature_celsius=40.0,
+        )
+        self.calls = 0
+
+    def set(self, **changes: Any) -> None:
+        """Update reported fields, e.g. set(temperature_celsius=85)."""
+        self.stats = replace(self.stats, **changes)
+
+    def __call__(self) -> GPUStats:
+        self.calls += 1
+        return replace(self.stats, sampled_at=time.time())
+
+
+class TelemetrySampler:
+    """
+    Background GPU telemetry sampler with a cached snapshot.
+
+    Features:
+    - One provider call per interval, regardless of scheduling load
+    - Lazy sampling when the background thread is not running
+    - Bounded sample history for trend-based controllers
+    - Listeners notified after every sample
+    """
+
+    def __init__(
+        self,
+        provider: TelemetryProvider,
+        interval_seconds: float = 5.0,
+        history_size: int = 120,
+    ) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            provider: Callable returning GPUStats
+            interval_seconds: Sampling interval
+            history_size: Number of samples retained in history
+        """
+        self.provider = provider
+        self.interval = interval_seconds
+        self.history: Deque[GPUStats] = deque(maxlen=history_size)
+
+        self._latest: Optional[GPUStats] = None
+        self._listeners: List[TelemetryListener] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> GPUStats:
+        """Sample the provider now and update the cached snapshot."""
+        stats = self.provider()
+        with self._lock:
+            previous = self._latest
+            self._latest = stats
+            self.history.append(stats)
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(previous, stats)
+            except Exception as e:
+                logger.warning(f"Telemetry listener failed: {e}")
+        return stats
+
+    def add_listener(self, listener: TelemetryListener) -> None:
+        """Register a callback run after each sample (on the sampling thread)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def snapshot(self) -> GPUStats:
+        """
+        Get the cached snapshot.
+
+        Samples synchronously only if there is no snapshot yet, or if the
+        background thread is not running and the snapshot is older than
+        one interval.
+        """
+        with self._lock:
+            latest = self._latest
+        if latest is None:
+            return self.refresh()
+        if not self.is_running and time.time() - latest.sampled_at >= self.interval:
+            return self.refresh()
+        return latest
+
+    @property
+    def is_running(self) -> bool:
+        """True while the background thread is sampling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start background sampling (no-op if already running)."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="gpu-telemetry", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background sampling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Telemetry sample failed: {e}")
+            self._stop.wait(self.interval)
+
+    def recent(self, n: Optional[int] = None) -> List[GPUStats]:
+        """Most recent samples, oldest first."""
+        with self._lock:
+            samples = list(self.history)
+        return samples[-n:] if n else samples
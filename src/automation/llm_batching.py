@@ -0,0 +1,458 @@
+"""
+Batched LLM Inference
+
+Continuous batching for LLM_INFERENCE tasks. Prompts from every running
+task go into one shared scheduler, which keeps up to max_batch_size
+sequences decoding on the inference server: finished sequences leave
+after any decode step and waiting prompts are prefilled into the freed
+slots, instead of each batch waiting for its longest member.
+
+Shared system prompts (every companion-content section for every title
+starts with the same instructions) are prefilled once and kept in a
+small LRU prefix cache on the server, so later prompts only prefill
+their own text.
+
+Servers are plain objects (see FakeInferenceServer for the interface),
+so a llama.cpp/vLLM client or a CPU stand-in can be plugged in.
+"""
+
+import math
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Deque, Tuple
+
+from .metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Rough tokens per character for English prose
+TOKENS_PER_CHAR = 0.25
+# Rough tokens per English word
+TOKENS_PER_WORD = 1.35
+
+
+# Companion-content sections and word targets per title (content creator defaults)
+COMPANION_WORD_TARGETS = {
+    "introduction": 4500,
+    "chapter_summaries": 3000,
+    "character_guide": 1800,
+    "historical_context": 1600,
+    "discussion_questions": 1200,
+    "glossary": 700,
+    "edition_essay": 1000,
+}
+
+COMPANION_SYSTEM_PROMPT = (
+    "You write original companion material for annotated editions of "
+    "public-domain books. Write in clear, engaging prose for general "
+    "readers. Do not quote modern copyrighted commentary, adaptations or "
+    "introductions. Use Markdown headings. Stay close to the requested length."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return max(1, math.ceil(len(text) * TOKENS_PER_CHAR))
+
+
+@dataclass
+class LLMRequest:
+    """One prompt waiting for or undergoing generation."""
+    request_id: str
+    prompt: str
+    future: asyncio.Future
+    system_prompt: str = ""
+    max_tokens: int = 512
+    tokens: List[str] = field(default_factory=list)
+    prefix_hit: bool = False
+
+
+@dataclass
+class LLMResult:
+    """Completed generation."""
+    request_id: str
+    text: str
+    prompt_tokens: int
+    completion_tokens: int
+    cached_prompt_tokens: int = 0
+
+
+@dataclass
+class BatchReport:
+    """Throughput of one group of prompts (e.g. one task)."""
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    completion_tokens: int = 0
+    seconds: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generated tokens per wall-clock second."""
+        return self.completion_tokens / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_prompt_tokens": self.cached_prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "seconds": round(self.seconds, 3),
+            "tokens_per_second": round(self.tokens_per_second, 1),
+        }
+
+
+class FakeInferenceServer:
+    """
+    CPU stand-in for a local inference server.
+
+    Costs are modelled on a batched decoder: prefill time grows with the
+    uncached prompt tokens, a decode step costs a fixed amount plus a
+    small amount per sequence in the batch, so larger batches produce
+    more tokens per second.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 8,
+        prefill_tokens_per_second: float = 4000.0,
+        step_seconds: float = 0.02,
+        per_sequence_step_seconds: float = 0.002,
+        time_scale: float = 1.0,
+    ) -> None:
+        """
+        Initialize fake server.
+
+        Args:
+            max_batch_size: Concurrent sequences (KV cache slots)
+            prefill_tokens_per_second: Prompt processing rate
+            step_seconds: Fixed cost of one decode step
+            per_sequence_step_seconds: Extra decode-step cost per sequence
+            time_scale: Multiplier on all sleeps (0 for instant)
+        """
+        self.max_batch_size = max_batch_size
+        self.prefill_tokens_per_second = prefill_tokens_per_second
+        self.step_seconds = step_seconds
+        self.per_sequence_step_seconds = per_sequence_step_seconds
+        self.time_scale = time_scale
+
+        self.prefixes: Dict[str, int] = {}
+        self.sequences: Dict[str, int] = {}
+        self.prefilled_tokens = 0
+        self.decode_steps = 0
+
+    def _sleep(self, seconds: float) -> None:
+        if seconds > 0 and self.time_scale > 0:
+            time.sleep(seconds * self.time_scale)
+
+    def cache_prefix(self, key: str, text: str) -> None:
+        """Prefill a shared prefix and keep its KV cache."""
+        tokens = estimate_tokens(text)
+        self._sleep(tokens / self.prefill_tokens_per_second)
+        self.prefixes[key] = tokens
+        self.prefilled_tokens += tokens
+
+    def drop_prefix(self, key: str) -> None:
+        """Free a cached prefix."""
+        self.prefixes.pop(key, None)
+
+    def prefill(self, batch: List[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Prefill new sequences.
+
+        Args:
+            batch: (sequence_id, prompt, cached prefix key or None) tuples
+        """
+        tokens = sum(estimate_tokens(prompt) for _, prompt, _ in batch)
+        self._sleep(tokens / self.prefill_tokens_per_second)
+        self.prefilled_tokens += tokens
+        for sequence_id, _, _ in batch:
+            self.sequences[sequence_id] = 0
+
+    def decode_step(self, sequence_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Generate one token for every sequence.
+
+        Returns:
+            Token text per sequence (None for end of sequence)
+        """
+        self._sleep(self.step_seconds + self.per_sequence_step_seconds * len(sequence_ids))
+        self.decode_steps += 1
+        out: Dict[str, Optional[str]] = {}
+        for sequence_id in sequence_ids:
+            self.sequences[sequence_id] += 1
+            out[sequence_id] = "lorem "
+        return out
+
+    def release(self, sequence_id: str) -> None:
+        """Free a sequence's KV cache slot."""
+        self.sequences.pop(sequence_id, None)
+
+
+class PrefixCache:
+    """LRU of shared prompt prefixes held on the server."""
+
+    def __init__(self, server: Any, capacity: int = 8) -> None:
+        """
+        Initialize prefix cache.
+
+        Args:
+            server: Inference server (cache_prefix/drop_prefix)
+            capacity: Prefixes kept on the server
+        """
+        self.server = server
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    @staticmethod
+    def key(prefix: str) -> str:
+        return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+    async def acquire(self, prefix: str) -> Tuple[Optional[str], bool]:
+        """
+        Make sure a prefix is cached on the server.
+
+        Returns:
+            Tuple of (prefix key or None for an empty prefix, was a hit)
+        """
+        if not prefix:
+            return None, False
+        key = self.key(prefix)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.tokens_saved += self._entries[key]
+            return key, True
+
+        self.misses += 1
+        await asyncio.to_thread(self.server.cache_prefix, key, prefix)
+        self._entries[key] = estimate_tokens(prefix)
+        while len(self._entries) > self.capacity:
+            old, _ = self._entries.popitem(last=False)
+            await asyncio.to_thread(self.server.drop_prefix, old)
+        return key, False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "prompt_tokens_saved": self.tokens_saved,
+        }
+
+
+class BatchedLLMScheduler:
+    """
+    Continuous-batching front end shared by all LLM tasks.
+
+    Features:
+    - Prompts from concurrent tasks coalesced into one decode batch
+    - Slots refilled after every decode step (continuous batching)
+    - New sequences admitted together as one prefill micro-batch
+    - Shared system prompts prefilled once (PrefixCache)
+    - Cancelled requests leave the batch at the next step
+    - Tokens/sec reported per run_batch call
+    """
+
+    def __init__(
+        self,
+        server: Any,
+        max_batch_size: Optional[int] = None,
+        prefix_cache_size: int = 8,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            server: Inference server (see FakeInferenceServer)
+            max_batch_size: Concurrent sequences (default: server's)
+            prefix_cache_size: Shared prefixes kept on the server
+            metrics: Registry for token counters and throughput
+        """
+        self.server = server
+        self.max_batch_size = max_batch_size or server.max_batch_size
+        self.prefixes = PrefixCache(server, prefix_cache_size)
+
+        self._pending: Deque[LLMRequest] = deque()
+        self._active: Dict[str, LLMRequest] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+        self._counter = 0
+
+        self.completion_tokens = 0
+        self.decode_steps = 0
+        self.batch_occupancy = 0
+        self.reports: Deque[BatchReport] = deque(maxlen=50)
+
+        metrics = metrics or MetricsRegistry()
+        self._m_tokens = metrics.counter("llm_tokens_total", "LLM tokens by kind")
+        self._m_tps = metrics.histogram(
+            "llm_batch_tokens_per_second",
+            "Generated tokens per second per LLM batch",
+            buckets=(10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+        )
+
+    def submit(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        max_tokens: int = 512,
+    ) -> asyncio.Future:
+        """
+        Queue a prompt.
+
+        Returns:
+            Future resolving to an LLMResult (cancel it to abandon the prompt)
+        """
+        self._counter += 1
+        request = LLMRequest(
+            request_id=f"req{self._counter}",
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._pending.append(request)
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._run())
+        return request.future
+
+    async def _admit(self) -> None:
+        """Prefill waiting requests into free slots as one micro-batch."""
+        batch: List[Tuple[LLMRequest, Optional[str]]] = []
+        while self._pending and len(self._active) + len(batch) < self.max_batch_size:
+            request = self._pending.popleft()
+            if request.future.cancelled():
+                continue
+            key, hit = await self.prefixes.acquire(request.system_prompt)
+            request.prefix_hit = hit
+            batch.append((request, key))
+
+        if not batch:
+            return
+        await asyncio.to_thread(
+            self.server.prefill,
+            [(r.request_id, r.prompt, key) for r, key in batch],
+        )
+        for request, _ in batch:
+            self._active[request.request_id] = request
+
+    def _retire(self, request: LLMRequest) -> None:
+        """Free a finished or cancelled sequence."""
+        del self._active[request.request_id]
+        self.server.release(request.request_id)
+        if request.future.done():
+            return
+        prefix_tokens = estimate_tokens(request.system_prompt) if request.system_prompt else 0
+        request.future.set_result(LLMResult(
+            request_id=request.request_id,
+            text="".join(request.tokens).strip(),
+            prompt_tokens=prefix_tokens + estimate_tokens(request.prompt),
+            completion_tokens=len(request.tokens),
+            cached_prompt_tokens=prefix_tokens if request.prefix_hit else 0,
+        ))
+
+    async def _run(self) -> None:
+        """Decode loop; exits when nothing is waiting or active."""
+        try:
+            while self._pending or self._active:
+                await self._admit()
+                for request in [r for r in self._active.values() if r.future.cancelled()]:
+                    self._retire(request)
+                if not self._active:
+                    continue
+
+                ids = list(self._active)
+                tokens = await asyncio.to_thread(self.server.decode_step, ids)
+                self.decode_steps += 1
+                self.batch_occupancy += len(ids)
+
+                for request_id in ids:
+                    request = self._active[request_id]
+                    token = tokens.get(request_id)
+                    if token is not None:
+                        request.tokens.append(token)
+                        self.completion_tokens += 1
+                    if token is None or len(request.tokens) >= request.max_tokens:
+                        self._retire(request)
+        except Exception as e:
+            logger.error(f"LLM decode loop failed: {e}")
+            for request in list(self._active.values()) + list(self._pending):
+                if not request.future.done():
+                    request.future.set_exception(e)
+            self._active.clear()
+            self._pending.clear()
+
+    async def run_batch(
+        self,
+        prompts: List[str],
+        system_prompt: str = "",
+        max_tokens: Any = 512,
+    ) -> Tuple[List[LLMResult], BatchReport]:
+        """
+        Generate completions for a group of prompts.
+
+        Args:
+            prompts: Prompts to run
+            system_prompt: Shared prefix for all prompts
+            max_tokens: Limit for all prompts, or a list with one per prompt
+
+        Returns:
+            Tuple of (results in prompt order, throughput report)
+        """
+        limits = max_tokens if isinstance(max_tokens, list) else [max_tokens] * len(prompts)
+        start = time.perf_counter()
+        futures = [
+            self.submit(p, system_prompt, limit) for p, limit in zip(prompts, limits)
+        ]
+        try:
+            results = await asyncio.gather(*futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return list(results), self.report(results, time.perf_counter() - start)
+
+    def report(self, results: List[LLMResult], seconds: float) -> BatchReport:
+        """Record and log throughput for a group of results."""
+        report = BatchReport(
+            requests=len(results),
+            prompt_tokens=sum(r.prompt_tokens for r in results),
+            cached_prompt_tokens=sum(r.cached_prompt_tokens for r in results),
+            completion_tokens=sum(r.completion_tokens for r in results),
+            seconds=seconds,
+        )
+        self.reports.append(report)
+        self._m_tokens.inc(report.prompt_tokens - report.cached_prompt_tokens, kind="prompt")
+        self._m_tokens.inc(report.cached_prompt_tokens, kind="cached_prompt")
+        self._m_tokens.inc(report.completion_tokens, kind="completion")
+        if report.seconds > 0:
+            self._m_tps.observe(report.tokens_per_second)
+        logger.info(
+            f"LLM batch: {report.requests} prompts, {report.completion_tokens} tokens "
+            f"in {report.seconds:.1f}s ({report.tokens_per_second:.0f} tok/s, "
+            f"{report.cached_prompt_tokens} prompt tokens from prefix cache)"
+        )
+        return report
+
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler counters."""
+        return {
+            "pending": len(self._pending),
+            "active": len(self._active),
+            "max_batch_size": self.max_batch_size,
+            "decode_steps": self.decode_steps,
+            "completion_tokens": self.completion_tokens,
+            "mean_batch_occupancy": round(
+                self.batch_occupancy / self.decode_steps, 2
+            ) if self.decode_steps else 0.0,
+            "prefix_cache": self.prefixes.stats(),
+            "recent_batches": [r.to_dict() for r in list(self.reports)[-5:]],
+        }
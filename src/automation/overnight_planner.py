@@ -0,0 +1,362 @@
+"""
+Overnight Window Planner
+
+Packs queued work into the overnight window ahead of time. Each night is
+a 0/1 knapsack: capacity is the window's GPU minutes, weights are the
+(learned) duration estimates, and values come from priority and
+deadlines. Work that does not make tonight's selection is carried to the
+following nights, so every item gets a planned start and finish.
+
+Dependent tasks (a chapter's synthesis and its mastering) are packed as
+one bundle, so a dependency is never planned for a later night than the
+task waiting on it.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple, Iterator
+
+
+def _after(when: Optional[datetime], end: datetime) -> bool:
+    """True if a planned time falls after end (False while unplanned)."""
+    return when is not None and when > end
+
+
+@dataclass
+class PlanItem:
+    """One unit of work to plan (usually a queued GPU task)."""
+    item_id: str
+    minutes: float
+    value: float
+    group: str = ""  # e.g. book ID, for per-job finish times
+    priority: int = 3
+    deadline: Optional[datetime] = None
+    depends_on: List[str] = field(default_factory=list)
+    # Filled in by the planner
+    night: int = -1
+    start: Optional[datetime] = None
+    finish: Optional[datetime] = None
+    overrun: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "item_id": self.item_id,
+            "group": self.group,
+            "minutes": round(self.minutes, 1),
+            "value": round(self.value, 1),
+            "priority": self.priority,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "night": self.night,
+            "start": self.start.isoformat() if self.start else None,
+            "finish": self.finish.isoformat() if self.finish else None,
+            "overrun": self.overrun,
+        }
+
+
+@dataclass
+class OvernightPlan:
+    """Ordered plan: tonight's selection, then deferred nights."""
+    generated_at: datetime
+    windows: List[Tuple[datetime, datetime]]
+    items: List[PlanItem]  # Planned items in run order
+    unplanned: List[PlanItem]  # Beyond the planning horizon
+    capacity_minutes: float  # Tonight's GPU minutes
+
+    @property
+    def tonight(self) -> List[PlanItem]:
+        return [i for i in self.items if i.night == 0]
+
+    @property
+    def deferred(self) -> List[PlanItem]:
+        return [i for i in self.items if i.night > 0] + self.unplanned
+
+    @property
+    def planned_minutes(self) -> float:
+        """GPU minutes selected for tonight."""
+        return sum(i.minutes for i in self.tonight)
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of tonight's window filled."""
+        if self.capacity_minutes <= 0:
+            return 0.0
+        return min(1.0, self.planned_minutes / self.capacity_minutes)
+
+    def finish_time(self, item_id: str) -> Optional[datetime]:
+        """Planned finish of one item."""
+        for item in self.items:
+            if item.item_id == item_id:
+                return item.finish
+        return None
+
+    def group_finish(self) -> Dict[str, Optional[datetime]]:
+        """Planned finish per group (None if any of its work is unplanned)."""
+        finish: Dict[str, Optional[datetime]] = {}
+        for item in self.items:
+            current = finish.get(item.group)
+            if current is None or (item.finish is not None and item.finish > current):
+                finish[item.group] = item.finish
+        for item in self.unplanned:
+            finish[item.group] = None
+        return finish
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        tonight = self.tonight
+        return {
+            "generated_at": self.generated_at.isoformat(),
+            "window_start": self.windows[0][0].isoformat() if self.windows else None,
+            "window_end": self.windows[0][1].isoformat() if self.windows else None,
+            "capacity_minutes": round(self.capacity_minutes, 1),
+            "planned_minutes": round(self.planned_minutes, 1),
+            "utilization": round(self.utilization, 3),
+            "tonight_value": round(sum(i.value for i in tonight), 1),
+            "deferred_value": round(sum(i.value for i in self.deferred), 1),
+            "nights": max((i.night for i in self.items), default=-1) + 1,
+            "tonight": [i.to_dict() for i in tonight],
+            "deferred": [i.to_dict() for i in self.deferred],
+            "group_finish": {
+                group: when.isoformat() if when else None
+                for group, when in self.group_finish().items()
+            },
+        }
+
+
+class OvernightPlanner:
+    """
+    Knapsack planner for the overnight batch window.
+
+    Features:
+    - Maximizes planned value per night (exact DP over minute buckets,
+      value-density greedy for very large queues)
+    - Deadlines that deferral would miss boost an item's value
+    - Dependency bundles are selected all-or-nothing
+    - Running work occupies lanes before the window's first slot
+    - Items longer than a whole window get a night of their own
+    """
+
+    # Value multiplier for items whose deadline falls before the next window
+    DEADLINE_BOOST = 4.0
+    # Largest DP table (items x buckets) before falling back to greedy
+    MAX_DP_CELLS = 2_000_000
+
+    def __init__(
+        self,
+        start_hour: int = 23,
+        end_hour: int = 6,
+        lanes: int = 1,
+        bucket_minutes: float = 5.0,
+        max_nights: int = 14,
+    ) -> None:
+        """
+        Initialize planner.
+
+        Args:
+            start_hour: Hour the overnight window opens (24h)
+            end_hour: Hour the window closes (24h)
+            lanes: Tasks the GPU runs side by side
+            bucket_minutes: Knapsack weight granularity
+            max_nights: Planning horizon
+        """
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+        self.lanes = max(1, lanes)
+        self.bucket_minutes = bucket_minutes
+        self.max_nights = max_nights
+
+    def windows(self, now: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        """Current (if open) or next window, then one per following night."""
+        hours = (self.end_hour - self.start_hour) % 24 or 24
+        start = now.replace(hour=self.start_hour, minute=0, second=0, microsecond=0)
+        if start > now:
+            start -= timedelta(days=1)
+        end = start + timedelta(hours=hours)
+        if end <= now:
+            start += timedelta(days=1)
+            end += timedelta(days=1)
+        yield max(start, now), end
+        while True:
+            start += timedelta(days=1)
+            end += timedelta(days=1)
+            yield start, end
+
+    @staticmethod
+    def _bundles(items: List[PlanItem]) -> List[List[PlanItem]]:
+        """Connected components of the dependency graph, in input order."""
+        index = {item.item_id: i for i, item in enumerate(items)}
+        parent = list(range(len(items)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, item in enumerate(items):
+            for dep in item.depends_on:
+                j = index.get(dep)
+                if j is not None:
+                    parent[find(i)] = find(j)
+
+        groups: Dict[int, List[PlanItem]] = {}
+        for i, item in enumerate(items):
+            groups.setdefault(find(i), []).append(item)
+        return sorted(groups.values(), key=lambda b: index[b[0].item_id])
+
+    def _select(self, weights: List[int], values: List[float], capacity: int) -> List[int]:
+        """0/1 knapsack: indices maximizing value within capacity."""
+        n = len(weights)
+        if n * (capacity + 1) > self.MAX_DP_CELLS:
+            order = sorted(range(n), key=lambda i: values[i] / max(weights[i], 1), reverse=True)
+            chosen, used = [], 0
+            for i in order:
+                if used + weights[i] <= capacity:
+                    chosen.append(i)
+                    used += weights[i]
+            return sorted(chosen)
+
+        best = [0.0] * (capacity + 1)
+        keep = [bytearray(capacity + 1) for _ in range(n)]
+        for i in range(n):
+            w, v = weights[i], values[i]
+            row = keep[i]
+            for c in range(capacity, w - 1, -1):
+                candidate = best[c - w] + v
+                if candidate > best[c]:
+                    best[c] = candidate
+                    row[c] = 1
+
+        chosen, c = [], capacity
+        for i in range(n - 1, -1, -1):
+            if keep[i][c]:
+                chosen.append(i)
+                c -= weights[i]
+        return sorted(chosen)
+
+    def _schedule(
+        self,
+        items: List[PlanItem],
+        lane_free: List[datetime],
+        finished: Dict[str, datetime],
+    ) -> None:
+        """List-schedule items (deps first) onto the earliest free lane."""
+        pending = list(items)
+        waiting = {item.item_id for item in items}
+        while pending:
+            k = next(
+                (k for k, item in enumerate(pending)
+                 if not any(d in waiting for d in item.depends_on)),
+                0,  # Dependency cycle: fall back to run order
+            )
+            item = pending.pop(k)
+            waiting.discard(item.item_id)
+            lane = min(range(len(lane_free)), key=lambda i: lane_free[i])
+            ready = max([lane_free[lane]] + [finished[d] for d in item.depends_on if d in finished])
+            item.start = ready
+            item.finish = ready + timedelta(minutes=item.minutes)
+            lane_free[lane] = item.finish
+            finished[item.item_id] = item.finish
+
+    def plan(
+        self,
+        items: List[PlanItem],
+        now: Optional[datetime] = None,
+        busy_minutes: Optional[List[float]] = None,
+    ) -> OvernightPlan:
+        """
+        Plan items into tonight's window and the nights after it.
+
+        Args:
+            items: Work to plan, in queue order
+            now: Planning time (default: now)
+            busy_minutes: Remaining minutes of already-running tasks
+
+        Returns:
+            OvernightPlan with items in run order
+        """
+        now = now or datetime.now()
+
+        # Running tasks hold lanes first; any beyond the lane count queue up
+        lane_free = [now] * self.lanes
+        for minutes in sorted(busy_minutes or [], reverse=True):
+            lane = min(range(self.lanes), key=lambda i: lane_free[i])
+            lane_free[lane] += timedelta(minutes=minutes)
+
+        windows = list(islice(self.windows(now), self.max_nights + 1))
+        window_minutes = ((self.end_hour - self.start_hour) % 24 or 24) * 60.0
+        seq = {item.item_id: i for i, item in enumerate(items)}
+
+        def run_order(item: PlanItem) -> tuple:
+            return (item.priority, item.deadline or datetime.max, seq[item.item_id])
+
+        remaining = self._bundles(items)
+        planned: List[PlanItem] = []
+        finished: Dict[str, datetime] = {}
+        capacity_tonight = 0.0
+        nights_used = 0
+
+        for night in range(self.max_nights):
+            if not remaining:
+                break
+            start, end = windows[night]
+            next_start = windows[night + 1][0]
+            nights_used = night + 1
+            lane_free = [max(free, start) for free in lane_free]
+            lane_minutes = [max(0.0, (end - free).total_seconds() / 60) for free in lane_free]
+            if night == 0:
+                capacity_tonight = sum(lane_minutes)
+
+            # Knapsack over bundles that fit in one lane tonight
+            candidates, weights, values = [], [], []
+            for bundle in remaining:
+                minutes = sum(i.minutes for i in bundle)
+                if minutes > max(lane_minutes):
+                    continue
+                candidates.append(bundle)
+                weights.append(max(1, math.ceil(minutes / self.bucket_minutes)))
+                values.append(sum(
+                    i.value * (self.DEADLINE_BOOST if i.deadline and i.deadline < next_start else 1.0)
+                    for i in bundle
+                ))
+            capacity = int(sum(lane_minutes) // self.bucket_minutes)
+            chosen = [candidates[i] for i in self._select(weights, values, capacity)]
+
+            # Work longer than any window would never be selected; like the
+            # orchestrator, run it from the start of an otherwise empty night
+            forced = None
+            if not chosen:
+                forced = next(
+                    (b for b in remaining if sum(i.minutes for i in b) > window_minutes),
+                    None,
+                )
+                chosen = [forced] if forced else []
+
+            # Lane fragmentation can still push a bundle past the window end
+            while True:
+                tonight = sorted((i for b in chosen for i in b), key=run_order)
+                trial_free = list(lane_free)
+                trial_finished = dict(finished)
+                self._schedule(tonight, trial_free, trial_finished)
+                late = [b for b in chosen if b is not forced and any(_after(i.finish, end) for i in b)]
+                if not late:
+                    break
+                chosen.remove(min(late, key=lambda b: sum(i.value for i in b)))
+
+            lane_free, finished = trial_free, trial_finished
+            for item in tonight:
+                item.night = night
+                item.overrun = _after(item.finish, end)
+            planned.extend(tonight)
+            chosen_ids = {id(b) for b in chosen}
+            remaining = [b for b in remaining if id(b) not in chosen_ids]
+
+        return OvernightPlan(
+            generated_at=now,
+            windows=windows[:nights_used],
+            items=planned,
+            unplanned=[item for bundle in remaining for item in bundle],
+            capacity_minutes=capacity_tonight,
+        )
@@ -0,0 +1,228 @@
+"""
+Orchestrator Concurrency Stress Check
+
+Hammers a SimulatedGPUOrchestrator from many producer threads while its
+processing loop runs: half the producers call add_task directly, half
+use submit_threadsafe, and reader threads poll get_queue_status. Checks
+that every task completes exactly once, VRAM is never over-committed,
+no thread raises, and that neither producers nor the event loop stall.
+
+Usage:
+    python -m src.automation.stress --producers 32 --tasks 50
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import threading
+import traceback
+from dataclasses import dataclass, field, asdict
+from typing import Callable, List, Dict, Any
+
+from .gpu_orchestrator import TaskType, TaskPriority
+from .gpu_simulator import SimulatedGPUOrchestrator
+from .metrics import percentile
+
+
+@dataclass
+class StressResult:
+    """Outcome of one stress run."""
+    submitted: int
+    completed: int
+    duplicates: int
+    lost: int
+    peak_reserved_vram_gb: float
+    vram_gb: float
+    max_add_latency_ms: float
+    p99_add_latency_ms: float
+    max_status_latency_ms: float
+    max_loop_lag_ms: float
+    seconds: float
+    errors: List[str] = field(default_factory=list)  # Exceptions raised in producer/reader threads
+
+    @property
+    def ok(self) -> bool:
+        """True if no thread raised, no task was lost or duplicated, and VRAM fit."""
+        return (
+            not self.errors
+            and self.duplicates == 0
+            and self.lost == 0
+            and self.completed == self.submitted
+            and self.peak_reserved_vram_gb <= self.vram_gb
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "ok": self.ok}
+
+
+def run_stress(
+    producers: int = 16,
+    tasks_per_producer: int = 50,
+    readers: int = 2,
+    vram_gb: float = 16.0,
+    max_concurrent_tasks: int = 4,
+    time_scale: float = 0.0001,
+    seed: int = 0,
+) -> StressResult:
+    """
+    Run the stress scenario.
+
+    Args:
+        producers: Producer threads
+        tasks_per_producer: Tasks each producer submits
+        readers: Threads polling get_queue_status
+        vram_gb: Simulated card VRAM
+        max_concurrent_tasks: Orchestrator concurrency limit
+        time_scale: Wall-clock seconds per simulated second
+        seed: Random seed for task mixes and pacing
+
+    Returns:
+        StressResult
+    """
+    sim = SimulatedGPUOrchestrator(
+        vram_gb=vram_gb,
+        time_scale=time_scale,
+        max_concurrent_tasks=max_concurrent_tasks,
+    )
+    types = [TaskType.TTS_SYNTHESIS, TaskType.LLM_INFERENCE, TaskType.AUDIO_MASTERING]
+    add_latencies: List[float] = []
+    status_latencies: List[float] = []
+    submitted: List[str] = []
+    errors: List[str] = []
+    record_lock = threading.Lock()
+    producers_done = threading.Event()
+
+    def recording_errors(target: Callable[..., None]) -> Callable[..., None]:
+        # An exception in a thread target would otherwise only be printed
+        def run(*args: Any) -> None:
+            try:
+                target(*args)
+            except Exception:
+                with record_lock:
+                    errors.append(traceback.format_exc())
+        return run
+
+    def produce(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        futures = []
+        for n in range(tasks_per_producer):
+            spec: Dict[str, Any] = {
+                "task_type": rng.choice(types),
+                "input_data": {"text": "x" * rng.randint(100, 2000), "producer": index},
+                "output_path": sim.data_dir / "outputs" / f"p{index}_{n}.out",
+                "priority": rng.choice(list(TaskPriority)[:4]),
+                "estimated_minutes": rng.randint(1, 5),
+            }
+            start = time.perf_counter()
+            if index % 2:
+                futures.append(sim.submit_threadsafe(**spec))
+            else:
+                task = sim.add_task(**spec)
+                with record_lock:
+                    submitted.append(task.task_id)
+            with record_lock:
+                add_latencies.append(time.perf_counter() - start)
+            if rng.random() < 0.1:
+                time.sleep(0.001)
+        for future in futures:
+            task = future.result(timeout=60)
+            with record_lock:
+                submitted.append(task.task_id)
+
+    def read() -> None:
+        while not producers_done.is_set():
+            start = time.perf_counter()
+            sim.get_queue_status()
+            with record_lock:
+                status_latencies.append(time.perf_counter() - start)
+            time.sleep(0.002)
+
+    async def monitor_lag(stop: asyncio.Event, lags: List[float]) -> None:
+        interval = 0.005
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    async def main() -> List[float]:
+        lags: List[float] = []
+        stop = asyncio.Event()
+        monitor = asyncio.create_task(monitor_lag(stop, lags))
+
+        threads = [
+            threading.Thread(target=recording_errors(produce), args=(i,))
+            for i in range(producers)
+        ]
+        threads += [
+            threading.Thread(target=recording_errors(read), daemon=True)
+            for _ in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # process_queue returns whenever the queue drains; restart it
+        # until every producer has finished and nothing is left
+        while True:
+            await sim.process_queue()
+            producing = any(t.is_alive() for t in threads[:producers])
+            if not producing and not sim.task_queue and sim._submissions.empty():
+                break
+            await asyncio.sleep(0.001)
+
+        for thread in threads[:producers]:
+            await asyncio.to_thread(thread.join)
+        producers_done.set()
+        for thread in threads[producers:]:
+            await asyncio.to_thread(thread.join, 5)
+        stop.set()
+        await monitor
+        return lags
+
+    start = time.perf_counter()
+    sim.reset_timeline()
+    lags = asyncio.run(main())
+    seconds = time.perf_counter() - start
+
+    completed_ids = [t.task_id for t in sim.completed_tasks]
+    unique = set(completed_ids)
+    starts = [e for e in sim.events if e.event == "start"]
+
+    return StressResult(
+        submitted=len(submitted),
+        completed=len(unique),
+        duplicates=len(completed_ids) - len(unique),
+        lost=len(set(submitted) - unique),
+        peak_reserved_vram_gb=max((e.reserved_vram_gb for e in starts), default=0.0),
+        vram_gb=vram_gb,
+        max_add_latency_ms=round(max(add_latencies, default=0.0) * 1000, 2),
+        p99_add_latency_ms=round(percentile(add_latencies, 0.99) * 1000, 2),
+        max_status_latency_ms=round(max(status_latencies, default=0.0) * 1000, 2),
+        max_loop_lag_ms=round(max(lags, default=0.0) * 1000, 2),
+        seconds=round(seconds, 2),
+        errors=errors,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Orchestrator concurrency stress check")
+    parser.add_argument("--producers", type=int, default=16)
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks per producer")
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = run_stress(
+        producers=args.producers,
+        tasks_per_producer=args.tasks,
+        readers=args.readers,
+        seed=args.seed,
+    )
+    print(json.dumps(result.to_dict(), indent=2))
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
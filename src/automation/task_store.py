@@ -0,0 +1,158 @@
+"""
+Durable GPU Task Store
+
+SQLite-backed persistence for the GPU task queue. Every task is one
+row, written incrementally on add and on each status change, so the
+queue (including input payloads) survives restarts and crashes without
+rewriting a whole state file.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the task still has work to do
+UNFINISHED_STATUSES = ("pending", "queued", "running", "paused")
+
+
+class TaskStore:
+    """
+    SQLite store for GPU task records.
+
+    Features:
+    - One row per task (JSON payload from GPUTask.to_dict)
+    - Incremental upserts in WAL mode
+    - Insertion order preserved for stable re-queueing
+    - Safe to share across threads
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id TEXT NOT NULL UNIQUE,
+            status TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Open (or create) a task store.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def _row(task_dict: Dict[str, Any]) -> tuple:
+        """Row values for an upsert."""
+        return (
+            task_dict["task_id"],
+            task_dict["status"],
+            task_dict["priority"],
+            json.dumps(task_dict),
+            datetime.now().isoformat(),
+        )
+
+    def upsert_many(self, task_dicts: Iterable[Dict[str, Any]]) -> None:
+        """Insert or update several tasks in one transaction."""
+        rows = [self._row(d) for d in task_dicts]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO tasks (task_id, status, priority, payload, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    status = excluded.status,
+                    priority = excluded.priority,
+                    payload = excluded.payload,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+
+    def upsert(self, task_dict: Dict[str, Any]) -> None:
+        """Insert or update one task."""
+        self.upsert_many([task_dict])
+
+    def load_unfinished(self) -> List[Dict[str, Any]]:
+        """Payloads of tasks that still need to run, in insertion order."""
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM tasks WHERE status IN ({placeholders}) ORDER BY seq",
+                UNFINISHED_STATUSES,
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def load_completed(self) -> List[Dict[str, Any]]:
+        """Payloads of completed tasks, in insertion order (for replay)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM tasks WHERE status = 'completed' ORDER BY seq"
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def statuses(self, task_ids: List[str]) -> Dict[str, str]:
+        """Stored status of each known task ID."""
+        if not task_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in task_ids)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT task_id, status FROM tasks WHERE task_id IN ({placeholders})",
+                list(task_ids),
+            ).fetchall()
+        return {task_id: status for task_id, status in rows}
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Number of stored tasks per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def prune_finished(self, keep_last: int = 1000) -> int:
+        """
+        Delete old completed/failed/cancelled rows.
+
+        Args:
+            keep_last: Finished rows to keep (most recent)
+
+        Returns:
+            Number of rows deleted
+        """
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATUSES)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"""
+                DELETE FROM tasks WHERE status NOT IN ({placeholders}) AND seq NOT IN (
+                    SELECT seq FROM tasks WHERE status NOT IN ({placeholders})
+                    ORDER BY seq DESC LIMIT ?
+                )
+                """,
+                (*UNFINISHED_STATUSES, *UNFINISHED_STATUSES, keep_last),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,265 @@
+"""
+Thermal and Power Throttle Controller
+
+Turns the sampled GPU telemetry history into a throughput factor
+between 0 and 1. The orchestrator scales its concurrency limit and
+batch sizes (e.g. TTS chunk length) by that factor, so work slows down
+gradually as temperature or power approaches its target instead of
+stopping outright at a single hard threshold.
+
+Scaling concurrency cannot go below one running task, so at the
+default max_concurrent_tasks=1 it changes nothing. There the factor
+is applied as a duty cycle instead: chunked runners idle between
+chunks for duty_cycle_delay() seconds, so the GPU is busy roughly
+`factor` of the time. Below pause_below new tasks are not dispatched
+at all until the GPU recovers.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any
+
+from .gpu_telemetry import GPUStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ThrottleState:
+    """Controller output for the latest telemetry window."""
+    factor: float = 1.0
+    temperature_celsius: float = 0.0
+    predicted_temperature_celsius: float = 0.0
+    power_draw_watts: float = 0.0
+    temperature_factor: float = 1.0
+    power_factor: float = 1.0
+    critical: bool = False
+    reason: str = "nominal"
+
+
+class ThrottleController:
+    """
+    Proportional thermal/power controller over the telemetry history.
+
+    Features:
+    - Averages the last `window` samples and extrapolates the temperature
+      trend `horizon_seconds` ahead, so throttling starts before the limit
+    - Full speed at or below the targets, scaled down linearly to zero
+      at the hard limits
+    - Fast decrease, slow recovery (avoids oscillating around the target)
+    - Never below min_factor unless a hard limit is exceeded
+    - Throughput the concurrency limit cannot remove (one task is the
+      floor) is taken out with idle time between chunks
+    - Dispatch pauses below pause_below, and stops at the hard limits
+    """
+
+    def __init__(
+        self,
+        target_temp_celsius: float = 78.0,
+        max_temp_celsius: float = 87.0,
+        target_power_watts: float = 288.0,
+        max_power_watts: float = 320.0,
+        window: int = 6,
+        horizon_seconds: float = 30.0,
+        recovery_rate: float = 0.25,
+        min_factor: float = 0.25,
+        pause_below: float = 0.4,
+        max_idle_seconds: float = 30.0,
+    ) -> None:
+        """
+        Initialize controller.
+
+        Args:
+            target_temp_celsius: Temperature at which throttling begins
+            max_temp_celsius: Temperature at which new work stops
+            target_power_watts: Power draw at which throttling begins
+            max_power_watts: Power draw at which new work stops (TDP)
+            window: Telemetry samples averaged per update
+            horizon_seconds: How far ahead the temperature trend is projected
+            recovery_rate: Fraction of the gap closed per update when recovering
+            min_factor: Lowest factor applied below the hard limits
+            pause_below: Factor below which no new tasks are dispatched
+            max_idle_seconds: Cap on the idle time inserted after one chunk
+        """
+        self.target_temp = target_temp_celsius
+        self.max_temp = max_temp_celsius
+        self.target_power = target_power_watts
+        self.max_power = max_power_watts
+        self.window = window
+        self.horizon_seconds = horizon_seconds
+        self.recovery_rate = recovery_rate
+        self.min_factor = min_factor
+        self.pause_below = pause_below
+        self.max_idle_seconds = max_idle_seconds
+
+        self.state = ThrottleState()
+        self.updates = 0
+        self.throttled_updates = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _headroom(value: float, target: float, limit: float) -> float:
+        """1.0 at or below target, falling linearly to 0.0 at limit."""
+        if value <= target:
+            return 1.0
+        if value >= limit or limit <= target:
+            return 0.0
+        return (limit - value) / (limit - target)
+
+    @staticmethod
+    def _slope_per_second(samples: List[GPUStats]) -> float:
+        """Temperature change rate across the window (C/s)."""
+        if len(samples) < 2:
+            return 0.0
+        elapsed = samples[-1].sampled_at - samples[0].sampled_at
+        if elapsed < 1.0:
+            return 0.0  # Burst of samples; too close together for a trend
+        return (samples[-1].temperature_celsius - samples[0].temperature_celsius) / elapsed
+
+    def update(self, samples: List[GPUStats]) -> ThrottleState:
+        """
+        Recompute the throttle factor from recent telemetry.
+
+        Args:
+            samples: Recent GPUStats, oldest first
+
+        Returns:
+            Updated ThrottleState
+        """
+        samples = samples[-self.window:]
+        if not samples:
+            return self.state
+
+        latest = samples[-1]
+        avg_temp = sum(s.temperature_celsius for s in samples) / len(samples)
+        avg_power = sum(s.power_draw_watts for s in samples) / len(samples)
+
+        # Only project upward trends; cooling is picked up by the average
+        slope = max(self._slope_per_second(samples), 0.0)
+        predicted = max(avg_temp, latest.temperature_celsius) + slope * self.horizon_seconds
+
+        temp_factor = self._headroom(predicted, self.target_temp, self.max_temp)
+        power_factor = self._headroom(avg_power, self.target_power, self.max_power)
+        critical = (
+            latest.temperature_celsius >= self.max_temp
+            or latest.power_draw_watts >= self.max_power
+        )
+
+        with self._lock:
+            previous = self.state.factor
+            if critical:
+                factor = 0.0
+            else:
+                raw = max(min(temp_factor, power_factor), self.min_factor)
+                if raw < previous:
+                    factor = raw
+                else:
+                    factor = previous + (raw - previous) * self.recovery_rate
+                    if raw - factor < 0.01:
+                        factor = raw
+                factor = max(factor, self.min_factor)
+
+            if critical:
+                reason = "critical"
+            elif factor >= 1.0:
+                reason = "nominal"
+            elif min(temp_factor, power_factor) >= 1.0:
+                reason = "recovering"
+            elif temp_factor <= power_factor:
+                reason = "thermal"
+            else:
+                reason = "power"
+
+            self.state = ThrottleState(
+                factor=round(factor, 3),
+                temperature_celsius=latest.temperature_celsius,
+                predicted_temperature_celsius=round(predicted, 1),
+                power_draw_watts=round(avg_power, 1),
+                temperature_factor=round(temp_factor, 3),
+                power_factor=round(power_factor, 3),
+                critical=critical,
+                reason=reason,
+            )
+            self.updates += 1
+            if factor < 1.0:
+                self.throttled_updates += 1
+
+        if self.state.reason != "nominal" and factor < previous:
+            logger.info(
+                f"Throttling GPU work to {factor:.0%} ({reason}: "
+                f"{latest.temperature_celsius}C, {avg_power:.0f}W)"
+            )
+        return self.state
+
+    @property
+    def factor(self) -> float:
+        """Current throughput factor (0.0-1.0)."""
+        return self.state.factor
+
+    @property
+    def paused(self) -> bool:
+        """True while new work should not be dispatched."""
+        return self.state.critical or self.state.factor < self.pause_below
+
+    def concurrency_limit(self, max_concurrent: int) -> int:
+        """
+        Scaled concurrency limit.
+
+        Returns:
+            0 when paused or a hard limit is exceeded, otherwise between
+            1 and max_concurrent
+        """
+        if self.paused:
+            return 0
+        return max(1, min(max_concurrent, round(max_concurrent * self.factor)))
+
+    def duty_cycle_delay(self, busy_seconds: float, max_concurrent: int) -> float:
+        """
+        Idle time to insert after `busy_seconds` of GPU work.
+
+        Covers the part of the throttle the concurrency limit cannot
+        (e.g. factor 0.5 with max_concurrent 1 idles as long as the
+        chunk ran; with max_concurrent 4 the limit of 2 already halves
+        the load and no delay is needed).
+
+        Returns:
+            Seconds to wait before the next chunk (0 when not throttled)
+        """
+        factor = self.state.factor
+        if factor >= 1.0 or busy_seconds <= 0 or max_concurrent < 1:
+            return 0.0
+        if factor <= 0.0:
+            return self.max_idle_seconds
+        # Duty cycle still needed on top of the concurrency reduction
+        scaled = max(1, min(max_concurrent, round(max_concurrent * factor))) / max_concurrent
+        duty = factor / scaled
+        if duty >= 1.0:
+            return 0.0
+        return min(busy_seconds * (1.0 - duty) / duty, self.max_idle_seconds)
+
+    def batch_size(self, base: int, minimum: int = 1) -> int:
+        """Scale a batch size (chunk length, images per batch) by the factor."""
+        if self.state.critical:
+            return max(minimum, round(base * self.min_factor))
+        return max(minimum, round(base * self.factor))
+
+    def to_dict(self, max_concurrent: Optional[int] = None) -> Dict[str, Any]:
+        """Controller state for status reporting."""
+        state = self.state
+        result = {
+            "factor": state.factor,
+            "reason": state.reason,
+            "critical": state.critical,
+            "paused": self.paused,
+            "temperature_celsius": state.temperature_celsius,
+            "predicted_temperature_celsius": state.predicted_temperature_celsius,
+            "power_draw_watts": state.power_draw_watts,
+            "target_temp_celsius": self.target_temp,
+            "target_power_watts": self.target_power,
+            "updates": self.updates,
+            "throttled_updates": self.throttled_updates,
+        }
+        if max_concurrent is not None:
+            result["concurrency_limit"] = self.concurrency_limit(max_concurrent)
+        return result
@@ -0,0 +1,458 @@
+"""
+Chunked TTS Pipeline
+
+Splits chapter text into sentence-aligned chunks, synthesizes them in
+batches sized to the engine's batch capacity, runs as many batches at
+once as the VRAM budget allows, and stitches the chunk audio back in
+order with short crossfades. Finished chunks are kept on disk under
+their content key (text, voice, engine), so a failed chunk is retried
+on its own and an interrupted chapter resumes without redoing finished
+chunks, while chunks whose text has since changed are re-rendered.
+With an ArtifactCache, chunks already synthesized with the same text,
+voice and engine version (e.g. before a typo fix elsewhere in the
+chapter) are reused instead of re-rendered.
+
+Engines are plain objects with sample_rate, max_batch_size,
+model_vram_gb and vram_per_batch_gb attributes and a blocking
+synthesize_batch(texts, voice_profile) method that returns 16-bit PCM
+arrays; an optional `version` string is part of the cache key.
+FakeTTSEngine stands in on CPU-only machines.
+"""
+
+import io
+import re
+import math
+import wave
+import time
+import asyncio
+import logging
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Iterable
+
+from .artifact_cache import ArtifactCache, tts_chunk_key
+
+logger = logging.getLogger(__name__)
+
+# Called with (chunks_done, chunks_total) after every finished batch
+ChunkProgress = Callable[[int, int], None]
+BatchPacer = Callable[[float], float]
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;:])[\"')\]]*\s+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+@dataclass
+class TextChunk:
+    """One synthesis unit of a chapter."""
+    index: int
+    text: str
+    paragraph_end: bool = False
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Split an over-long sentence on word boundaries."""
+    pieces, current = [], ""
+    for word in sentence.split():
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_text(text: str, max_chars: int = 400) -> List[TextChunk]:
+    """
+    Split text into sentence-aligned chunks.
+
+    Sentences are packed greedily up to max_chars; chunks never span a
+    paragraph break, and a sentence longer than max_chars is split on
+    word boundaries.
+
+    Args:
+        text: Chapter text
+        max_chars: Upper bound on chunk length
+
+    Returns:
+        Chunks in reading order
+    """
+    chunks: List[TextChunk] = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+
+        current = ""
+        pieces: List[str] = []
+        for sentence in _SENTENCE_END.split(paragraph):
+            for part in (_split_long(sentence, max_chars) if len(sentence) > max_chars else [sentence]):
+                if current and len(current) + 1 + len(part) > max_chars:
+                    pieces.append(current)
+                    current = part
+                else:
+                    current = f"{current} {part}" if current else part
+        if current:
+            pieces.append(current)
+
+        for i, piece in enumerate(pieces):
+            chunks.append(TextChunk(
+                index=len(chunks),
+                text=piece,
+                paragraph_end=i == len(pieces) - 1,
+            ))
+    return chunks
+
+
+def crossfade_concat(segments: Iterable[array], fade_samples: int) -> array:
+    """
+    Concatenate 16-bit PCM segments with linear crossfades.
+
+    Args:
+        segments: PCM arrays (typecode "h") in order
+        fade_samples: Overlap between neighbours (clamped to segment length)
+
+    Returns:
+        Stitched PCM
+    """
+    out = array("h")
+    for segment in segments:
+        fade = min(fade_samples, len(out), len(segment))
+        if fade > 0:
+            start = len(out) - fade
+            for i in range(fade):
+                w = (i + 1) / (fade + 1)
+                mixed = out[start + i] * (1 - w) + segment[i] * w
+                out[start + i] = max(-32768, min(32767, int(round(mixed))))
+        out.extend(segment[fade:])
+    return out
+
+
+def decode_wav(data: bytes) -> array:
+    """Mono 16-bit PCM from WAV bytes."""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        samples = array("h")
+        samples.frombytes(wav.readframes(wav.getnframes()))
+    return samples
+
+
+def encode_wav(samples: array, sample_rate: int) -> bytes:
+    """WAV bytes for mono 16-bit PCM."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def read_wav(path: Path) -> array:
+    """Read mono 16-bit PCM from a WAV file."""
+    return decode_wav(path.read_bytes())
+
+
+def write_wav(path: Path, samples: array, sample_rate: int) -> None:
+    """Write mono 16-bit PCM to a WAV file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_wav(samples, sample_rate))
+
+
+class FakeTTSEngine:
+    """
+    Deterministic CPU engine for tests and simulations.
+
+    Produces a quiet tone whose length is proportional to the text, and
+    can be told to fail specific chunk texts a number of times.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        max_batch_size: int = 4,
+        model_vram_gb: float = 2.0,
+        vram_per_batch_gb: float = 1.0,
+        chars_per_second: float = 15.0,
+    ) -> None:
+        """
+        Initialize fake engine.
+
+        Args:
+            sample_rate: Output sample rate
+            max_batch_size: Chunks per synthesize_batch call
+            model_vram_gb: VRAM held by the loaded model
+            vram_per_batch_gb: Extra VRAM per in-flight batch
+            chars_per_second: Speaking rate used to size the output
+        """
+        self.sample_rate = sample_rate
+        self.max_batch_size = max_batch_size
+        self.model_vram_gb = model_vram_gb
+        self.vram_per_batch_gb = vram_per_batch_gb
+        self.chars_per_second = chars_per_second
+        self.version = f"fake-tone-{chars_per_second}"
+        self.failures: Dict[str, int] = {}
+        self.calls = 0
+
+    def fail(self, text_fragment: str, times: int = 1) -> None:
+        """Fail batches containing text_fragment for the next `times` calls."""
+        self.failures[text_fragment] = times
+
+    def synthesize_batch(self, texts: List[str], voice_profile: str) -> List[array]:
+        """Render each text as a 220Hz tone."""
+        self.calls += 1
+        for fragment, remaining in list(self.failures.items()):
+            if remaining > 0 and any(fragment in t for t in texts):
+                self.failures[fragment] = remaining - 1
+                raise RuntimeError(f"Synthesis failed for chunk containing {fragment!r}")
+
+        outputs = []
+        for text in texts:
+            frames = int(self.sample_rate * len(text) / self.chars_per_second)
+            outputs.append(array("h", (
+                int(3000 * math.sin(2 * math.pi * 220 * i / self.sample_rate))
+                for i in range(frames)
+            )))
+        return outputs
+
+
+class ChunkedTTSPipeline:
+    """
+    Sentence-chunked, batched, VRAM-bounded TTS synthesis.
+
+    Features:
+    - Sentence/paragraph-aligned chunks of at most max_chunk_chars
+    - Batches of engine.max_batch_size chunks
+    - Concurrent batches limited by the VRAM budget (and an optional cap,
+      e.g. the throttle controller's)
+    - Failed batches retried chunk by chunk, up to max_retries each
+    - Finished chunks kept in chunk_dir (named by content key) for resume
+    - Optional content-addressed cache shared across chapters and runs
+    - Crossfaded stitching, with a pause at paragraph ends
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        vram_budget_gb: float,
+        max_chunk_chars: int = 400,
+        max_retries: int = 2,
+        crossfade_ms: float = 25.0,
+        paragraph_pause_ms: float = 350.0,
+        cache: Optional[ArtifactCache] = None,
+    ) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            engine: TTS engine (see module docstring)
+            vram_budget_gb: VRAM available to this pipeline, model included
+            max_chunk_chars: Upper bound on chunk length
+            max_retries: Retries per chunk after its batch fails
+            crossfade_ms: Overlap between neighbouring chunks
+            paragraph_pause_ms: Silence inserted after each paragraph
+            cache: Artifact cache for synthesized chunks
+        """
+        self.engine = engine
+        self.vram_budget_gb = vram_budget_gb
+        self.max_chunk_chars = max_chunk_chars
+        self.max_retries = max_retries
+        self.crossfade_ms = crossfade_ms
+        self.paragraph_pause_ms = paragraph_pause_ms
+        self.cache = cache
+
+        self.batches_run = 0
+        self.chunks_synthesized = 0
+        self.chunks_resumed = 0
+        self.chunks_cached = 0
+        self.retries = 0
+
+    @property
+    def max_concurrent_batches(self) -> int:
+        """Batches that fit in the VRAM budget next to the model (at least 1)."""
+        spare = self.vram_budget_gb - self.engine.model_vram_gb
+        per_batch = self.engine.vram_per_batch_gb
+        if per_batch <= 0:
+            return 1
+        return max(1, int(spare // per_batch))
+
+    def _cache_key(self, chunk: TextChunk, voice_profile: str) -> str:
+        return tts_chunk_key(
+            chunk.text,
+            voice_profile,
+            str(getattr(self.engine, "version", type(self.engine).__name__)),
+            sample_rate=self.engine.sample_rate,
+        )
+
+    @staticmethod
+    def _chunk_path(chunk_dir: Path, key: str) -> Path:
+        return chunk_dir / f"{key}.wav"
+
+    def _resume(self, chunk_dir: Path, keys: Dict[int, str]) -> Dict[int, array]:
+        """Load finished chunks from chunk_dir and drop ones for stale text."""
+        audio = {}
+        for index, key in keys.items():
+            path = self._chunk_path(chunk_dir, key)
+            if path.exists():
+                audio[index] = read_wav(path)
+
+        current = {self._chunk_path(chunk_dir, key).name for key in keys.values()}
+        if chunk_dir.is_dir():
+            for path in chunk_dir.glob("*.wav"):
+                if path.name not in current:
+                    path.unlink(missing_ok=True)
+        return audio
+
+    async def _synthesize(self, texts: List[str], voice_profile: str) -> List[array]:
+        outputs = await asyncio.to_thread(self.engine.synthesize_batch, texts, voice_profile)
+        if len(outputs) != len(texts):
+            raise RuntimeError(f"Engine returned {len(outputs)} outputs for {len(texts)} chunks")
+        self.batches_run += 1
+        return outputs
+
+    async def _run_batch(self, batch: List[TextChunk], voice_profile: str) -> List[array]:
+        """Synthesize one batch, retrying its chunks individually on failure."""
+        try:
+            return await self._synthesize([c.text for c in batch], voice_profile)
+        except Exception as e:
+            logger.warning(
+                f"TTS batch of chunks {batch[0].index}-{batch[-1].index} failed ({e}); "
+                f"retrying chunks individually"
+            )
+
+        outputs = []
+        for chunk in batch:
+            for attempt in range(1, self.max_retries + 1):
+                self.retries += 1
+                try:
+                    outputs.extend(await self._synthesize([chunk.text], voice_profile))
+                    break
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        raise RuntimeError(
+                            f"TTS chunk {chunk.index} failed after {attempt} retries: {e}"
+                        ) from e
+                    logger.warning(f"TTS chunk {chunk.index} retry {attempt} failed: {e}")
+        return outputs
+
+    async def synthesize(
+        self,
+        text: str,
+        voice_profile: str = "default",
+        chunk_dir: Optional[Path] = None,
+        on_progress: Optional[ChunkProgress] = None,
+        max_concurrency: Optional[int] = None,
+        pace: Optional[BatchPacer] = None,
+    ) -> array:
+        """
+        Synthesize a chapter.
+
+        Args:
+            text: Chapter text
+            voice_profile: Voice passed to the engine
+            chunk_dir: Where finished chunks are cached (None: memory only)
+            on_progress: Called after every finished batch; may raise to
+                stop (e.g. TaskPreempted), finished chunks stay cached
+            max_concurrency: Further cap on concurrent batches
+            pace: Maps a batch's run time to seconds its slot stays idle
+                afterwards (duty-cycle throttling)
+
+        Returns:
+            Stitched 16-bit PCM at engine.sample_rate
+
+        Raises:
+            RuntimeError: If a chunk still fails after max_retries
+        """
+        chunks = split_text(text, self.max_chunk_chars)
+        keys = {chunk.index: self._cache_key(chunk, voice_profile) for chunk in chunks}
+        audio: Dict[int, array] = {}
+
+        if chunk_dir is not None:
+            audio = await asyncio.to_thread(self._resume, chunk_dir, keys)
+            self.chunks_resumed += len(audio)
+
+        if self.cache is not None:
+            for chunk in chunks:
+                if chunk.index in audio:
+                    continue
+                data = await asyncio.to_thread(self.cache.get, keys[chunk.index], ".wav")
+                if data is not None:
+                    audio[chunk.index] = decode_wav(data)
+                    self.chunks_cached += 1
+
+        pending = [c for c in chunks if c.index not in audio]
+        size = max(1, self.engine.max_batch_size)
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+
+        limit = self.max_concurrent_batches
+        if max_concurrency is not None:
+            limit = max(1, min(limit, max_concurrency))
+        semaphore = asyncio.Semaphore(limit)
+        # Threads keep writing after their task is cancelled; awaited on
+        # failure so the caller can clean up chunk_dir afterwards
+        writes: List[asyncio.Future] = []
+
+        async def save(path: Path, samples: array) -> None:
+            write = asyncio.ensure_future(
+                asyncio.to_thread(write_wav, path, samples, self.engine.sample_rate)
+            )
+            writes.append(write)
+            await asyncio.shield(write)
+
+        async def run(batch: List[TextChunk]) -> None:
+            async with semaphore:
+                started = time.monotonic()
+                outputs = await self._run_batch(batch, voice_profile)
+                idle = pace(time.monotonic() - started) if pace else 0.0
+                if idle > 0:
+                    await asyncio.sleep(idle)
+            for chunk, samples in zip(batch, outputs):
+                audio[chunk.index] = samples
+                if chunk_dir is not None:
+                    await save(self._chunk_path(chunk_dir, keys[chunk.index]), samples)
+                if self.cache is not None:
+                    await asyncio.to_thread(
+                        self.cache.put, keys[chunk.index],
+                        encode_wav(samples, self.engine.sample_rate), ".wav",
+                    )
+            self.chunks_synthesized += len(batch)
+            if on_progress:
+                on_progress(len(audio), len(chunks))
+
+        if batches:
+            logger.info(
+                f"TTS: {len(pending)}/{len(chunks)} chunks in {len(batches)} batches "
+                f"({limit} concurrent)"
+            )
+            tasks = [asyncio.create_task(run(batch)) for batch in batches]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # First failure (or preemption) stops the remaining batches
+                for t in tasks:
+                    t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await asyncio.gather(*writes, return_exceptions=True)
+                raise
+
+        rate = self.engine.sample_rate
+        pause = array("h", bytes(2 * int(rate * self.paragraph_pause_ms / 1000)))
+        segments: List[array] = []
+        for chunk in chunks:
+            segments.append(audio[chunk.index])
+            if chunk.paragraph_end and chunk is not chunks[-1] and pause:
+                segments.append(pause)
+        return crossfade_concat(segments, int(rate * self.crossfade_ms / 1000))
+
+    def stats(self) -> Dict[str, Any]:
+        """Pipeline counters."""
+        return {
+            "batches_run": self.batches_run,
+            "chunks_synthesized": self.chunks_synthesized,
+            "chunks_resumed": self.chunks_resumed,
+            "chunks_cached": self.chunks_cached,
+            "retries": self.retries,
+            "max_concurrent_batches": self.max_concurrent_batches,
+        }
@@ -0,0 +1,511 @@
+"""
+GPU Worker Pool
+
+A coordinator owns the durable task queue (GPUOrchestrator + TaskStore)
+and hands tasks to any number of workers over a small line-delimited
+JSON protocol on a TCP socket. Workers can be one process per local GPU,
+a CPU-only TTS fallback, or another machine on the LAN.
+
+Protocol (one JSON object per line, each request gets one reply):
+    register   {worker_id, task_types, vram_gb, device}  -> ok
+    lease      {worker_id}                               -> task | none
+    heartbeat  {worker_id, lease_id, progress}           -> ok | lease_lost
+    result     {worker_id, lease_id, success, error,
+                duration_seconds}                        -> ok | lease_lost
+
+A lease that is not renewed by a heartbeat within lease_seconds expires
+and its task goes back on the queue.
+
+The protocol has no authentication or encryption: anyone who can reach
+the port can lease tasks (reading their inputs) and report results. The
+coordinator therefore binds to 127.0.0.1 by default; only listen on a
+LAN address behind a firewall or an SSH/WireGuard tunnel you trust.
+
+With --device-index, the worker sets CUDA_VISIBLE_DEVICES before any
+model is loaded, so engines see only that GPU (as cuda:0). Telemetry
+still queries nvidia-smi by the physical index.
+
+Usage:
+    # Worker process for GPU 1, simulated execution
+    python -m src.automation.worker_pool --connect 127.0.0.1:7781 \\
+        --worker-id gpu1 --types tts image --vram-gb 16 --simulate
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import logging
+import argparse
+import ipaddress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Coroutine
+
+from .gpu_orchestrator import GPUOrchestrator, GPUTask, TaskPriority
+
+logger = logging.getLogger(__name__)
+
+# Executes a task on the worker; progress is reported via task.progress
+TaskExecutor = Callable[[GPUTask], Coroutine[Any, Any, None]]
+
+
+@dataclass
+class WorkerInfo:
+    """A registered worker (vram_gb 0 means a CPU-only worker)."""
+    worker_id: str
+    task_types: List[str]
+    vram_gb: float
+    device: str = ""
+    last_seen: float = field(default_factory=time.monotonic)
+    completed: int = 0
+    failed: int = 0
+
+    def can_run(self, task: GPUTask) -> bool:
+        """Whether this worker supports the task's type and VRAM needs."""
+        return (
+            task.task_type.value in self.task_types
+            and (self.vram_gb <= 0 or task.gpu_memory_required_gb <= self.vram_gb)
+        )
+
+
+@dataclass
+class Lease:
+    """A task currently held by a worker."""
+    lease_id: str
+    task: GPUTask
+    worker_id: str
+    expires_at: float
+
+
+class WorkerCoordinator:
+    """
+    Leases queued tasks to remote workers.
+
+    Features:
+    - Single owner of the durable queue; workers hold no queue state
+    - Capability matching (task types, VRAM)
+    - Heartbeat-renewed leases; expired leases re-queue their task
+    - Overnight-only tasks leased only inside the overnight window
+
+    The protocol is unauthenticated (see module docstring); keep the
+    default loopback host unless the network is trusted.
+    """
+
+    def __init__(
+        self,
+        orchestrator: GPUOrchestrator,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        lease_seconds: float = 60.0,
+    ) -> None:
+        """
+        Initialize coordinator.
+
+        Args:
+            orchestrator: Orchestrator whose queue is served
+            host: Listen address (loopback only by default; the
+                protocol is unauthenticated)
+            port: Listen port (0 picks a free port)
+            lease_seconds: Lease length without a heartbeat
+        """
+        self.orchestrator = orchestrator
+        self.host = host
+        self.port = port
+        self.lease_seconds = lease_seconds
+
+        self.workers: Dict[str, WorkerInfo] = {}
+        self.leases: Dict[str, Lease] = {}
+        self.expired_leases = 0
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Bound (host, port)."""
+        return self.host, self.port
+
+    async def start(self) -> None:
+        """Start listening and expiring leases."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._reaper = asyncio.create_task(self._reap_loop())
+        logger.info(f"Worker coordinator listening on {self.host}:{self.port}")
+        if not _is_loopback(self.host):
+            logger.warning(
+                f"Worker coordinator is reachable on {self.host}; the protocol is "
+                f"unauthenticated, so only expose it on a trusted network"
+            )
+
+    async def stop(self) -> None:
+        """Stop listening and re-queue any outstanding leases."""
+        if self._reaper:
+            self._reaper.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for lease in list(self.leases.values()):
+            self._release(lease, "coordinator stopped")
+
+    async def _reap_loop(self) -> None:
+        """Periodically expire leases."""
+        while True:
+            await asyncio.sleep(max(self.lease_seconds / 4, 0.05))
+            self.expire_leases()
+
+    def expire_leases(self) -> int:
+        """Re-queue tasks whose lease ran out. Returns number expired."""
+        now = time.monotonic()
+        expired = [lease for lease in self.leases.values() if lease.expires_at <= now]
+        for lease in expired:
+            self._release(lease, f"lease expired on {lease.worker_id}")
+            self.expired_leases += 1
+        return len(expired)
+
+    def _release(self, lease: Lease, reason: str) -> None:
+        """Drop a lease and put its task back on the queue."""
+        self.leases.pop(lease.lease_id, None)
+        self.orchestrator.requeue_task(lease.task, reason)
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve one worker connection."""
+        try:
+            while line := await reader.readline():
+                try:
+                    reply = self.dispatch(json.loads(line))
+                except Exception as e:
+                    reply = {"op": "error", "error": str(e)}
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one protocol message and build the reply."""
+        op = message.get("op")
+        worker_id = message.get("worker_id", "")
+
+        if op == "register":
+            self.workers[worker_id] = WorkerInfo(
+                worker_id=worker_id,
+                task_types=list(message.get("task_types", [])),
+                vram_gb=float(message.get("vram_gb", 0.0)),
+                device=message.get("device", ""),
+            )
+            logger.info(f"Registered worker {worker_id} ({message.get('device', '')})")
+            return {"op": "ok"}
+
+        worker = self.workers.get(worker_id)
+        if worker is None:
+            return {"op": "error", "error": f"Unknown worker {worker_id}"}
+        worker.last_seen = time.monotonic()
+
+        if op == "lease":
+            return self._lease(worker)
+        if op in ("heartbeat", "result"):
+            lease = self.leases.get(message.get("lease_id", ""))
+            if lease is None or lease.worker_id != worker_id:
+                return {"op": "lease_lost"}
+            if op == "heartbeat":
+                lease.expires_at = time.monotonic() + self.lease_seconds
+                lease.task.progress = float(message.get("progress", lease.task.progress))
+                return {"op": "ok"}
+            self._finish(worker, lease, message)
+            return {"op": "ok"}
+
+        return {"op": "error", "error": f"Unknown op {op}"}
+
+    def _lease(self, worker: WorkerInfo) -> Dict[str, Any]:
+        """Claim the next task this worker can run."""
+        self.expire_leases()
+        in_window = self.orchestrator.is_overnight_window()
+
+        def eligible(task: GPUTask) -> bool:
+            if task.priority == TaskPriority.OVERNIGHT and not in_window:
+                return False
+            return worker.can_run(task)
+
+        task = self.orchestrator.claim_task(eligible)
+        if task is None:
+            return {"op": "none", "retry_after": min(self.lease_seconds / 4, 5.0)}
+
+        lease = Lease(
+            lease_id=uuid.uuid4().hex,
+            task=task,
+            worker_id=worker.worker_id,
+            expires_at=time.monotonic() + self.lease_seconds,
+        )
+        self.leases[lease.lease_id] = lease
+        logger.info(f"Leased {task.task_id} to {worker.worker_id}")
+        return {
+            "op": "task",
+            "lease_id": lease.lease_id,
+            "lease_seconds": self.lease_seconds,
+            "task": task.to_dict(),
+        }
+
+    def _finish(self, worker: WorkerInfo, lease: Lease, message: Dict[str, Any]) -> None:
+        """Record a worker's result and close the lease."""
+        self.leases.pop(lease.lease_id, None)
+        success = bool(message.get("success"))
+        if success:
+            worker.completed += 1
+        else:
+            worker.failed += 1
+        self.orchestrator.finish_claimed_task(
+            lease.task,
+            success=success,
+            error=message.get("error"),
+            duration_seconds=message.get("duration_seconds"),
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Workers and outstanding leases."""
+        now = time.monotonic()
+        return {
+            "address": f"{self.host}:{self.port}",
+            "workers": [
+                {
+                    "worker_id": w.worker_id,
+                    "device": w.device,
+                    "task_types": w.task_types,
+                    "vram_gb": w.vram_gb,
+                    "seconds_since_seen": round(now - w.last_seen, 1),
+                    "completed": w.completed,
+                    "failed": w.failed,
+                }
+                for w in self.workers.values()
+            ],
+            "leases": [
+                {
+                    "task_id": lease.task.task_id,
+                    "worker_id": lease.worker_id,
+                    "progress": lease.task.progress,
+                    "expires_in_seconds": round(lease.expires_at - now, 1),
+                }
+                for lease in self.leases.values()
+            ],
+            "expired_leases": self.expired_leases,
+        }
+
+
+class TaskWorker:
+    """
+    Worker that leases tasks from a WorkerCoordinator and runs them.
+
+    Heartbeats are sent every lease_seconds / 3 while a task runs. If the
+    coordinator reports the lease lost (it expired and was re-queued),
+    the running task is cancelled.
+    """
+
+    def __init__(
+        self,
+        worker_id: str,
+        host: str,
+        port: int,
+        executor: TaskExecutor,
+        task_types: Optional[List[str]] = None,
+        vram_gb: float = 16.0,
+        device: str = "",
+    ) -> None:
+        """
+        Initialize worker.
+
+        Args:
+            worker_id: Unique worker name
+            host: Coordinator host
+            port: Coordinator port
+            executor: Coroutine function that runs one task
+            task_types: TaskType values this worker accepts (default: all)
+            vram_gb: VRAM available on this worker's device (0 for CPU-only)
+            device: Free-form device description
+        """
+        self.worker_id = worker_id
+        self.host = host
+        self.port = port
+        self.executor = executor
+        self.task_types = task_types or ["tts", "llm", "image", "audio", "video", "batch"]
+        self.vram_gb = vram_gb
+        self.device = device
+
+        self.completed = 0
+        self.failed = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._io_lock = asyncio.Lock()
+        self._running = False
+
+    async def _request(self, op: str, **fields: Any) -> Dict[str, Any]:
+        """Send one message and wait for its reply."""
+        message = {"op": op, "worker_id": self.worker_id, **fields}
+        if self._reader is None or self._writer is None:
+            raise ConnectionError("Not connected to the coordinator")
+        async with self._io_lock:
+            self._writer.write((json.dumps(message) + "\n").encode())
+            await self._writer.drain()
+            line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Coordinator closed the connection")
+        return json.loads(line)
+
+    async def run(self, max_tasks: Optional[int] = None, exit_when_idle: bool = False) -> None:
+        """
+        Lease and run tasks until stopped.
+
+        Args:
+            max_tasks: Stop after this many tasks
+            exit_when_idle: Stop the first time no task is available
+        """
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._running = True
+        try:
+            await self._request(
+                "register",
+                task_types=self.task_types,
+                vram_gb=self.vram_gb,
+                device=self.device,
+            )
+
+            done = 0
+            while self._running and (max_tasks is None or done < max_tasks):
+                reply = await self._request("lease")
+                if reply.get("op") != "task":
+                    if exit_when_idle:
+                        break
+                    await asyncio.sleep(reply.get("retry_after", 1.0))
+                    continue
+
+                await self._run_leased(reply)
+                done += 1
+        finally:
+            self._running = False
+            self._writer.close()
+
+    def stop(self) -> None:
+        """Stop after the current task."""
+        self._running = False
+
+    async def _run_leased(self, reply: Dict[str, Any]) -> None:
+        """Run one leased task with heartbeats and report the result."""
+        task = GPUTask.from_dict(reply["task"])
+        lease_id = reply["lease_id"]
+        interval = reply.get("lease_seconds", 60.0) / 3
+
+        started = time.monotonic()
+        execution = asyncio.create_task(self.executor(task))
+        lost = False
+
+        while not execution.done():
+            await asyncio.wait({execution}, timeout=interval)
+            if execution.done():
+                break
+            ack = await self._request("heartbeat", lease_id=lease_id, progress=task.progress)
+            if ack.get("op") == "lease_lost":
+                logger.warning(f"{self.worker_id} lost lease on {task.task_id}; cancelling")
+                execution.cancel()
+                lost = True
+
+        if lost:
+            return
+
+        error = None
+        try:
+            execution.result()
+        except Exception as e:
+            error = str(e)
+
+        if error:
+            self.failed += 1
+        else:
+            self.completed += 1
+        await self._request(
+            "result",
+            lease_id=lease_id,
+            success=error is None,
+            error=error,
+            duration_seconds=time.monotonic() - started,
+        )
+
+
+def _is_loopback(host: str) -> bool:
+    """Whether host only accepts local connections."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def pin_cuda_device(device_index: int) -> None:
+    """
+    Restrict this process to one GPU before any CUDA library loads.
+
+    Must run before engines (torch, diffusers) initialize CUDA; afterwards
+    the visible device list can no longer change.
+    """
+    # Match CUDA's numbering to nvidia-smi's, which --device-index uses
+    os.environ["CUDA_DEVICE_ORDER"] = "PCI_BUS_ID"
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(device_index)
+
+
+def simulated_executor(time_scale: float = 0.001) -> TaskExecutor:
+    """Executor that sleeps for a scaled fraction of the estimated duration."""
+    async def execute(task: GPUTask) -> None:
+        steps = 10
+        for step in range(steps):
+            await asyncio.sleep(task.estimated_duration_minutes * 60 * time_scale / steps)
+            task.progress = (step + 1) / steps
+    return execute
+
+
+def main() -> None:
+    """Run a worker process against a coordinator."""
+    parser = argparse.ArgumentParser(description="GPU task worker")
+    parser.add_argument("--connect", required=True, help="Coordinator host:port")
+    parser.add_argument("--worker-id", required=True)
+    parser.add_argument("--types", nargs="+", default=None, help="Task types to accept")
+    parser.add_argument("--vram-gb", type=float, default=16.0)
+    parser.add_argument("--device-index", type=int, default=None, help="Local GPU index")
+    parser.add_argument("--simulate", action="store_true", help="Sleep instead of running models")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    host, port = args.connect.rsplit(":", 1)
+
+    if args.simulate:
+        executor = simulated_executor()
+        device = "simulated"
+    else:
+        if args.device_index is not None:
+            pin_cuda_device(args.device_index)
+        from .gpu_telemetry import NvidiaSmiProvider
+        local = GPUOrchestrator(
+            data_dir=Path.cwd() / "gpu_tasks" / f"worker_{args.worker_id}",
+            telemetry_provider=NvidiaSmiProvider(device_index=args.device_index),
+        )
+        executor = local._execute
+        device = f"cuda:{args.device_index}" if args.device_index is not None else "cuda"
+
+    worker = TaskWorker(
+        worker_id=args.worker_id,
+        host=host,
+        port=int(port),
+        executor=executor,
+        task_types=args.types,
+        vram_gb=args.vram_gb,
+        device=device,
+    )
+    asyncio.run(worker.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Shared pytest fixtures."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the `src` package importable without installing the project
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.automation.gpu_orchestrator import GPUOrchestrator  # noqa: E402
+from src.automation.gpu_telemetry import FakeTelemetryProvider  # noqa: E402
+
+
+@pytest.fixture
+def make_orchestrator(tmp_path):
+    """Factory for orchestrators on a fake GPU sharing one data_dir."""
+    created = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("data_dir", tmp_path / "gpu_tasks")
+        kwargs.setdefault("telemetry_provider", FakeTelemetryProvider())
+        orchestrator = GPUOrchestrator(**kwargs)
+        created.append(orchestrator)
+        return orchestrator
+
+    yield factory
+    for orchestrator in created:
+        orchestrator.store.close()
@@ -0,0 +1,117 @@
+"""Tests for streaming revenue anomaly detection."""
+
+import logging
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.analytics.anomaly_detector import AnomalyDetector
+from src.analytics.revenue_tracker import Platform, RevenueTracker
+
+START = date(2026, 1, 1)
+SERIES = ("book", "maltese_falcon")
+
+
+def _history(days=30, spike_day=20):
+    """Steady daily revenue with one spike."""
+    rng = random.Random(0)
+    history = []
+    for i in range(days):
+        value = Decimal("500") if i == spike_day else Decimal(str(round(20 + rng.uniform(-3, 3), 2)))
+        history.append((SERIES, START + timedelta(days=i), value))
+    return history
+
+
+def _feed(detector, observations):
+    for series, day, value in observations:
+        detector.observe(series, day, value)
+
+
+def test_live_spike_is_flagged_and_logged(caplog):
+    detector = AnomalyDetector()
+
+    with caplog.at_level(logging.WARNING):
+        _feed(detector, _history())
+
+    assert [f.kind for f in detector.flags] == ["spike"]
+    assert "Revenue spike" in caplog.text
+
+
+def test_rebuild_keeps_flags_without_logging(caplog):
+    detector = AnomalyDetector()
+    history = _history()
+
+    with caplog.at_level(logging.WARNING):
+        detector.rebuild(reversed(history))  # Any order
+
+    assert [(f.kind, f.day) for f in detector.flags] == [("spike", START + timedelta(days=20))]
+    assert caplog.text == ""
+    assert detector.late_updates == 0
+
+
+def test_late_data_is_folded_in_not_dropped():
+    history = _history(spike_day=-1)
+    in_order = AnomalyDetector()
+    _feed(in_order, history)
+
+    late = AnomalyDetector()
+    _feed(late, history[:10] + history[11:])
+    # Until the late sale arrives, the empty day looks like a drop
+    assert [f.day for f in late.flags] == [START + timedelta(days=10)]
+    late.observe(*history[10])
+
+    assert late.late_updates == 1
+    stats, expected = late._series[SERIES].stats, in_order._series[SERIES].stats
+    assert stats.count == expected.count
+    assert stats.mean == pytest.approx(expected.mean)  # EWMA mean is corrected exactly
+    assert stats.var == pytest.approx(expected.var, rel=0.2)
+    assert stats.abs_dev == pytest.approx(expected.abs_dev, rel=0.2)
+    assert not late.flags
+
+
+def test_late_data_rescores_only_its_own_day():
+    other = ("book", "big_sleep")
+    detector = AnomalyDetector()
+    history = _history()
+    _feed(detector, history[:10] + history[11:])
+    _feed(detector, [(other, day, value) for _, day, value in history])
+    before = list(detector.flags)
+    assert len(before) == 3
+
+    detector.observe(*history[10])
+
+    assert [f for f in detector.flags if f.day != history[10][1]] == before[1:]
+    assert all(f.day != history[10][1] for f in detector.flags)
+
+
+def test_backfilled_refund_wave_is_flagged():
+    detector = AnomalyDetector()
+    _feed(detector, _history(spike_day=-1))
+
+    flag = detector.observe(SERIES, START + timedelta(days=25), Decimal("-400"))
+
+    assert flag is not None and flag.kind == "drop"
+    assert [f.day for f in detector.recent_flags()] == [START + timedelta(days=25)]
+
+
+def test_late_data_beyond_history_is_dropped():
+    detector = AnomalyDetector(max_history_days=10)
+    _feed(detector, _history(spike_day=-1))
+
+    assert detector.observe(SERIES, START, Decimal("5")) is None
+    assert detector.dropped_updates == 1
+
+
+def test_tracker_load_does_not_re_alert_history(tmp_path, caplog):
+    tracker = RevenueTracker(data_dir=tmp_path)
+    for _, day, value in _history():
+        tracker.add_sale(day, Platform.KOBO, "maltese_falcon", 1, value, Decimal("1"))
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        reloaded = RevenueTracker(data_dir=tmp_path)
+
+    assert "Revenue spike" not in caplog.text
+    assert [f.kind for f in reloaded.anomaly_detector.recent_flags()] == ["spike", "spike"]
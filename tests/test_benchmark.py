@@ -0,0 +1,34 @@
+"""Tests for the scheduler benchmark's report comparison."""
+
+import copy
+
+import pytest
+
+from src.automation.benchmark import compare_reports
+from src.automation.metrics import percentile
+
+
+def _report(**results):
+    base = {
+        "makespan_seconds": 1000.0,
+        "vram_utilization": 0.6,
+        "model_switches": 4,
+        "queue_wait_seconds": {"p95": 300.0},
+    }
+    return {"benchmark": "mixed", "policy": "residency", "results": {**base, **results}}
+
+
+def test_percentile_interpolates():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile([0.0, 10.0], 0.95) == pytest.approx(9.5)
+
+
+def test_lower_vram_utilization_is_a_regression():
+    baseline = [_report()]
+    current = [_report(vram_utilization=0.5)]
+
+    assert compare_reports(current, baseline) == [
+        "mixed/residency: vram_utilization 0.6 -> 0.5"
+    ]
+    assert compare_reports(copy.deepcopy(baseline), baseline) == []
@@ -0,0 +1,125 @@
+"""Tests for seed-sweep cover production with the fake image engine."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.automation.artifact_cache import ArtifactCache
+from src.automation.cover_pipeline import (
+    CoverArtPipeline,
+    CoverCandidate,
+    FakeImageEngine,
+    RasterImage,
+    decode_png,
+    dhash,
+    encode_png,
+    hamming,
+    resize_nearest,
+    score_image,
+)
+from src.automation.gpu_orchestrator import TaskStatus
+
+PROMPT = "Victorian engraving of a lighthouse at dusk"
+
+
+def _pipeline(engine=None, **kwargs):
+    kwargs.setdefault("candidate_size", 64)
+    kwargs.setdefault("final_size", (256, 256))
+    return CoverArtPipeline(engine or FakeImageEngine(), **kwargs)
+
+
+def test_png_round_trip():
+    image = FakeImageEngine()._render(seed=3, width=40, height=24)
+
+    decoded = decode_png(encode_png(image))
+
+    assert (decoded.width, decoded.height) == (40, 24)
+    assert decoded.pixels == image.pixels
+
+
+def test_resize_nearest_scales_both_axes():
+    image = RasterImage(2, 1, bytes([255, 0, 0, 0, 0, 255]))
+
+    resized = resize_nearest(image, 4, 3)
+
+    assert (resized.width, resized.height) == (4, 3)
+    assert resized.pixel(1, 2) == (255, 0, 0)
+    assert resized.pixel(2, 0) == (0, 0, 255)
+
+
+def test_dhash_is_stable_across_sizes_and_separates_compositions():
+    engine = FakeImageEngine(duplicate_rate=0)
+    small, large = engine._render(7, 64, 64), engine._render(7, 256, 256)
+    other = engine._render(8, 64, 64)
+
+    assert hamming(dhash(small), dhash(large)) <= 4
+    assert hamming(dhash(small), dhash(other)) > 10
+
+
+def test_flat_images_score_low():
+    flat = RasterImage(32, 32, bytes([128] * 32 * 32 * 3))
+    busy = FakeImageEngine(duplicate_rate=0)._render(11, 64, 64)
+
+    assert score_image(flat) < 0.3 < score_image(busy)
+
+
+def test_select_drops_duplicates_and_weak_candidates():
+    pipeline = _pipeline(hash_distance=2, min_score=0.3)
+    candidates = [
+        CoverCandidate(seed=1, score=0.9, phash=0b0000),
+        CoverCandidate(seed=2, score=0.8, phash=0b0001),  # Near-duplicate of seed 1
+        CoverCandidate(seed=3, score=0.7, phash=0b1111_0000),
+        CoverCandidate(seed=4, score=0.1, phash=0b1111_1111_0000),
+    ]
+
+    selected, duplicates, low = pipeline.select(candidates, keep=2)
+
+    assert [c.seed for c in selected] == [1, 3]
+    assert (duplicates, low) == (1, 1)
+
+
+def test_only_selected_candidates_are_upscaled(tmp_path):
+    engine = FakeImageEngine(max_batch_size=4, duplicate_rate=0.5)
+    pipeline = _pipeline(engine)
+
+    result = asyncio.run(pipeline.produce(PROMPT, "", tmp_path, candidates=12, keep=2))
+
+    assert engine.images_generated == 12
+    assert engine.upscales == len(result.covers) == 2
+    assert result.duplicates_dropped > 0
+    for path in result.covers:
+        cover = decode_png(path.read_bytes())
+        assert (cover.width, cover.height) == (256, 256)
+    assert len(list((tmp_path / "candidates").glob("*.png"))) == 12
+
+    sweep = 12 * engine.render_seconds(64, 64)
+    assert result.gpu_seconds == pytest.approx(sweep + 2 * engine.UPSCALE_SECONDS)
+
+
+def test_cached_rerun_spends_no_gpu_time(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    asyncio.run(_pipeline(cache=cache).produce(PROMPT, "", tmp_path / "a", candidates=8))
+
+    engine = FakeImageEngine()
+    pipeline = _pipeline(engine, cache=cache)
+    result = asyncio.run(pipeline.produce(PROMPT, "", tmp_path / "b", candidates=8))
+
+    assert result.gpu_seconds == 0
+    assert pipeline.candidates_cached == 8
+    assert pipeline.upscales_cached == len(result.covers)
+
+
+def test_cover_production_task_writes_manifest(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator(image_engine=FakeImageEngine())
+    [task] = orchestrator.add_cover_production(
+        "lighthouse", [PROMPT], tmp_path / "covers",
+        candidates=6, keep=1, dimensions=(128, 128), candidate_size=64,
+    )
+
+    asyncio.run(orchestrator.process_queue())
+
+    assert task.status == TaskStatus.COMPLETED
+    manifest = json.loads(task.output_path.read_text())
+    assert manifest["candidates"] == 6
+    assert len(manifest["covers"]) == 1
@@ -0,0 +1,96 @@
+"""Tests for the learned task duration model."""
+
+import asyncio
+
+import pytest
+
+from src.automation.duration_model import DurationModel
+from src.automation.gpu_orchestrator import TaskStatus, TaskType
+
+
+def _tts(chars, voice="narrator"):
+    return {"text": "x" * chars, "voice_profile": voice}
+
+
+def test_fit_separates_overhead_from_per_character_cost(tmp_path):
+    model = DurationModel(tmp_path / "durations.json", min_samples=3, decay=1.0)
+    for chars in (1000, 4000, 9000, 2000):
+        model.record("tts", _tts(chars), 10 + 0.02 * chars)
+
+    assert model.predict_seconds("tts", _tts(5000)) == pytest.approx(110.0)
+    fitted = model.to_dict()["tts/narrator"]
+    assert fitted["overhead_seconds"] == pytest.approx(10.0)
+    assert fitted["seconds_per_unit"] == pytest.approx(0.02)
+
+    # Persisted and reloaded
+    reloaded = DurationModel(tmp_path / "durations.json", min_samples=3)
+    assert reloaded.predict_seconds("tts", _tts(5000)) == pytest.approx(110.0)
+
+
+def test_decay_follows_a_change_in_throughput():
+    model = DurationModel(min_samples=3, decay=0.5)
+    for _ in range(10):
+        for chars in (1000, 3000):
+            model.record("tts", _tts(chars), 0.02 * chars, save=False)
+
+    # A slower engine: recent timings dominate after a few tasks
+    for _ in range(5):
+        for chars in (1000, 3000):
+            model.record("tts", _tts(chars), 0.04 * chars, save=False)
+
+    assert model.predict_seconds("tts", _tts(2000)) == pytest.approx(80.0, rel=0.05)
+
+    undecayed = DurationModel(min_samples=3, decay=1.0)
+    for rate in [0.02] * 10 + [0.04] * 5:
+        for chars in (1000, 3000):
+            undecayed.record("tts", _tts(chars), rate * chars, save=False)
+    assert undecayed.predict_seconds("tts", _tts(2000)) < 60.0
+
+
+def test_profile_falls_back_to_type_model_then_to_none():
+    model = DurationModel(min_samples=3, decay=1.0)
+    for chars in (1000, 2000, 3000):
+        model.record("tts", _tts(chars, voice="narrator"), 0.02 * chars, save=False)
+
+    # Unseen voice uses the type-wide model; unseen type has no prediction
+    assert model.predict_seconds("tts", _tts(2000, voice="villain")) == pytest.approx(40.0)
+    assert model.predict_seconds("llm", {"prompt": "hi"}) is None
+    assert model.predict_minutes("llm", {"prompt": "hi"}, default=7) == 7
+
+
+def test_orchestrator_falls_back_to_estimated_minutes(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    static = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS, _tts(3000), tmp_path / "a.wav", estimated_minutes=12,
+    )
+    assert static.estimated_duration_minutes == 12
+    assert orchestrator.predicted_minutes(static) == 12
+
+    for chars in (3000, 6000, 12000):
+        orchestrator.durations.record("tts", _tts(chars), 0.02 * chars, save=False)
+
+    learned = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS, _tts(6000), tmp_path / "b.wav", estimated_minutes=12,
+    )
+    assert learned.estimated_duration_minutes == 2
+    assert orchestrator.predicted_minutes(static) == pytest.approx(1.0)
+
+
+def test_failing_callback_does_not_fail_a_completed_task(make_orchestrator, tmp_path, caplog):
+    orchestrator = make_orchestrator()
+
+    async def instant(task):
+        task.progress = 1.0
+
+    def callback(task):
+        raise RuntimeError("notify failed")
+
+    orchestrator._execute = instant
+    task = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS, _tts(1000), tmp_path / "a.wav", callback=callback,
+    )
+
+    assert asyncio.run(orchestrator.run_task(task)) is True
+    assert task.status == TaskStatus.COMPLETED and task.error_message is None
+    assert orchestrator.durations.to_dict()["tts/narrator"]["samples"] == 1
+    assert "notify failed" in caplog.text
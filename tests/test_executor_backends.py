@@ -0,0 +1,126 @@
+"""Tests for the persistent subprocess executor backend."""
+
+import asyncio
+import os
+import signal
+import time
+import wave
+
+import pytest
+
+from src.automation.executor_backends import SubprocessBackend
+from src.automation.gpu_orchestrator import GPUTask, TaskPriority, TaskType
+
+HANDLER = "src.automation.executor_backends:placeholder_tts_handler"
+
+
+def _task(tmp_path, name, text="Hello there, reader."):
+    return GPUTask(
+        task_id=name,
+        task_type=TaskType.TTS_SYNTHESIS,
+        priority=TaskPriority.NORMAL,
+        input_data={"text": text},
+        output_path=tmp_path / f"{name}.wav",
+    )
+
+
+def _run_all(backend, tasks):
+    async def run():
+        try:
+            return [await backend.run(task) for task in tasks]
+        finally:
+            backend.close()
+
+    return asyncio.run(run())
+
+
+def test_shared_memory_payload_is_written_to_output_path(tmp_path):
+    backend = SubprocessBackend(HANDLER, name="tts")
+    task = _task(tmp_path, "ch1")
+
+    [result] = _run_all(backend, [task])
+
+    assert result["bytes_written"] == task.output_path.stat().st_size
+    assert "payload" not in result
+    assert task.progress == 1.0
+    with wave.open(str(task.output_path)) as wav:
+        assert wav.getframerate() == result["sample_rate"] == 24000
+        assert wav.getnframes() == int(24000 * result["duration_seconds"])
+
+
+def test_payload_returned_when_not_writing(tmp_path):
+    backend = SubprocessBackend(HANDLER, write_payload=False)
+    task = _task(tmp_path, "ch1")
+
+    [result] = _run_all(backend, [task])
+
+    assert result["payload"][:4] == b"RIFF"
+    assert not task.output_path.exists()
+
+
+def test_worker_is_reused_then_restarted_after_max_tasks(tmp_path):
+    backend = SubprocessBackend(HANDLER, max_tasks=2)
+    pids = []
+
+    async def run():
+        try:
+            for n in range(3):
+                await backend.run(_task(tmp_path, f"ch{n}"))
+                pids.append(backend.stats()["pid"])
+        finally:
+            backend.close()
+
+    asyncio.run(run())
+
+    # Recycled right after its second task; the third spawns a fresh worker
+    assert pids[0] is not None and pids[1] is None and pids[2] not in (None, pids[0])
+    assert backend.tasks_run == 3 and backend.restarts == 1
+
+
+def test_worker_is_restarted_when_rss_exceeds_limit(tmp_path):
+    backend = SubprocessBackend(HANDLER, max_rss_mb=1)
+
+    _run_all(backend, [_task(tmp_path, "ch1")])
+
+    assert backend.last_rss_bytes > 1024 * 1024
+    assert backend.restarts == 1
+    assert not backend.is_alive
+
+
+def test_killed_worker_is_respawned_on_next_task(tmp_path):
+    backend = SubprocessBackend(HANDLER)
+
+    async def run():
+        try:
+            await backend.run(_task(tmp_path, "ch1"))
+            os.kill(backend.stats()["pid"], signal.SIGKILL)
+            deadline = time.monotonic() + 5
+            while backend.is_alive and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            return await backend.run(_task(tmp_path, "ch2"))
+        finally:
+            backend.close()
+
+    result = asyncio.run(run())
+
+    assert result["bytes_written"] > 0
+    assert backend.restarts == 1 and backend.tasks_run == 2
+
+
+def test_handler_error_is_raised_and_worker_kept(tmp_path):
+    backend = SubprocessBackend(HANDLER)
+
+    async def run():
+        try:
+            with pytest.raises(RuntimeError, match="TypeError"):
+                await backend.run(_task(tmp_path, "bad", text=42))  # len() of an int
+            pid = backend.stats()["pid"]
+            await backend.run(_task(tmp_path, "ok"))
+            return pid, backend.stats()["pid"]
+        finally:
+            backend.close()
+
+    before, after = asyncio.run(run())
+
+    assert before is not None and before == after
+    assert backend.restarts == 0 and backend.tasks_run == 2
@@ -0,0 +1,61 @@
+"""Tests for the multi-format report export pipeline."""
+
+import shutil
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.analytics.analytics_dashboard import AnalyticsDashboard, DashboardConfig
+from src.analytics.export_pipeline import ExportPipeline, safe_filename
+from src.analytics.revenue_tracker import Platform, RevenueTracker
+
+TODAY = date.today()
+
+
+def _dashboard(tmp_path, book_ids):
+    tracker = RevenueTracker(data_dir=tmp_path / "data")
+    for n, book_id in enumerate(book_ids):
+        tracker.add_sale(TODAY - timedelta(days=n), Platform.KOBO, book_id, 2, Decimal("4.99"), Decimal("0.7"))
+    tracker.set_goal("monthly", "monthly", Decimal("100"))
+    config = DashboardConfig(output_dir=tmp_path / "out")
+    return AnalyticsDashboard(tracker, config)
+
+
+def test_safe_filename_keeps_plain_ids_and_contains_unsafe_ones():
+    assert safe_filename("maltese_falcon") == "maltese_falcon"
+    assert safe_filename("kobo") == "kobo"
+
+    for unsafe in ("../../etc/passwd", "978-0/14", "..", "Pride and Prejudice"):
+        name = safe_filename(unsafe)
+        assert "/" not in name and not name.startswith(".") and name
+
+    assert safe_filename("a/b") != safe_filename("a_b")
+
+
+def test_export_writes_every_format(tmp_path):
+    pipeline = ExportPipeline(_dashboard(tmp_path, ["maltese_falcon"]))
+
+    outputs = pipeline.export(start_date=TODAY - timedelta(days=30), output_name="report")
+
+    assert set(outputs) == {"markdown", "html", "csv", "json"}
+    assert "maltese_falcon" in outputs["markdown"].read_text(encoding="utf-8")
+    assert "Goal Progress" in outputs["markdown"].read_text(encoding="utf-8")
+
+
+def test_variants_use_safe_names_and_precomputed_reports(tmp_path):
+    book_ids = ["maltese_falcon", "../escape", "978/0141439518"]
+    pipeline = ExportPipeline(_dashboard(tmp_path, book_ids), max_workers=2)
+
+    # Workers render what the parent computed; nothing is read from disk
+    shutil.rmtree(tmp_path / "data")
+
+    results = pipeline.export_variants(
+        "book", start_date=TODAY - timedelta(days=30), formats=["markdown", "csv"], max_processes=2,
+    )
+
+    out_dir = (tmp_path / "out").resolve()
+    assert set(results) == set(book_ids)
+    for book_id, outputs in results.items():
+        for path in outputs.values():
+            assert path.resolve().parent == out_dir
+        assert book_id in outputs["csv"].read_text(encoding="utf-8")
+    assert not (tmp_path / "data").exists()
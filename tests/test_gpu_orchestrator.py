@@ -0,0 +1,110 @@
+"""Tests for GPUOrchestrator queue persistence and the dependency DAG."""
+
+from pathlib import Path
+
+from src.automation.executor_backends import SubprocessBackend
+from src.automation.gpu_orchestrator import TaskPriority, TaskStatus, TaskType
+
+
+def _add_chapter(orchestrator, out: Path):
+    """Queue a TTS task and the mastering task that depends on it."""
+    tts = orchestrator.add_task(TaskType.TTS_SYNTHESIS, {"text": "Chapter one."}, out / "ch1.wav")
+    master = orchestrator.add_task(
+        TaskType.AUDIO_MASTERING, {"input": str(out / "ch1.wav")}, out / "ch1_master.wav",
+        depends_on=[tts],
+    )
+    return tts, master
+
+
+def test_restart_restores_dependents_of_completed_tasks(make_orchestrator, tmp_path):
+    first = make_orchestrator()
+    tts, master = _add_chapter(first, tmp_path)
+    assert master.task_id in first._blocked
+
+    # Crash after the TTS task finished but before mastering ran
+    tts.status = TaskStatus.COMPLETED
+    first.store.upsert(tts.to_dict())
+
+    second = make_orchestrator()
+    assert master.task_id in second.task_queue
+    assert master.task_id not in second._blocked
+
+
+def test_restart_cancels_dependents_of_failed_tasks(make_orchestrator, tmp_path):
+    first = make_orchestrator()
+    tts, master = _add_chapter(first, tmp_path)
+
+    tts.status = TaskStatus.FAILED
+    first.store.upsert(tts.to_dict())
+
+    second = make_orchestrator()
+    assert master.task_id not in second.task_queue
+    assert second.store.statuses([master.task_id]) == {master.task_id: "cancelled"}
+
+
+def test_restart_keeps_dependents_of_unfinished_tasks_blocked(make_orchestrator, tmp_path):
+    first = make_orchestrator()
+    tts, master = _add_chapter(first, tmp_path)
+
+    second = make_orchestrator()
+    assert tts.task_id in second.task_queue
+    assert master.task_id in second._blocked
+
+
+def test_plan_check_in_can_run_task_has_no_side_effects(make_orchestrator, tmp_path):
+    # Window covering the whole day, so overnight tasks are always in it
+    orchestrator = make_orchestrator(overnight_start_hour=0, overnight_end_hour=0)
+    selected, deferred = (
+        orchestrator.add_task(TaskType.TTS_SYNTHESIS, {"n": n}, tmp_path / f"{n}.wav",
+                              priority=TaskPriority.OVERNIGHT)
+        for n in range(2)
+    )
+    plan = {selected.task_id, "finished-earlier"}
+    orchestrator._plan_selected = plan
+    orchestrator._plan_deferred = {deferred.task_id}
+
+    can_run, reason = orchestrator.can_run_task(deferred)
+
+    assert not can_run and reason == "Deferred by overnight plan"
+    assert orchestrator._plan_selected is plan
+    assert plan == {selected.task_id, "finished-earlier"}
+    assert orchestrator._plan_waiting() == [selected.task_id]
+
+
+def _running_low_tts(orchestrator, tmp_path):
+    """A LOW-priority TTS task occupying the only slot, plus a CRITICAL task waiting."""
+    low = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS, {"text": "Chapter."}, tmp_path / "low.wav",
+        priority=TaskPriority.LOW,
+    )
+    orchestrator.task_queue.remove(low)
+    orchestrator.running_tasks[low.task_id] = low
+    orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS, {"text": "Urgent."}, tmp_path / "urgent.wav",
+        priority=TaskPriority.CRITICAL,
+    )
+    return low
+
+
+def test_critical_task_preempts_in_process_tts(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    low = _running_low_tts(orchestrator, tmp_path)
+
+    with orchestrator._lock:
+        victim = orchestrator._maybe_preempt(orchestrator.telemetry.snapshot())
+
+    assert victim is low
+    assert orchestrator._preempt_requests == {low.task_id}
+
+
+def test_backend_run_tasks_are_never_preemption_victims(make_orchestrator, tmp_path):
+    backend = SubprocessBackend("src.automation.executor_backends:placeholder_tts_handler")
+    orchestrator = make_orchestrator(executor_backends={TaskType.TTS_SYNTHESIS: backend})
+    _running_low_tts(orchestrator, tmp_path)
+
+    with orchestrator._lock:
+        victim = orchestrator._maybe_preempt(orchestrator.telemetry.snapshot())
+
+    # No request is left pending that would block later preemptions
+    assert victim is None
+    assert not orchestrator._preempt_requests
@@ -0,0 +1,109 @@
+"""Scheduler tests on a simulated GPU (fake telemetry, sleeping tasks)."""
+
+import pytest
+
+from src.automation.gpu_orchestrator import TaskPriority, TaskStatus, TaskType
+from src.automation.gpu_simulator import SimulatedGPUOrchestrator
+
+
+@pytest.fixture
+def make_sim(tmp_path):
+    """Factory for simulated orchestrators with fast tasks."""
+    created = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("time_scale", 0.0001)
+        sim = SimulatedGPUOrchestrator(data_dir=tmp_path / f"sim{len(created)}", **kwargs)
+        created.append(sim)
+        return sim
+
+    yield factory
+    for sim in created:
+        sim.store.close()
+
+
+def _spec(tmp_path, task_type, name, **extra):
+    return {
+        "task_type": task_type,
+        "input_data": {"name": name},
+        "output_path": tmp_path / f"{name}.out",
+        "estimated_minutes": 1,
+        **extra,
+    }
+
+
+def test_packs_tasks_into_vram_without_overcommitting(make_sim, tmp_path):
+    sim = make_sim(vram_gb=16.0, max_concurrent_tasks=4)
+    sim.add_tasks(
+        [_spec(tmp_path, TaskType.TTS_SYNTHESIS, f"tts{i}") for i in range(4)]
+        + [_spec(tmp_path, TaskType.LLM_INFERENCE, f"llm{i}") for i in range(2)]
+        + [_spec(tmp_path, TaskType.IMAGE_GENERATION, "img")]
+    )
+
+    result = sim.run()
+
+    assert result.tasks_completed == 7
+    assert result.peak_reserved_vram_gb <= 16.0
+    assert result.peak_concurrency >= 2  # Two 6GB TTS tasks share the card
+
+
+def test_respects_concurrency_limit(make_sim, tmp_path):
+    sim = make_sim(vram_gb=16.0, max_concurrent_tasks=2)
+    sim.add_tasks([_spec(tmp_path, TaskType.AUDIO_MASTERING, f"m{i}") for i in range(6)])
+
+    result = sim.run()
+
+    assert result.tasks_completed == 6
+    assert result.peak_concurrency == 2
+
+
+def test_task_too_large_for_free_vram_waits(make_sim, tmp_path):
+    sim = make_sim(vram_gb=12.0, max_concurrent_tasks=4)
+    sim.add_tasks([
+        _spec(tmp_path, TaskType.IMAGE_GENERATION, "img0"),
+        _spec(tmp_path, TaskType.IMAGE_GENERATION, "img1"),
+    ])
+
+    result = sim.run()
+
+    assert result.tasks_completed == 2
+    assert result.peak_concurrency == 1
+    assert result.peak_reserved_vram_gb == 10.0
+
+
+def test_dependents_start_after_their_dependencies_finish(make_sim, tmp_path):
+    sim = make_sim(max_concurrent_tasks=4)
+    tts = sim._create_task(**_spec(tmp_path, TaskType.TTS_SYNTHESIS, "ch1"))
+    master = sim._create_task(
+        **_spec(tmp_path, TaskType.AUDIO_MASTERING, "ch1_master", depends_on=[tts]),
+    )
+    sim._enqueue([master, tts])  # Out of order on purpose
+
+    result = sim.run()
+
+    assert result.tasks_completed == 2
+    times = {(e.task_id, e.event): e.at for e in result.events}
+    assert times[(master.task_id, "start")] >= times[(tts.task_id, "finish")]
+
+
+def test_failed_dependency_cancels_dependents(make_sim, tmp_path):
+    sim = make_sim()
+    tts = sim.add_task(**_spec(tmp_path, TaskType.TTS_SYNTHESIS, "ch1"))
+    master = sim.add_task(**_spec(tmp_path, TaskType.AUDIO_MASTERING, "ch1_master", depends_on=[tts]))
+    sim.failures[tts.task_id] = "synthesis crashed"
+
+    sim.run()
+
+    assert tts.status == TaskStatus.FAILED
+    assert master.status == TaskStatus.CANCELLED
+    assert master.task_id not in [e.task_id for e in sim.events]
+
+
+def test_higher_priority_starts_first(make_sim, tmp_path):
+    sim = make_sim(max_concurrent_tasks=1)
+    low = sim.add_task(**_spec(tmp_path, TaskType.AUDIO_MASTERING, "low", priority=TaskPriority.LOW))
+    high = sim.add_task(**_spec(tmp_path, TaskType.AUDIO_MASTERING, "high", priority=TaskPriority.HIGH))
+
+    result = sim.run()
+
+    assert result.start_order == [high.task_id, low.task_id]
@@ -0,0 +1,127 @@
+"""Tests for continuous-batched LLM inference on the fake inference server."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.automation.gpu_orchestrator import TaskStatus, TaskType
+from src.automation.llm_batching import BatchedLLMScheduler, FakeInferenceServer, estimate_tokens
+
+
+def _scheduler(max_batch_size=4, **kwargs):
+    return BatchedLLMScheduler(FakeInferenceServer(max_batch_size=max_batch_size, time_scale=0), **kwargs)
+
+
+def test_results_come_back_in_prompt_order():
+    scheduler = _scheduler()
+
+    results, report = asyncio.run(scheduler.run_batch(["a", "b", "c"], max_tokens=[3, 1, 2]))
+
+    assert [r.completion_tokens for r in results] == [3, 1, 2]
+    assert report.requests == 3
+    assert report.completion_tokens == 6
+
+
+def test_finished_sequences_free_slots_between_decode_steps():
+    scheduler = _scheduler(max_batch_size=2)
+
+    asyncio.run(scheduler.run_batch(["short", "long", "late"], max_tokens=[1, 5, 5]))
+
+    # "late" takes the short prompt's slot after step 1 instead of waiting
+    # for "long" to finish (static batching would need 5 + 5 steps)
+    assert scheduler.server.decode_steps == 6
+    assert scheduler.stats()["mean_batch_occupancy"] > 1.5
+
+
+def test_batch_never_exceeds_server_slots():
+    scheduler = _scheduler(max_batch_size=3)
+    widths = []
+    decode_step = scheduler.server.decode_step
+
+    def spy(ids):
+        widths.append(len(ids))
+        return decode_step(ids)
+
+    scheduler.server.decode_step = spy
+    asyncio.run(scheduler.run_batch([f"p{i}" for i in range(10)], max_tokens=4))
+
+    assert max(widths) == 3
+    assert not scheduler.server.sequences  # Every slot released
+
+
+def test_shared_system_prompt_is_prefilled_once():
+    scheduler = _scheduler()
+    system = "You write companion material. " * 20
+
+    _, report = asyncio.run(scheduler.run_batch(["x", "y", "z", "w"], system_prompt=system, max_tokens=2))
+
+    assert len(scheduler.server.prefixes) == 1
+    assert scheduler.prefixes.misses == 1 and scheduler.prefixes.hits == 3
+    assert report.cached_prompt_tokens == 3 * estimate_tokens(system)
+
+
+def test_prefix_cache_evicts_least_recently_used():
+    scheduler = _scheduler(prefix_cache_size=1)
+
+    async def main():
+        await scheduler.run_batch(["x"], system_prompt="first", max_tokens=1)
+        await scheduler.run_batch(["y"], system_prompt="second", max_tokens=1)
+
+    asyncio.run(main())
+
+    assert list(scheduler.server.prefixes) == [scheduler.prefixes.key("second")]
+
+
+def test_cancelled_prompt_leaves_the_batch():
+    scheduler = _scheduler(max_batch_size=2)
+
+    async def main():
+        keep = scheduler.submit("keep", max_tokens=3)
+        dropped = scheduler.submit("drop", max_tokens=1000)
+        await asyncio.sleep(0)
+        dropped.cancel()
+        return await keep
+
+    result = asyncio.run(main())
+
+    assert result.completion_tokens == 3
+    assert scheduler.completion_tokens < 10
+    assert not scheduler.server.sequences
+
+
+def test_server_failure_fails_every_waiting_prompt():
+    scheduler = _scheduler(max_batch_size=1)
+
+    def broken(ids):
+        raise RuntimeError("server went away")
+
+    scheduler.server.decode_step = broken
+    with pytest.raises(RuntimeError, match="server went away"):
+        asyncio.run(scheduler.run_batch(["a", "b"], max_tokens=2))
+
+
+def test_llm_task_writes_sections_and_skips_finished_ones(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator(llm_server=FakeInferenceServer(time_scale=0))
+    output = tmp_path / "companion.json"
+    output.write_text(json.dumps({"sections": {"intro": "already written"}}))
+    task = orchestrator.add_task(
+        TaskType.LLM_INFERENCE,
+        {
+            "task_name": "companion",
+            "system_prompt": "Be brief.",
+            "prompts": ["Write an intro.", "Write a glossary."],
+            "prompt_names": ["intro", "glossary"],
+            "max_tokens": 4,
+        },
+        output,
+        estimated_minutes=1,
+    )
+
+    asyncio.run(orchestrator.process_queue())
+
+    assert task.status == TaskStatus.COMPLETED
+    written = json.loads(output.read_text())
+    assert written["sections"]["intro"] == "already written"
+    assert written["sections"]["glossary"]
+    assert written["report"]["requests"] == 1
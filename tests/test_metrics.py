@@ -0,0 +1,77 @@
+"""Tests for the orchestrator metrics registry and endpoint."""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.automation.metrics import MetricsRegistry, MetricsServer
+
+
+def test_counter_and_gauge_per_label_set():
+    registry = MetricsRegistry(prefix="t_")
+    finished = registry.counter("finished_total", "Finished tasks")
+    finished.inc(type="tts")
+    finished.inc(2, type="tts")
+    finished.inc(type="llm")
+
+    queue = registry.gauge("queue", "Queued tasks")
+    queue.set(5, state="pending")
+    queue.set(3, state="pending")
+    queue.inc(state="pending")
+
+    assert finished.value(type="tts") == 3 and finished.value(type="llm") == 1
+    assert finished.value(type="image") == 0
+    assert queue.value(state="pending") == 4
+    assert registry.counter("finished_total") is finished  # Created once, then reused
+    with pytest.raises(ValueError):
+        registry.gauge("finished_total")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry(prefix="t_")
+    latency = registry.histogram("latency_seconds", buckets=(1, 5, 10))
+    for value in (0.5, 1, 3, 7, 30):
+        latency.observe(value, type="tts")
+
+    text = registry.render_text()
+
+    assert 't_latency_seconds_bucket{type="tts",le="1"} 2' in text
+    assert 't_latency_seconds_bucket{type="tts",le="5"} 3' in text
+    assert 't_latency_seconds_bucket{type="tts",le="10"} 4' in text
+    assert 't_latency_seconds_bucket{type="tts",le="+Inf"} 5' in text
+    assert 't_latency_seconds_sum{type="tts"} 41.5' in text
+    assert 't_latency_seconds_count{type="tts"} 5' in text
+    assert latency.to_dict()['{type="tts"}'] == {"count": 5, "sum": 41.5, "mean": 8.3}
+
+
+def test_render_text_escapes_label_values():
+    registry = MetricsRegistry(prefix="t_")
+    registry.counter("errors_total", "Errors by message").inc(message='bad "quote"\\path\nnext')
+
+    text = registry.render_text()
+
+    assert "# HELP t_errors_total Errors by message" in text
+    assert "# TYPE t_errors_total counter" in text
+    assert 't_errors_total{message="bad \\"quote\\"\\\\path\\nnext"} 1' in text
+
+
+def test_server_serves_metrics_on_a_free_port():
+    registry = MetricsRegistry(prefix="t_")
+    registry.gauge("temperature_celsius").set(71.5)
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        assert server.port != 0
+        url = f"http://127.0.0.1:{server.port}"
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+
+        assert "t_temperature_celsius 71.5" in body
+        assert content_type.startswith("text/plain; version=0.0.4")
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            urllib.request.urlopen(f"{url}/other", timeout=5)
+        assert missing.value.code == 404
+    finally:
+        server.stop()
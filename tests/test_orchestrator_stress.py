@@ -0,0 +1,45 @@
+"""Concurrency stress test: many producer threads against a running orchestrator."""
+
+from src.automation.gpu_simulator import SimulatedGPUOrchestrator
+from src.automation.stress import run_stress
+
+
+def test_concurrent_producers_complete_every_task_exactly_once():
+    result = run_stress(producers=8, tasks_per_producer=15, readers=2, seed=1)
+
+    assert result.errors == []
+    assert result.submitted == 8 * 15
+    assert result.completed == result.submitted
+    assert result.duplicates == 0
+    assert result.lost == 0
+    assert result.ok
+
+
+def test_concurrent_producers_never_overcommit_vram():
+    result = run_stress(producers=8, tasks_per_producer=15, vram_gb=12.0, seed=2)
+
+    assert result.errors == []
+    assert result.completed == result.submitted
+    assert 0 < result.peak_reserved_vram_gb <= result.vram_gb
+
+
+def test_status_readers_run_alongside_producers():
+    result = run_stress(producers=8, tasks_per_producer=15, readers=6, seed=3)
+
+    assert result.errors == []
+    assert result.ok
+    assert result.max_status_latency_ms > 0
+
+
+def test_thread_exceptions_fail_the_run(monkeypatch):
+    def broken(self):
+        raise RuntimeError("status failed")
+
+    monkeypatch.setattr(SimulatedGPUOrchestrator, "get_queue_status", broken)
+    result = run_stress(producers=2, tasks_per_producer=5, readers=2, seed=4)
+
+    assert result.completed == result.submitted
+    assert len(result.errors) == 2
+    assert "status failed" in result.errors[0]
+    assert not result.ok
+    assert result.to_dict()["ok"] is False
@@ -0,0 +1,126 @@
+"""Tests for the overnight window knapsack planner."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.automation.overnight_planner import OvernightPlanner, PlanItem
+
+# An hour before a 23:00-06:00 window: 420 GPU minutes per lane tonight
+NOW = datetime(2026, 5, 1, 22, 0)
+TONIGHT = datetime(2026, 5, 1, 23, 0)
+TOMORROW = datetime(2026, 5, 2, 23, 0)
+
+
+def _item(item_id, minutes, value=None, **fields):
+    value = minutes if value is None else value
+    return PlanItem(item_id=item_id, minutes=minutes, value=value, **fields)
+
+
+def test_tonight_never_exceeds_window_capacity():
+    items = [_item(f"t{n}", 100) for n in range(5)]
+
+    plan = OvernightPlanner(lanes=1).plan(items, now=NOW)
+
+    assert plan.capacity_minutes == 420
+    assert plan.planned_minutes == 400
+    assert plan.utilization == pytest.approx(400 / 420)
+    assert [i.item_id for i in plan.tonight] == ["t0", "t1", "t2", "t3"]
+    assert all(i.finish <= datetime(2026, 5, 2, 6, 0) and not i.overrun for i in plan.tonight)
+    # The rest carries to the next night instead of overrunning
+    [deferred] = plan.deferred
+    assert deferred.item_id == "t4" and deferred.night == 1 and deferred.start == TOMORROW
+
+
+def test_selection_maximizes_value_not_queue_order():
+    items = [_item("long", 300, value=10), _item("a", 200, value=8), _item("b", 200, value=8)]
+
+    plan = OvernightPlanner(lanes=1).plan(items, now=NOW)
+
+    assert {i.item_id for i in plan.tonight} == {"a", "b"}
+    assert plan.finish_time("long") == TOMORROW + timedelta(minutes=300)
+
+
+def test_running_work_reduces_tonight_capacity():
+    plan = OvernightPlanner(lanes=2).plan([_item("a", 60)], now=NOW, busy_minutes=[120, 30])
+
+    # Lanes are busy until 00:00 and 22:30, so only one is free at 23:00
+    assert plan.capacity_minutes == 360 + 420
+    assert plan.finish_time("a") == TONIGHT + timedelta(minutes=60)
+
+
+def test_dependency_bundle_is_planned_together():
+    synth = _item("synth", 200, value=1)
+    master = _item("master", 200, value=1, depends_on=["synth"])
+    other = _item("other", 200, value=100)
+
+    plan = OvernightPlanner(lanes=1).plan([synth, master, other], now=NOW)
+
+    # synth alone would fit next to other, but not with its dependent
+    assert [i.item_id for i in plan.tonight] == ["other"]
+    assert synth.night == master.night == 1
+    assert master.start == synth.finish
+
+
+def test_dependency_waits_for_its_parent_across_lanes():
+    items = [
+        _item("master", 60, depends_on=["synth"]),
+        _item("synth", 120),
+        _item("cover", 30),
+    ]
+
+    plan = OvernightPlanner(lanes=2).plan(items, now=NOW)
+
+    assert len(plan.tonight) == 3
+    assert plan.finish_time("synth") == TONIGHT + timedelta(minutes=120)
+    master = next(i for i in plan.items if i.item_id == "master")
+    assert master.start == plan.finish_time("synth")
+
+
+def test_run_order_is_priority_then_deadline_then_queue_order():
+    items = [
+        _item("no_deadline", 30),
+        _item("late", 30, deadline=datetime(2026, 5, 3, 12, 0)),
+        _item("early", 30, deadline=datetime(2026, 5, 2, 4, 0)),
+        _item("urgent", 30, priority=1),
+    ]
+
+    plan = OvernightPlanner(lanes=1).plan(items, now=NOW)
+
+    assert [i.item_id for i in plan.items] == ["urgent", "early", "late", "no_deadline"]
+    assert plan.items[0].start == TONIGHT
+
+
+def test_deadline_before_next_window_wins_the_last_slot():
+    items = [
+        _item("whenever", 300, value=10),
+        _item("due", 300, value=10, deadline=datetime(2026, 5, 2, 12, 0)),
+    ]
+
+    plan = OvernightPlanner(lanes=1).plan(items, now=NOW)
+
+    assert [i.item_id for i in plan.tonight] == ["due"]
+    assert [i.item_id for i in plan.deferred] == ["whenever"]
+
+
+def test_group_finish_is_latest_item_or_none_when_unplanned():
+    def items():
+        return [
+            _item("falcon1", 100, group="falcon"),
+            _item("falcon2", 100, group="falcon"),
+            _item("sleep1", 100, group="sleep"),
+            _item("sleep2", 300, value=1, group="sleep"),
+        ]
+
+    two_nights = OvernightPlanner(lanes=1, max_nights=2).plan(items(), now=NOW)
+
+    assert two_nights.group_finish() == {
+        "falcon": TONIGHT + timedelta(minutes=200),
+        "sleep": TOMORROW + timedelta(minutes=300),
+    }
+
+    one_night = OvernightPlanner(lanes=1, max_nights=1).plan(items(), now=NOW)
+
+    assert [i.item_id for i in one_night.unplanned] == ["sleep2"]
+    assert one_night.group_finish() == {"falcon": TONIGHT + timedelta(minutes=200), "sleep": None}
+    assert one_night.to_dict()["group_finish"]["sleep"] is None
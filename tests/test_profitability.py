@@ -0,0 +1,83 @@
+"""Tests for per-title ROI and payback."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.analytics.profitability import ProfitabilityEngine
+from src.analytics.revenue_tracker import Platform, RevenueTracker
+
+PUBLISHED = date(2026, 1, 1)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = RevenueTracker(data_dir=tmp_path)
+    tracker.register_book("falcon", "The Maltese Falcon", "Hammett", Decimal("50"), PUBLISHED)
+    tracker.register_book("sleep", "The Big Sleep", "Chandler", Decimal("1000"), PUBLISHED)
+    tracker.register_book("free", "Public Domain Reader", "Various")
+    return tracker
+
+
+def _sell(tracker, book_id, day, units):
+    """Record units at $10 with a 50% royalty, i.e. $5 net each."""
+    tracker.add_sale(day, Platform.KOBO, book_id, units, Decimal("10"), Decimal("0.5"))
+
+
+def test_cumulative_net_and_payback(tracker):
+    _sell(tracker, "falcon", date(2026, 1, 5), 4)    # $20
+    _sell(tracker, "falcon", date(2026, 1, 11), 6)   # $50 cumulative: paid back
+    _sell(tracker, "falcon", date(2026, 2, 1), 2)    # $60
+
+    results = {r.book_id: r for r in ProfitabilityEngine(tracker).compute(as_of=date(2026, 3, 1))}
+    falcon = results["falcon"]
+
+    assert falcon.cumulative_net == Decimal("60")
+    assert falcon.first_sale == date(2026, 1, 5)
+    assert falcon.payback_date == date(2026, 1, 11)
+    assert falcon.days_to_breakeven == 10
+    assert falcon.roi_percent == Decimal("20.0")
+    assert falcon.status == "paid_back"
+
+
+def test_revenue_after_as_of_is_ignored(tracker):
+    _sell(tracker, "falcon", date(2026, 1, 5), 4)
+    _sell(tracker, "falcon", date(2026, 1, 11), 6)
+
+    falcon = next(
+        r for r in ProfitabilityEngine(tracker).compute(as_of=date(2026, 1, 10))
+        if r.book_id == "falcon"
+    )
+
+    assert falcon.cumulative_net == Decimal("20")
+    assert falcon.payback_date is None and falcon.days_to_breakeven is None
+
+
+def test_titles_that_never_break_even(tracker):
+    _sell(tracker, "sleep", date(2026, 1, 3), 10)   # $50 of $1000
+    _sell(tracker, "free", date(2026, 1, 3), 1)
+    _sell(tracker, "uncatalogued", date(2026, 1, 3), 1)
+
+    engine = ProfitabilityEngine(tracker)
+    results = {r.book_id: r for r in engine.compute(as_of=date(2026, 3, 1))}
+
+    sleep = results["sleep"]
+    assert sleep.status == "recovering"
+    assert sleep.payback_date is None and sleep.days_to_breakeven is None
+    assert sleep.roi_percent == Decimal("-95.0")
+
+    # Zero-cost and uncatalogued titles have no ROI and never "pay back"
+    for book_id in ("free", "uncatalogued"):
+        assert results[book_id].status == "no_cost"
+        assert results[book_id].roi_percent is None
+
+    # A catalog title without sales is still reported
+    assert results["falcon"].cumulative_net == Decimal("0")
+    assert results["falcon"].first_sale is None
+
+    summary = engine.portfolio_summary(list(results.values()))
+    assert summary["titles"] == 4
+    assert summary["paid_back"] == 0 and summary["recovering"] == 2
+    assert summary["avg_days_to_breakeven"] is None
+    assert [r.book_id for r in summary["worst"]][0] == "falcon"
@@ -0,0 +1,108 @@
+"""Tests for royalty statement reconciliation."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.analytics.reconciliation import StatementReconciler, load_payout_statement
+from src.analytics.revenue_tracker import Platform, RevenueTracker
+
+HEADER = "Book ID,Month,Territory,Units,Net Revenue\n"
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = RevenueTracker(data_dir=tmp_path / "data")
+    # $10 at 50% royalty: $5 net per unit
+    tracker.add_sale(date(2026, 3, 2), Platform.KOBO, "falcon", 2, Decimal("10"), Decimal("0.5"))
+    tracker.add_sale(date(2026, 3, 9), Platform.KOBO, "falcon", 1, Decimal("10"), Decimal("0.5"))
+    tracker.add_sale(date(2026, 3, 9), Platform.KOBO, "sleep", 4, Decimal("10"), Decimal("0.5"))
+    tracker.add_sale(date(2026, 3, 9), Platform.KOBO, "sleep", 1, Decimal("10"), Decimal("0.5"), territory="GB")
+    # Other month and platform: outside the statement's scope
+    tracker.add_sale(date(2026, 2, 9), Platform.KOBO, "falcon", 7, Decimal("10"), Decimal("0.5"))
+    tracker.add_sale(date(2026, 3, 9), Platform.GOOGLE_PLAY, "falcon", 7, Decimal("10"), Decimal("0.5"))
+    return tracker
+
+
+def _statement(tmp_path, rows):
+    path = tmp_path / "statement.csv"
+    path.write_text(HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+    return load_payout_statement(path, Platform.KOBO)
+
+
+def test_exact_match_aggregates_statement_rows(tmp_path, tracker):
+    lines = _statement(tmp_path, [
+        "falcon,2026-03-02,US,2,10.00",
+        "falcon,2026-03-09,US,1,5.00",
+        "sleep,2026-03,US,4,20.00",
+        "sleep,2026-03,GB,1,5.00",
+    ])
+
+    report = StatementReconciler(tracker).reconcile(lines)
+
+    assert len(lines) == 3
+    assert report.matched == 3
+    assert report.is_clean and not report.rounding
+
+
+def test_rounding_within_tolerance_is_not_a_mismatch(tmp_path, tracker):
+    lines = _statement(tmp_path, [
+        "falcon,2026-03,US,3,15.03",
+        "sleep,2026-03,US,4,19.98",
+        "sleep,2026-03,GB,1,5.00",
+    ])
+
+    report = StatementReconciler(tracker, tolerance=Decimal("0.05")).reconcile(lines)
+
+    assert report.matched == 1
+    assert {line.key[1] for line in report.rounding} == {"falcon", "sleep"}
+    assert report.rounding_drift == Decimal("0.01")
+    assert report.is_clean
+
+
+def test_amount_and_unit_mismatches(tmp_path, tracker):
+    lines = _statement(tmp_path, [
+        "falcon,2026-03,US,3,14.00",
+        "sleep,2026-03,US,5,20.00",
+        "sleep,2026-03,GB,1,5.00",
+    ])
+
+    report = StatementReconciler(tracker).reconcile(lines)
+
+    by_book = {line.key[1]: line for line in report.mismatches}
+    assert set(by_book) == {"falcon", "sleep"}
+    assert by_book["falcon"].difference == Decimal("-1.00")
+    assert by_book["sleep"].statement_units == 5 and by_book["sleep"].ledger_units == 4
+    assert not report.is_clean
+
+
+def test_rows_missing_on_either_side(tmp_path, tracker):
+    lines = _statement(tmp_path, [
+        "falcon,2026-03,US,3,15.00",
+        "sleep,2026-03,US,4,20.00",
+        "goodbye,2026-03,US,2,10.00",
+    ])
+
+    report = StatementReconciler(tracker).reconcile(lines)
+
+    assert [line.key for line in report.missing_in_ledger] == [("kobo", "goodbye", "2026-03", "US")]
+    assert report.missing_in_ledger[0].statement_net == Decimal("10.00")
+    # Only the statement's (platform, month) scope is checked
+    assert [line.key for line in report.missing_in_statement] == [("kobo", "sleep", "2026-03", "GB")]
+    assert report.missing_in_statement[0].ledger_net == Decimal("5.00")
+
+
+def test_bad_row_is_skipped_without_partial_totals(tmp_path, tracker):
+    lines = _statement(tmp_path, [
+        "falcon,2026-03,US,3,15.00",
+        "falcon,2026-03,US,2,not-a-number",
+        "sleep,2026-03,US,4,20.00",
+        "sleep,2026-03,GB,1,5.00",
+        "phantom,2026-03,US,1,oops",
+    ])
+
+    report = StatementReconciler(tracker).reconcile(lines)
+
+    assert {line.book_id for line in lines} == {"falcon", "sleep"}
+    assert report.matched == 3 and report.is_clean
@@ -0,0 +1,24 @@
+"""Tests for revenue concentration summaries."""
+
+from decimal import Decimal
+
+from src.analytics.revenue_tracker import summarize_concentration
+
+
+def test_concentration_top_k_pareto_and_tail():
+    values = {f"book{i}": Decimal(v) for i, v in enumerate([5, 50, 10, 20, 15, 0, -5, 5, 0, 0])}
+
+    summary = summarize_concentration("book", values, k=3)
+
+    assert summary.top == [("book1", Decimal(50)), ("book3", Decimal(20)), ("book4", Decimal(15))]
+    assert summary.total == Decimal(100)
+    assert summary.tail_count == 7 and summary.tail_total == Decimal(15)
+    # Top 20% of 10 entries is the top 2: (50 + 20) / 100
+    assert summary.pareto_share == Decimal("70.0")
+
+
+def test_concentration_of_empty_breakdown():
+    summary = summarize_concentration("platform", {}, k=10)
+
+    assert summary.top == [] and summary.tail_count == 0
+    assert summary.pareto_share == Decimal("0") and summary.hhi == Decimal("0")
@@ -0,0 +1,104 @@
+"""Tests for residency-aware task selection."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.automation.gpu_orchestrator import GPUOrchestrator, GPUTask, TaskPriority, TaskType
+from src.automation.scheduling_policy import ModelResidency, ResidencyAwarePolicy
+
+NOW = datetime(2026, 10, 19, 14, 0)
+
+
+def _task(name, task_type, priority=TaskPriority.NORMAL, minutes=10, deadline_minutes=None):
+    return GPUTask(
+        task_id=name,
+        task_type=task_type,
+        priority=priority,
+        input_data={},
+        output_path=Path(f"{name}.out"),
+        estimated_duration_minutes=minutes,
+        deadline=NOW + timedelta(minutes=deadline_minutes) if deadline_minutes else None,
+    )
+
+
+def _residency(*resident):
+    residency = ModelResidency(
+        capacity_gb=16.0,
+        vram_requirements=GPUOrchestrator.VRAM_REQUIREMENTS,
+        switch_costs=GPUOrchestrator.MODEL_SWITCH_SECONDS,
+    )
+    for task_type in resident:
+        residency.load(task_type)
+    return residency
+
+
+def test_groups_resident_model_work_within_a_band():
+    policy = ResidencyAwarePolicy()
+    tts = _task("tts", TaskType.TTS_SYNTHESIS)
+    llm = _task("llm", TaskType.LLM_INFERENCE)
+
+    assert policy.select([tts, llm], _residency(TaskType.LLM_INFERENCE), now=NOW) is llm
+    assert policy.switches_avoided == 1
+
+
+def test_near_deadline_beats_resident_model_grouping():
+    policy = ResidencyAwarePolicy()
+    # Due in 15 minutes, needs 10 plus a model load; the resident LLM task takes 10
+    tts = _task("tts", TaskType.TTS_SYNTHESIS, deadline_minutes=15)
+    llm = _task("llm", TaskType.LLM_INFERENCE)
+
+    assert policy.select([tts, llm], _residency(TaskType.LLM_INFERENCE), now=NOW) is tts
+    assert policy.deadline_overrides == 1
+
+
+def test_deadline_with_enough_slack_still_groups():
+    policy = ResidencyAwarePolicy()
+    tts = _task("tts", TaskType.TTS_SYNTHESIS, deadline_minutes=120)
+    llm = _task("llm", TaskType.LLM_INFERENCE)
+
+    assert policy.select([tts, llm], _residency(TaskType.LLM_INFERENCE), now=NOW) is llm
+
+
+def test_slack_uses_the_supplied_duration_prediction():
+    policy = ResidencyAwarePolicy()
+    tts = _task("tts", TaskType.TTS_SYNTHESIS, deadline_minutes=120)
+    llm = _task("llm", TaskType.LLM_INFERENCE)
+
+    # The learned model says both take much longer than their estimates
+    picked = policy.select(
+        [tts, llm], _residency(TaskType.LLM_INFERENCE), now=NOW,
+        predict_seconds=lambda t: 70 * 60,
+    )
+    assert picked is tts
+
+
+def test_band_mixing_tasks_with_and_without_deadlines():
+    policy = ResidencyAwarePolicy()
+    image = _task("image", TaskType.IMAGE_GENERATION)
+    resident = _task("llm", TaskType.LLM_INFERENCE, deadline_minutes=120)
+    residency = _residency(TaskType.LLM_INFERENCE)
+
+    # The resident task has a deadline; the task without one is never "urgent"
+    assert policy.select([image, resident], residency, now=NOW) is resident
+
+    urgent = _task("tts", TaskType.TTS_SYNTHESIS, deadline_minutes=15)
+    assert policy.select([image, resident, urgent], residency, now=NOW) is urgent
+    assert policy.deadline_overrides == 1
+
+
+def test_deadline_never_overrides_a_higher_band():
+    policy = ResidencyAwarePolicy(lookahead_bands=1)
+    high = _task("high", TaskType.LLM_INFERENCE, priority=TaskPriority.HIGH)
+    urgent_low = _task("low", TaskType.TTS_SYNTHESIS, deadline_minutes=5)
+
+    assert policy.select([high, urgent_low], _residency(), now=NOW) is high
+
+
+def test_lookahead_trades_switch_cost_against_band_weight():
+    tts = _task("tts", TaskType.TTS_SYNTHESIS)
+    image = _task("image", TaskType.IMAGE_GENERATION, priority=TaskPriority.LOW)
+    residency = _residency(TaskType.IMAGE_GENERATION)
+
+    # Saving a 30s XTTS load is worth more than one 20s band, not one 600s band
+    assert ResidencyAwarePolicy(lookahead_bands=1, band_weight_seconds=20).select([tts, image], residency, now=NOW) is image
+    assert ResidencyAwarePolicy(lookahead_bands=1).select([tts, image], residency, now=NOW) is tts
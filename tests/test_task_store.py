@@ -0,0 +1,104 @@
+"""Tests for the durable SQLite task store."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.automation.gpu_orchestrator import GPUTask, TaskPriority, TaskStatus, TaskType
+from src.automation.task_store import TaskStore
+
+
+def _task(task_id, status=TaskStatus.PENDING, **fields):
+    return GPUTask(
+        task_id=task_id,
+        task_type=TaskType.TTS_SYNTHESIS,
+        priority=TaskPriority.NORMAL,
+        input_data={"text": f"Text for {task_id}"},
+        output_path=Path(f"{task_id}.wav"),
+        status=status,
+        **fields,
+    )
+
+
+def test_round_trip_keeps_payload_order_and_status(tmp_path):
+    store = TaskStore(tmp_path / "tasks.db")
+    deadline = datetime(2026, 5, 1, 6, 0)
+    tasks = [
+        _task("a", deadline=deadline, checkpoint={"chunks_done": 3}),
+        _task("b", TaskStatus.COMPLETED),
+        _task("c", TaskStatus.QUEUED, depends_on=["a"]),
+    ]
+    store.upsert_many(t.to_dict() for t in tasks)
+    tasks[0].status = TaskStatus.PAUSED
+    store.upsert(tasks[0].to_dict())  # Update keeps the original insertion order
+    store.close()
+
+    reopened = TaskStore(tmp_path / "tasks.db")
+    unfinished = [GPUTask.from_dict(d) for d in reopened.load_unfinished()]
+
+    assert [t.task_id for t in unfinished] == ["a", "c"]
+    assert unfinished[0].status == TaskStatus.PAUSED
+    assert unfinished[0].deadline == deadline
+    assert unfinished[0].checkpoint == {"chunks_done": 3}
+    assert unfinished[0].input_data == {"text": "Text for a"}
+    assert unfinished[1].depends_on == ["a"]
+    assert [d["task_id"] for d in reopened.load_completed()] == ["b"]
+    assert reopened.statuses(["a", "b", "missing"]) == {"a": "paused", "b": "completed"}
+    assert reopened.count_by_status() == {"paused": 1, "completed": 1, "queued": 1}
+    reopened.close()
+
+
+def test_prune_keeps_unfinished_and_recent_finished_rows(tmp_path):
+    store = TaskStore(tmp_path / "tasks.db")
+    store.upsert_many(_task(f"done{i}", TaskStatus.COMPLETED).to_dict() for i in range(5))
+    store.upsert(_task("waiting").to_dict())
+
+    assert store.prune_finished(keep_last=2) == 3
+    assert store.statuses(["done3", "done4", "waiting", "done0"]) == {
+        "done3": "completed", "done4": "completed", "waiting": "pending",
+    }
+    store.close()
+
+
+def test_crash_requeues_running_tasks_from_their_checkpoint(make_orchestrator, tmp_path):
+    first = make_orchestrator()
+    task = first.add_task(TaskType.TTS_SYNTHESIS, {"text": "Chapter."}, tmp_path / "ch1.wav")
+
+    # The process dies mid-run, after a checkpoint was persisted
+    task.status = TaskStatus.RUNNING
+    task.started_at = datetime.now() - timedelta(minutes=5)
+    task.progress = 0.4
+    task.checkpoint = {"chunks_done": 2}
+    first.store.upsert(task.to_dict())
+
+    second = make_orchestrator()
+    restored = next(t for t in second.task_queue if t.task_id == task.task_id)
+
+    assert restored.status == TaskStatus.PENDING
+    assert restored.progress == 0.0 and restored.started_at is None
+    assert restored.checkpoint == {"chunks_done": 2}
+    assert second.store.statuses([task.task_id]) == {task.task_id: "pending"}
+
+
+def test_load_state_resolves_dependencies_from_stored_status(make_orchestrator, tmp_path):
+    first = make_orchestrator()
+    done = first.add_task(TaskType.TTS_SYNTHESIS, {"text": "One."}, tmp_path / "ch1.wav")
+    running = first.add_task(TaskType.TTS_SYNTHESIS, {"text": "Two."}, tmp_path / "ch2.wav")
+    after_done = first.add_task(
+        TaskType.AUDIO_MASTERING, {}, tmp_path / "ch1_master.wav", depends_on=[done],
+    )
+    after_running = first.add_task(
+        TaskType.AUDIO_MASTERING, {}, tmp_path / "ch2_master.wav", depends_on=[running],
+    )
+
+    done.status = TaskStatus.COMPLETED
+    running.status = TaskStatus.RUNNING
+    first.store.upsert_many([done.to_dict(), running.to_dict()])
+
+    second = make_orchestrator()
+
+    # Finished dependencies are only in the store; their dependents are ready
+    assert after_done.task_id in second.task_queue
+    assert done.task_id not in second.task_queue
+    # An interrupted dependency is re-queued and still blocks its dependent
+    assert running.task_id in second.task_queue
+    assert after_running.task_id in second._blocked
@@ -0,0 +1,83 @@
+"""Tests for the thermal/power throttle at low concurrency."""
+
+import asyncio
+
+import pytest
+
+from src.automation.gpu_orchestrator import TaskPriority, TaskType
+from src.automation.gpu_telemetry import GPUStats
+from src.automation.throttle_controller import ThrottleController, ThrottleState
+from src.automation.tts_pipeline import ChunkedTTSPipeline, FakeTTSEngine
+
+
+def _samples(temperature, power=200.0, count=6):
+    """Flat telemetry window one second apart."""
+    return [
+        GPUStats(temperature_celsius=temperature, power_draw_watts=power, sampled_at=float(i))
+        for i in range(count)
+    ]
+
+
+def test_single_task_is_throttled_by_duty_cycle():
+    controller = ThrottleController()
+    controller.state = ThrottleState(factor=0.5, reason="thermal")
+
+    # One task cannot be scaled down, so the factor becomes idle time
+    assert controller.concurrency_limit(1) == 1
+    assert controller.duty_cycle_delay(2.0, max_concurrent=1) == pytest.approx(2.0)
+
+    # With four slots the limit of two already halves the load
+    assert controller.concurrency_limit(4) == 2
+    assert controller.duty_cycle_delay(2.0, max_concurrent=4) == 0.0
+
+
+def test_duty_cycle_delay_is_zero_unthrottled_and_capped():
+    controller = ThrottleController(max_idle_seconds=5.0)
+    assert controller.duty_cycle_delay(10.0, max_concurrent=1) == 0.0
+
+    controller.state = ThrottleState(factor=0.25, reason="power")
+    assert controller.duty_cycle_delay(1.0, max_concurrent=1) == pytest.approx(3.0)
+    assert controller.duty_cycle_delay(10.0, max_concurrent=1) == 5.0
+
+
+def test_deep_throttle_pauses_dispatch():
+    controller = ThrottleController(target_temp_celsius=78.0, max_temp_celsius=87.0)
+
+    controller.update(_samples(85.0))  # Below the hard limit, factor at min_factor
+    assert not controller.state.critical
+    assert controller.paused
+    assert controller.concurrency_limit(1) == 0
+
+    controller.recovery_rate = 1.0
+    controller.update(_samples(70.0))
+    assert not controller.paused
+    assert controller.concurrency_limit(1) == 1
+
+
+def test_paused_orchestrator_holds_tasks(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    task = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS, {"text": "Hello."}, tmp_path / "ch1.wav",
+        priority=TaskPriority.HIGH,
+    )
+    stats = orchestrator.telemetry.snapshot()  # Sampling updates the throttle
+    orchestrator.throttle.state = ThrottleState(factor=0.3, reason="thermal")
+
+    can_run, reason = orchestrator.can_run_task(task, stats)
+    assert not can_run
+    assert "paused" in reason
+
+
+def test_pipeline_idles_between_batches_when_paced():
+    pipeline = ChunkedTTSPipeline(
+        FakeTTSEngine(max_batch_size=1), vram_budget_gb=3.0, max_chunk_chars=30,
+    )
+    busy = []
+
+    def pace(seconds):
+        busy.append(seconds)
+        return 0.01
+
+    text = "The first sentence here. The second sentence here. The third sentence here."
+    asyncio.run(pipeline.synthesize(text, pace=pace))
+    assert len(busy) == pipeline.batches_run == 3
@@ -0,0 +1,196 @@
+"""Tests for the chunked TTS pipeline with the fake (mock) TTS engine."""
+
+import asyncio
+from array import array
+
+import pytest
+
+from src.automation.artifact_cache import ArtifactCache
+from src.automation.gpu_orchestrator import TaskStatus, TaskType
+from src.automation.tts_pipeline import (
+    ChunkedTTSPipeline,
+    FakeTTSEngine,
+    crossfade_concat,
+    read_wav,
+    split_text,
+)
+
+CHAPTER = (
+    "It was the best of times. It was the worst of times. "
+    "It was the age of wisdom. It was the age of foolishness.\n\n"
+    "It was the epoch of belief. It was the epoch of incredulity."
+)
+
+
+def _pipeline(engine=None, **kwargs):
+    kwargs.setdefault("max_chunk_chars", 30)
+    kwargs.setdefault("crossfade_ms", 0)
+    return ChunkedTTSPipeline(engine or FakeTTSEngine(max_batch_size=2), vram_budget_gb=6.0, **kwargs)
+
+
+def test_split_text_respects_sentences_paragraphs_and_length():
+    chunks = split_text(CHAPTER, max_chars=60)
+
+    assert all(len(c.text) <= 60 for c in chunks)
+    assert [c.index for c in chunks] == list(range(len(chunks)))
+    assert all(c.text.endswith(".") for c in chunks)
+    assert sum(c.paragraph_end for c in chunks) == 2
+    assert " ".join(c.text for c in chunks) == " ".join(CHAPTER.split())
+
+
+def test_split_text_breaks_overlong_sentences_on_words():
+    chunks = split_text("word " * 50, max_chars=24)
+
+    assert all(len(c.text) <= 24 for c in chunks)
+    assert " ".join(c.text for c in chunks).split() == ["word"] * 50
+
+
+def test_crossfade_overlaps_neighbours():
+    out = crossfade_concat([array("h", [1000] * 10), array("h", [-1000] * 10)], fade_samples=4)
+
+    assert len(out) == 16
+    assert out[0] == 1000 and out[-1] == -1000
+
+
+def test_chunks_run_in_engine_sized_batches():
+    engine = FakeTTSEngine(max_batch_size=3)
+    pipeline = _pipeline(engine)
+
+    asyncio.run(pipeline.synthesize(CHAPTER))
+
+    chunks = len(split_text(CHAPTER, 30))
+    assert pipeline.batches_run == engine.calls == -(-chunks // 3)
+    assert pipeline.chunks_synthesized == chunks
+
+
+def test_concurrent_batches_bounded_by_vram_budget():
+    engine = FakeTTSEngine(model_vram_gb=2.0, vram_per_batch_gb=1.5)
+
+    assert ChunkedTTSPipeline(engine, vram_budget_gb=6.0).max_concurrent_batches == 2
+    assert ChunkedTTSPipeline(engine, vram_budget_gb=2.5).max_concurrent_batches == 1
+
+
+def test_failed_batch_is_retried_chunk_by_chunk():
+    engine = FakeTTSEngine(max_batch_size=4)
+    engine.fail("wisdom", times=1)
+    pipeline = _pipeline(engine)
+
+    audio = asyncio.run(pipeline.synthesize(CHAPTER))
+
+    assert audio == asyncio.run(_pipeline().synthesize(CHAPTER))
+    assert pipeline.retries == 4  # One retry per chunk of the failed batch
+
+
+def test_chunk_that_keeps_failing_raises():
+    engine = FakeTTSEngine()
+    engine.fail("wisdom", times=10)
+
+    with pytest.raises(RuntimeError, match="failed after 2 retries"):
+        asyncio.run(_pipeline(engine).synthesize(CHAPTER))
+
+
+def test_artifact_cache_reuses_chunks_across_runs(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    asyncio.run(_pipeline(cache=cache).synthesize(CHAPTER))
+
+    engine = FakeTTSEngine(max_batch_size=2)
+    pipeline = _pipeline(engine, cache=cache)
+    asyncio.run(pipeline.synthesize(CHAPTER.replace("worst", "dullest")))
+
+    assert engine.calls == 1
+    assert pipeline.chunks_cached == len(split_text(CHAPTER, 30)) - 1
+
+
+def test_interrupted_chapter_resumes_finished_chunks(tmp_path):
+    chunk_dir = tmp_path / "ch1.chunks"
+
+    class Interrupted(Exception):
+        pass
+
+    def interrupt(done, total):
+        raise Interrupted
+
+    with pytest.raises(Interrupted):
+        asyncio.run(_pipeline().synthesize(
+            CHAPTER, chunk_dir=chunk_dir, on_progress=interrupt, max_concurrency=1,
+        ))
+    finished = len(list(chunk_dir.glob("*.wav")))
+
+    pipeline = _pipeline()
+    asyncio.run(pipeline.synthesize(CHAPTER, chunk_dir=chunk_dir))
+    assert 0 < finished == pipeline.chunks_resumed
+
+
+def test_resume_rerenders_chunks_whose_text_changed(tmp_path):
+    chunk_dir = tmp_path / "ch1.chunks"
+    first = _pipeline()
+    asyncio.run(first.synthesize(CHAPTER, chunk_dir=chunk_dir))
+
+    # The chapter is corrected and re-queued to the same output path
+    edited = CHAPTER.replace("best of times", "finest of all times")
+    engine = FakeTTSEngine(max_batch_size=2)
+    resumed = asyncio.run(_pipeline(engine).synthesize(edited, chunk_dir=chunk_dir))
+    fresh = asyncio.run(_pipeline().synthesize(edited))
+
+    assert resumed == fresh
+    assert engine.calls == 1  # Only the edited chunk
+
+
+def test_resume_drops_chunk_files_for_stale_text(tmp_path):
+    chunk_dir = tmp_path / "ch1.chunks"
+    asyncio.run(_pipeline().synthesize(CHAPTER, chunk_dir=chunk_dir))
+    before = {p.name for p in chunk_dir.glob("*.wav")}
+
+    asyncio.run(_pipeline().synthesize(CHAPTER.replace("wisdom", "reason"), chunk_dir=chunk_dir))
+    after = {p.name for p in chunk_dir.glob("*.wav")}
+
+    assert len(after) == len(before)
+    assert len(before - after) == 1
+
+
+def test_changing_voice_does_not_resume_other_voice(tmp_path):
+    chunk_dir = tmp_path / "ch1.chunks"
+    asyncio.run(_pipeline().synthesize(CHAPTER, voice_profile="narrator", chunk_dir=chunk_dir))
+
+    pipeline = _pipeline()
+    asyncio.run(pipeline.synthesize(CHAPTER, voice_profile="villain", chunk_dir=chunk_dir))
+
+    assert pipeline.chunks_resumed == 0
+
+
+def test_failed_chapter_removes_chunk_dir(make_orchestrator, tmp_path):
+    engine = FakeTTSEngine(max_batch_size=2)
+    engine.fail("incredulity", times=10)
+    orchestrator = make_orchestrator(tts_engine=engine)
+    # One batch at a time, so the chunks before the failing one are written
+    orchestrator.tts_pipeline.max_chunk_chars = 30
+    orchestrator.tts_pipeline.vram_budget_gb = engine.model_vram_gb + engine.vram_per_batch_gb
+    output = tmp_path / "out" / "ch1.wav"
+    task = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS,
+        {"book_id": "tale", "chapter_title": "One", "text": CHAPTER},
+        output,
+        estimated_minutes=1,
+    )
+
+    asyncio.run(orchestrator.process_queue())
+
+    assert task.status == TaskStatus.FAILED
+    assert not output.with_suffix(".chunks").exists()
+
+
+def test_chapter_task_writes_stitched_audio(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator(tts_engine=FakeTTSEngine(max_batch_size=2))
+    output = tmp_path / "out" / "ch1.wav"
+    task = orchestrator.add_task(
+        TaskType.TTS_SYNTHESIS,
+        {"book_id": "tale", "chapter_title": "One", "text": CHAPTER},
+        output,
+        estimated_minutes=1,
+    )
+
+    asyncio.run(orchestrator.process_queue())
+
+    assert task.status == TaskStatus.COMPLETED
+    assert len(read_wav(output)) > 0
+    assert not output.with_suffix(".chunks").exists()
@@ -0,0 +1,141 @@
+"""Tests for the lease-based worker pool with fake (simulated) workers."""
+
+import asyncio
+import time
+
+from src.automation.gpu_orchestrator import TaskStatus, TaskType
+from src.automation.worker_pool import (
+    TaskWorker,
+    WorkerCoordinator,
+    _is_loopback,
+    simulated_executor,
+)
+
+
+def _queue(orchestrator, tmp_path, task_type, count, **extra):
+    return [
+        orchestrator.add_task(
+            task_type, {"n": n}, tmp_path / f"{task_type.value}{n}.out",
+            estimated_minutes=1, **extra,
+        )
+        for n in range(count)
+    ]
+
+
+def _serve(coordinator, workers):
+    """Run the coordinator until every worker has drained the queue."""
+    async def main():
+        await coordinator.start()
+        try:
+            for worker in workers:
+                worker.port = coordinator.port
+            await asyncio.gather(*(w.run(exit_when_idle=True) for w in workers))
+        finally:
+            await coordinator.stop()
+    asyncio.run(main())
+
+
+def _worker(worker_id, **kwargs):
+    return TaskWorker(
+        worker_id=worker_id, host="127.0.0.1", port=0,
+        executor=simulated_executor(time_scale=0.0001), **kwargs,
+    )
+
+
+def test_workers_drain_queue(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    tasks = _queue(orchestrator, tmp_path, TaskType.TTS_SYNTHESIS, 6)
+    coordinator = WorkerCoordinator(orchestrator)
+    workers = [_worker("gpu0"), _worker("gpu1")]
+
+    _serve(coordinator, workers)
+
+    assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+    assert sum(w.completed for w in workers) == 6
+    assert not coordinator.leases
+    assert len(orchestrator.task_queue) == 0
+
+
+def test_workers_only_lease_supported_tasks(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    tts = _queue(orchestrator, tmp_path, TaskType.TTS_SYNTHESIS, 2)
+    images = _queue(orchestrator, tmp_path, TaskType.IMAGE_GENERATION, 2)
+    coordinator = WorkerCoordinator(orchestrator)
+    cpu_worker = _worker("cpu", task_types=["tts", "image"], vram_gb=0)
+    small_gpu = _worker("small", task_types=["image"], vram_gb=8)
+
+    _serve(coordinator, [small_gpu, cpu_worker])
+
+    assert small_gpu.completed == 0  # SDXL needs 10GB
+    assert all(t.status == TaskStatus.COMPLETED for t in tts + images)
+
+
+def test_expired_lease_requeues_task(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    [task] = _queue(orchestrator, tmp_path, TaskType.LLM_INFERENCE, 1)
+    coordinator = WorkerCoordinator(orchestrator, lease_seconds=30)
+
+    coordinator.dispatch({"op": "register", "worker_id": "w", "task_types": ["llm"], "vram_gb": 16})
+    reply = coordinator.dispatch({"op": "lease", "worker_id": "w"})
+    assert reply["op"] == "task"
+    assert task.task_id not in orchestrator.task_queue
+
+    coordinator.leases[reply["lease_id"]].expires_at = time.monotonic() - 1
+    assert coordinator.expire_leases() == 1
+    assert task.task_id in orchestrator.task_queue
+    assert task.status == TaskStatus.PENDING
+
+    # The stale worker learns it lost the lease and its result is ignored
+    late = {"worker_id": "w", "lease_id": reply["lease_id"]}
+    assert coordinator.dispatch({"op": "heartbeat", **late})["op"] == "lease_lost"
+    assert coordinator.dispatch({"op": "result", "success": True, **late})["op"] == "lease_lost"
+    assert task.status == TaskStatus.PENDING
+
+
+def test_worker_failure_is_recorded(make_orchestrator, tmp_path):
+    orchestrator = make_orchestrator()
+    [task] = _queue(orchestrator, tmp_path, TaskType.TTS_SYNTHESIS, 1)
+    coordinator = WorkerCoordinator(orchestrator)
+
+    async def crash(task):
+        raise RuntimeError("CUDA out of memory")
+
+    worker = TaskWorker("gpu0", "127.0.0.1", 0, executor=crash)
+    _serve(coordinator, [worker])
+
+    assert worker.failed == 1
+    assert task.status == TaskStatus.FAILED
+    assert task.error_message == "CUDA out of memory"
+
+
+def test_device_index_pins_cuda_before_engines_load(monkeypatch):
+    from src.automation import worker_pool
+
+    monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+    monkeypatch.delenv("CUDA_DEVICE_ORDER", raising=False)
+    seen = {}
+
+    class Orchestrator:
+        def __init__(self, **kwargs):
+            seen["visible"] = worker_pool.os.environ.get("CUDA_VISIBLE_DEVICES")
+            seen["telemetry_index"] = kwargs["telemetry_provider"].device_index
+            raise SystemExit(0)
+
+    monkeypatch.setattr(worker_pool, "GPUOrchestrator", Orchestrator)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["worker_pool", "--connect", "127.0.0.1:1", "--worker-id", "gpu1", "--device-index", "1"],
+    )
+    try:
+        worker_pool.main()
+    except SystemExit:
+        pass
+
+    assert seen == {"visible": "1", "telemetry_index": 1}
+
+
+def test_coordinator_binds_loopback_by_default(make_orchestrator):
+    coordinator = WorkerCoordinator(make_orchestrator())
+    assert coordinator.host == "127.0.0.1"
+    assert _is_loopback("127.0.0.1") and _is_loopback("::1")
+    assert not _is_loopback("0.0.0.0")